@@ -0,0 +1,90 @@
+import json
+import argparse
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+def load_cells(results_path: str, size: int, metric: str) -> dict:
+    """Сырые замеры ячеек заданного размера: {случай: {алгоритм: массив}}."""
+    cells: dict = {}
+    with open(results_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get("size") != size or "samples_file" not in record:
+                continue
+            try:
+                with np.load(record["samples_file"]) as data:
+                    samples = data[metric]
+            except (OSError, KeyError):
+                continue
+            cells.setdefault(record["case"], {})[
+                record["algorithm"]
+            ] = samples
+    return cells
+
+
+def _ecdf(samples: np.ndarray) -> tuple:
+    x = np.sort(samples)
+    y = np.arange(1, len(x) + 1) / len(x)
+    return x, y
+
+
+def plot_distributions(
+    results_path: str = "results/results.jsonl",
+    size: int = 2**16,
+    metric: str = "time"
+) -> None:
+    cells = load_cells(results_path, size, metric)
+    if not cells:
+        print(f"Нет сырых замеров для размера {size}")
+        return
+
+    cases = [c for c in ["best", "worst", "random"] if c in cells]
+    unit = "сек" if metric == "time" else "байты"
+    plt.figure(figsize=(6 * len(cases), 10))
+
+    for idx, case in enumerate(cases):
+        algorithms = sorted(cells[case])
+        data = [cells[case][algo] for algo in algorithms]
+
+        plt.subplot(2, len(cases), idx + 1)
+        plt.violinplot(data, showmedians=True)
+        plt.xticks(
+            range(1, len(algorithms) + 1), algorithms,
+            rotation=30, fontsize=8
+        )
+        plt.yscale("log")
+        plt.ylabel(f"{metric} ({unit}, log)")
+        plt.title(f"{case.capitalize()} случай, размер {size}")
+        plt.grid(True, which="both", ls=":")
+
+        plt.subplot(2, len(cases), len(cases) + idx + 1)
+        for algo, samples in zip(algorithms, data):
+            x, y = _ecdf(samples)
+            plt.step(x, y, where="post", label=algo)
+        for level in (0.5, 0.95, 0.99):
+            plt.axhline(level, color="grey", ls=":", lw=0.8)
+        plt.xscale("log")
+        plt.xlabel(f"{metric} ({unit}, log)")
+        plt.ylabel("Доля запусков (ECDF)")
+        plt.grid(True, which="both", ls=":")
+        plt.legend(fontsize=8)
+
+    plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Распределения сырых замеров (violin и ECDF)."
+    )
+    parser.add_argument("--results", default="results/results.jsonl")
+    parser.add_argument("--size", type=int, default=2**16)
+    parser.add_argument(
+        "--metric", choices=["time", "memory"], default="time"
+    )
+    args = parser.parse_args()
+    plot_distributions(args.results, args.size, args.metric)
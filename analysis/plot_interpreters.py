@@ -0,0 +1,39 @@
+import numpy as np
+import matplotlib.pyplot as plt
+
+
+def plot_speedups(
+    table: dict, versions: list, baseline: str, path: str
+) -> None:
+    """Столбцы ускорения интерпретаторов относительно baseline:
+    по графику на случай, группа столбцов — алгоритм."""
+    cases = [
+        case for case in ["best", "worst", "random"]
+        if any(key[1] == case for key in table)
+    ]
+    plt.figure(figsize=(7 * len(cases), 5))
+    width = 0.8 / max(len(versions), 1)
+
+    for idx, case in enumerate(cases):
+        algorithms = sorted(algo for algo, c in table if c == case)
+        x = np.arange(len(algorithms))
+        plt.subplot(1, len(cases), idx + 1)
+        for offset, version in enumerate(versions):
+            values = [
+                table[(algo, case)].get(version, np.nan)
+                for algo in algorithms
+            ]
+            plt.bar(x + offset * width, values, width, label=version)
+        plt.axhline(1.0, color="black", lw=0.8, ls=":")
+        plt.xticks(
+            x + width * (len(versions) - 1) / 2, algorithms,
+            rotation=30, fontsize=8
+        )
+        plt.title(f"{case.capitalize()} случаи")
+        plt.ylabel(f"Ускорение относительно {baseline}")
+        plt.grid(True, axis="y", ls=":")
+        plt.legend(fontsize=8)
+
+    plt.tight_layout()
+    plt.savefig(path, dpi=120)
+    plt.close()
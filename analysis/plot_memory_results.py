@@ -2,24 +2,7 @@ import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
-
-def _power_fit_curve(x: np.ndarray, y: np.ndarray) -> tuple:
-    """Аппроксимация степенной функцией
-    через логарифмическое преобразование."""
-    log_x = np.log(x)
-    log_y = np.log(y)
-
-    slope, intercept = np.polyfit(log_x, log_y, 1)
-    a = np.exp(intercept)
-    b = slope
-
-    y_pred = a * x**b
-    ss_res = np.sum((y - y_pred) ** 2)
-    ss_tot = np.sum((y - np.mean(y)) ** 2)
-    r2 = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
-
-    label = f"y = {a:.2e}x^{b:.2f} (R²={r2:.2f})"
-    return (a, b), label
+from analysis.power_fit import power_fit_curve
 
 
 def plot_memory_results_power_only() -> None:
@@ -69,7 +52,7 @@ def plot_memory_results_power_only() -> None:
             )
 
             if len(x) > 1:
-                (a, b), label = _power_fit_curve(x, y)
+                (a, b), label = power_fit_curve(x, y)
                 x_fit = np.linspace(x.min(), x.max(), 200)
                 y_fit = a * x_fit**b
                 plt.plot(
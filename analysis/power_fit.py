@@ -0,0 +1,26 @@
+"""
+Модуль power_fit.py: Степенная аппроксимация y = a * x^b.
+
+Только numpy: модуль импортируется и замерами (модель стоимости, тесты
+производительности), которым не нужны pandas и matplotlib.
+"""
+import numpy as np
+
+
+def power_fit_curve(x: np.ndarray, y: np.ndarray) -> tuple:
+    """Аппроксимация степенной функцией
+    через логарифмическое преобразование."""
+    log_x = np.log(x)
+    log_y = np.log(y)
+
+    slope, intercept = np.polyfit(log_x, log_y, 1)
+    a = np.exp(intercept)
+    b = slope
+
+    y_pred = a * x**b
+    ss_res = np.sum((y - y_pred) ** 2)
+    ss_tot = np.sum((y - np.mean(y)) ** 2)
+    r2 = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0
+
+    label = f"y = {a:.2e}x^{b:.2f} (R²={r2:.2f})"
+    return (a, b), label
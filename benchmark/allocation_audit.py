@@ -0,0 +1,148 @@
+"""
+Модуль allocation_audit.py: Построчный аудит выделений памяти.
+
+Обычный замер MemoryMeasurer видит только пик, а временные объекты
+в горячих циклах (срезы text[i:i + m], копии списков) создаются
+и освобождаются внутри одной строки и в пик не попадают. Аудит
+трассирует строки алгоритма и после каждой строки берёт пик tracemalloc
+сверх уровня на её начале: так каждой строке приписываются число
+выполнений, выделивших память, и суммарный объём этих выделений.
+Оставшиеся после вызова блоки дополнительно группируются по трассировкам
+из снимков tracemalloc.
+"""
+import os
+import sys
+import linecache
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def _trace_lines(
+    func: Callable, args: Tuple, filenames: set
+) -> Dict[Tuple[str, int], List[int]]:
+    """Выполняет func(*args) под трассировкой строк из filenames.
+
+    Возвращает {(файл, строка): [число выделений, байты]}.
+    """
+    stats: Dict[Tuple[str, int], List[int]] = {}
+    state = {"line": None, "current": 0}
+
+    def account():
+        current, peak = tracemalloc.get_traced_memory()
+        allocated = peak - state["current"]
+        if state["line"] is not None and allocated > 0:
+            entry = stats.setdefault(state["line"], [0, 0])
+            entry[0] += 1
+            entry[1] += allocated
+
+    def local_trace(frame, event, arg):
+        if event in ("line", "return"):
+            account()
+            if event == "line":
+                state["line"] = (frame.f_code.co_filename, frame.f_lineno)
+            # Учёт статистики сам выделяет память — уровень отсчёта
+            # берётся после него, непосредственно перед сбросом пика
+            state["current"] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        return local_trace
+
+    def global_trace(frame, event, arg):
+        if frame.f_code.co_filename in filenames:
+            return local_trace
+        return None
+
+    previous = sys.gettrace()
+    state["current"] = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    sys.settrace(global_trace)
+    try:
+        func(*args)
+    finally:
+        sys.settrace(previous)
+    return stats
+
+
+def audit_allocations(
+    func: Callable,
+    args: Tuple,
+    depth: int = 10,
+    filenames: Optional[List[str]] = None,
+    top: int = 10
+) -> Dict[str, list]:
+    """Аудит выделений памяти при вызове func(*args).
+
+    filenames — файлы, строки которых учитываются (по умолчанию файл,
+    где определена func). Возвращает словарь с ключами:
+        lines    — строки, отсортированные по убыванию объёма выделений:
+                   {"file", "line", "source", "count", "bytes"};
+        retained — блоки, оставшиеся после вызова, сгруппированные по
+                   трассировке глубиной depth: {"traceback", "count",
+                   "bytes"}.
+    """
+    filenames = set(filenames or [func.__code__.co_filename])
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        tracemalloc.stop()
+    tracemalloc.start(depth)
+    try:
+        before = tracemalloc.take_snapshot()
+        stats = _trace_lines(func, args, filenames)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+        if was_tracing:
+            tracemalloc.start()
+
+    lines = [
+        {
+            "file": filename,
+            "line": lineno,
+            "source": linecache.getline(filename, lineno).strip(),
+            "count": count,
+            "bytes": size
+        }
+        for (filename, lineno), (count, size) in stats.items()
+    ]
+    lines.sort(key=lambda row: (row["bytes"], row["count"]), reverse=True)
+
+    # Только блоки, выделенные непосредственно строками алгоритма
+    # (а не служебными структурами самого аудита)
+    trace_filter = [
+        tracemalloc.Filter(True, filename) for filename in filenames
+    ]
+    retained = [
+        {
+            "traceback": [
+                f"{os.path.basename(frame.filename)}:{frame.lineno}"
+                for frame in reversed(diff.traceback)
+                if frame.filename in filenames
+            ],
+            "count": diff.count_diff,
+            "bytes": diff.size_diff
+        }
+        for diff in after.filter_traces(trace_filter).compare_to(
+            before.filter_traces(trace_filter), "traceback"
+        )
+        if diff.size_diff > 0
+    ]
+    return {"lines": lines, "retained": retained[:top]}
+
+
+def format_report(title: str, audit: Dict[str, list], top: int = 10) -> str:
+    """Текстовый отчёт: строки с наибольшими выделениями."""
+    out = [f"== {title}"]
+    out.append(f"{'Байты':>12} {'Выделений':>10}  Строка")
+    for row in audit["lines"][:top]:
+        location = f"{os.path.basename(row['file'])}:{row['line']}"
+        out.append(
+            f"{row['bytes']:>12} {row['count']:>10}  "
+            f"{location:<18} {row['source']}"
+        )
+    if audit["retained"]:
+        out.append("Осталось после вызова:")
+        for row in audit["retained"]:
+            out.append(
+                f"{row['bytes']:>12} {row['count']:>10}  "
+                + " <- ".join(row["traceback"])
+            )
+    return "\n".join(out) + "\n"
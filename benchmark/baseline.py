@@ -0,0 +1,75 @@
+"""
+Модуль baseline.py: Отставание алгоритмов от эталона на C.
+
+Эталон (по умолчанию str.find) замеряется в каждой ячейке на тех же
+данных, что и алгоритм, но в текущем процессе: вызов на C короток,
+и порождение процесса на каждый запуск заслонило бы его время.
+В запись ячейки попадают baseline, baseline_time и baseline_ratio — во
+сколько раз алгоритм медленнее эталона. Только стандартная библиотека,
+поэтому используется и в benchmark.cell_worker.
+"""
+import math
+import time
+import statistics
+from typing import Dict, Iterable, Tuple
+
+from src.registry import engines, get_engine
+
+DEFAULT_BASELINE = "str_find"
+
+
+def reference_names():
+    return sorted(engines(reference=True, multi_pattern=False))
+
+
+def measure_baseline(
+    name: str, text: str, pattern: str, runs: int = 11
+) -> dict:
+    """Медиана времени эталона name на (text, pattern), не меньше трёх
+    запусков."""
+    engine = get_engine(name)
+    text, pattern = engine.adapt(text, pattern)
+    samples = []
+    for _ in range(max(runs, 3)):
+        started = time.perf_counter()
+        engine.search(text, pattern)
+        samples.append(time.perf_counter() - started)
+    return {"baseline": name, "baseline_time": statistics.median(samples)}
+
+
+def with_ratio(result: dict) -> dict:
+    """Добавляет baseline_ratio = time / baseline_time."""
+    if result.get("time") and result.get("baseline_time"):
+        result["baseline_ratio"] = result["time"] / result["baseline_time"]
+    return result
+
+
+def gap_table(records: Iterable[dict]) -> Dict[Tuple[str, str], float]:
+    """{(алгоритм, случай): отставание} — среднее геометрическое
+    baseline_ratio по размерам."""
+    logs: Dict[Tuple[str, str], list] = {}
+    for record in records:
+        if record.get("baseline_ratio"):
+            logs.setdefault(
+                (record["algorithm"], record["case"]), []
+            ).append(math.log(record["baseline_ratio"]))
+    return {
+        pair: math.exp(statistics.mean(values))
+        for pair, values in logs.items()
+    }
+
+
+def format_gap(table: Dict[Tuple[str, str], float], baseline: str) -> str:
+    cases = [
+        case for case in ["best", "worst", "random"]
+        if any(key[1] == case for key in table)
+    ]
+    lines = [f"Во сколько раз медленнее {baseline}:",
+             f"{'Алгоритм':<22}" + "".join(f"{case:>12}" for case in cases)]
+    for algorithm in sorted({key[0] for key in table}):
+        lines.append(f"{algorithm:<22}" + "".join(
+            f"{table[(algorithm, case)]:>11.1f}x"
+            if (algorithm, case) in table else f"{'—':>12}"
+            for case in cases
+        ))
+    return "\n".join(lines)
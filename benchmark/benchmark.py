@@ -1,20 +1,48 @@
+import os
 import argparse
 import json
 import logging
 import math
-from src.algorithms import *
+import time
+from functools import partial
 from src.data_generator import TestDataGenerator
-from time_measurer import TimeMeasurer
-from memory_measurer import MemoryMeasurer
+from src.instrumented import INSTRUMENTED
+from src.registry import engines, get_engine
+from benchmark.time_measurer import TimeMeasurer
+from benchmark.memory_measurer import MemoryMeasurer
+from benchmark.scheduler import ParallelScheduler
+from benchmark.sample_store import SampleStore
+from benchmark.stats import describe, confidence_interval
+from benchmark.interleave import measure_interleaved, stability
+from benchmark.profiler import parse_cell_spec, matches, profile_cell
+from benchmark.allocation_audit import audit_allocations, format_report
+from benchmark.baseline import (
+    DEFAULT_BASELINE, reference_names, measure_baseline, with_ratio,
+    gap_table, format_gap
+)
+from benchmark.cost_model import (
+    CostModel, pilot_cells, plan_cell, format_plan, prediction_error
+)
+from benchmark.results_store import (
+    ResultsStore, environment, engine_version, to_legacy
+)
 from tqdm import tqdm
 
 logging.basicConfig(
-    filename="../results/benchmark.log",
+    filename="results/benchmark.log",
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(message)s"
 )
 
 
+# Однопаттерновые алгоритмы из реестра (с подключёнными точками входа);
+# эталоны замеряются в каждой ячейке отдельно (--baseline)
+algorithms = {
+    name: engine.search
+    for name, engine in engines(multi_pattern=False, reference=False).items()
+}
+
+
 def parse_args():
     parser = argparse.ArgumentParser(
         description="Проводит измерения времени и памяти "
@@ -24,8 +52,7 @@ def parse_args():
     parser.add_argument(
         "-a", "--algorithm",
         type=str,
-        choices=["all", "naive", "kmp", "boyer_moore", "rabin_karp",
-                 "aho_corasick", "apostolico_croche"],
+        choices=["all", *algorithms],
         default="all",
         help="Алгоритм для тестирования (по умолчанию: all)"
     )
@@ -38,7 +65,182 @@ def parse_args():
         help="Тип случая данных (по умолчанию: all)"
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Количество параллельных процессов, не больше числа "
+             "физических ядер (по умолчанию: 1 — последовательно)"
+    )
+
+    parser.add_argument(
+        "--sampling",
+        type=str,
+        choices=["fixed", "sequential"],
+        default="fixed",
+        help="fixed — число запусков по размеру входа; sequential — "
+             "замеры до достижения точности --target-ci "
+             "(по умолчанию: fixed)"
+    )
+
+    parser.add_argument(
+        "--order",
+        type=str,
+        choices=["sequential", "interleaved"],
+        default="sequential",
+        help="sequential — ячейки по одной; interleaved — запуски всех "
+             "алгоритмов одного случая и размера чередуются в случайном "
+             "порядке, с нагрузкой и частотой CPU на каждый замер "
+             "(по умолчанию: sequential)"
+    )
+
+    parser.add_argument(
+        "--target-ci",
+        type=float,
+        default=0.05,
+        help="Целевая относительная полуширина 95%% интервала "
+             "для sequential (по умолчанию: 0.05)"
+    )
+
+    parser.add_argument(
+        "--max-runs",
+        type=int,
+        default=1000,
+        help="Максимум запусков на ячейку для sequential "
+             "(по умолчанию: 1000)"
+    )
+
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="Лимит времени замеров одной ячейки в секундах "
+             "для sequential (по умолчанию: без лимита)"
+    )
+
+    parser.add_argument(
+        "--warmup-budget",
+        type=float,
+        default=1.0,
+        help="Лимит времени прогрева одной ячейки в секундах "
+             "(по умолчанию: 1.0)"
+    )
+
+    parser.add_argument(
+        "--warmup-max-runs",
+        type=int,
+        default=50,
+        help="Максимум прогревочных запусков (по умолчанию: 50)"
+    )
+
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=5.0,
+        help="Таймаут одного запуска в секундах; для крупных ячеек "
+             "увеличивается по модели стоимости (по умолчанию: 5.0)"
+    )
+
+    parser.add_argument(
+        "--cell-budget",
+        type=float,
+        default=None,
+        help="Лимит времени одной ячейки в секундах: по модели стоимости "
+             "ячейки сверх лимита получают меньше запусков или "
+             "пропускаются (по умолчанию: без лимита)"
+    )
+
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Замерить пилотные ячейки, вывести оценку времени "
+             "и завершить работу"
+    )
+
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        choices=[*reference_names(), "none"],
+        default=DEFAULT_BASELINE,
+        help="Эталон на C, замеряемый на данных каждой ячейки "
+             f"(по умолчанию: {DEFAULT_BASELINE})"
+    )
+
+    parser.add_argument(
+        "--phases",
+        action="store_true",
+        help="Дополнительно замерить время и память предобработки "
+             "паттерна и прохода по тексту по отдельности"
+    )
+
+    parser.add_argument(
+        "--count-ops",
+        action="store_true",
+        help="Сохранить счётчики операций (сравнения, сдвиги, коллизии "
+             "хешей, переходы по суффиксным ссылкам) для каждой ячейки"
+    )
+
+    parser.add_argument(
+        "--profile",
+        type=parse_cell_spec,
+        action="append",
+        metavar="АЛГОРИТМ[:СЛУЧАЙ[:РАЗМЕР]]",
+        help="Профилировать выбранные ячейки (cProfile и семплирующий "
+             "профиль для flamegraph); опцию можно повторять"
+    )
+
+    parser.add_argument(
+        "--profile-dir",
+        type=str,
+        default="results/profiles",
+        help="Каталог профилей (по умолчанию: results/profiles)"
+    )
+
+    parser.add_argument(
+        "--audit-allocations",
+        action="store_true",
+        help="Построчный аудит выделений памяти (tracemalloc) для ячеек "
+             "не больше --audit-max-size; отчёт — в --audit-report"
+    )
+
+    parser.add_argument(
+        "--audit-max-size",
+        type=int,
+        default=2**16,
+        help="Максимальный размер входа для аудита выделений "
+             "(по умолчанию: 65536)"
+    )
+
+    parser.add_argument(
+        "--audit-report",
+        type=str,
+        default="results/allocation_audit.txt",
+        help="Файл отчёта аудита выделений "
+             "(по умолчанию: results/allocation_audit.txt)"
+    )
+
+    parser.add_argument(
+        "-r", "--results",
+        type=str,
+        default="results/results.jsonl",
+        help="Файл хранилища результатов "
+             "(по умолчанию: results/results.jsonl)"
+    )
+
+    parser.add_argument(
+        "--samples",
+        type=str,
+        default="results/samples",
+        help="Каталог сырых замеров .npz (по умолчанию: results/samples)"
+    )
+
+    args = parser.parse_args()
+    if args.order == "interleaved" and (
+        args.sampling == "sequential" or args.jobs > 1
+    ):
+        parser.error("--order interleaved совместим только с --sampling "
+                     "fixed и -j 1")
+    return args
 
 
 def get_adaptive_n_runs(size: int, min_runs=10, max_runs=101) -> int:
@@ -65,98 +267,445 @@ def save_results(time_results, memory_results):
         logging.error(f"Ошибка при сохранении: {e}")
 
 
+def cell_n_runs(cell: tuple, settings: dict) -> int:
+    plan = settings.get("cell_plans", {}).get(cell, {})
+    return (plan.get("n_runs") or settings.get("n_runs")
+            or get_adaptive_n_runs(cell[2]))
+
+
+def measure_group(cells: list, inputs: dict, settings: dict) -> dict:
+    """Чередующийся замер времени ячеек одного случая и размера:
+    {ячейка: {"time", "load", "cpu_mhz", "warmup", "seconds" — доля
+    времени группы, сводка stability}}."""
+    settings = settings or {}
+    calls, runs, warmups, seconds = {}, {}, {}, {}
+    for cell in cells:
+        started = time.perf_counter()
+        func = algorithms[cell[0]]
+        args = get_engine(cell[0]).adapt(*inputs[cell])
+        calls[cell] = (func, args)
+        runs[cell] = cell_n_runs(cell, settings)
+        warmups[cell] = TimeMeasurer().warm_up(
+            func, args,
+            max_runs=settings.get("warmup_max_runs", 50),
+            time_budget=settings.get("warmup_budget", 1.0)
+        )
+        seconds[cell] = time.perf_counter() - started
+    started = time.perf_counter()
+    samples = measure_interleaved(calls, runs)
+    # Время раундов делится между ячейками пропорционально их замерам
+    elapsed = time.perf_counter() - started
+    total = sum(sum(samples[cell]["time"]) for cell in cells) or 1.0
+    for cell in cells:
+        seconds[cell] += elapsed * sum(samples[cell]["time"]) / total
+    return {
+        cell: {
+            **samples[cell],
+            "warmup": warmups[cell],
+            "seconds": seconds[cell],
+            **stability(samples[cell]["load"], samples[cell]["cpu_mhz"])
+        }
+        for cell in cells
+    }
+
+
+def run_cell(
+    algo_name: str, case: str, text: str, pattern: str,
+    settings: dict = None, timing: dict = None
+) -> dict:
+    """Прогрев и замеры времени и памяти для одной ячейки; timing —
+    время, уже замеренное measure_group."""
+    settings = settings or {}
+    # План ячейки по модели стоимости: число запусков и таймаут
+    settings = {
+        **settings,
+        **settings.get("cell_plans", {}).get((algo_name, case, len(text)), {})
+    }
+    started = time.perf_counter() - (timing or {}).get("seconds", 0.0)
+    algo_func = algorithms[algo_name]
+    text, pattern = get_engine(algo_name).adapt(text, pattern)
+
+    time_measurer = TimeMeasurer(settings.get("timeout", 5.0))
+    memory_measurer = MemoryMeasurer()
+
+    if timing is not None:
+        warmup_runs, warmup_reason = timing["warmup"]
+    else:
+        warmup_runs, warmup_reason = time_measurer.warm_up(
+            algo_func, (text, pattern),
+            max_runs=settings.get("warmup_max_runs", 50),
+            time_budget=settings.get("warmup_budget", 1.0)
+        )
+    result = {"warmup_runs": warmup_runs, "warmup_reason": warmup_reason}
+
+    if timing is not None:
+        time_measurer.samples = timing["time"]
+        time_mean, time_delta = confidence_interval(timing["time"])
+        memory_mean, memory_delta = memory_measurer.measure(
+            algo_func, (text, pattern), len(timing["time"])
+        )
+        result.update({
+            "sampling": "fixed",
+            "order": "interleaved",
+            "n_runs": len(timing["time"]),
+            "time": time_mean,
+            "time_delta": time_delta,
+            "memory": memory_mean,
+            "memory_delta": memory_delta,
+            # Условия замеров: сводка и сырые значения для .npz
+            **{
+                key: value for key, value in timing.items()
+                if key not in (
+                    "time", "warmup", "load", "cpu_mhz", "seconds"
+                )
+            },
+            "load_samples": timing["load"],
+            "cpu_mhz_samples": timing["cpu_mhz"]
+        })
+    elif settings.get("sampling") == "sequential":
+        limits = {
+            "target_ci": settings["target_ci"],
+            "max_runs": settings["max_runs"],
+            "time_budget": settings["time_budget"]
+        }
+        timing = time_measurer.measure_sequential(
+            algo_func, (text, pattern), **limits
+        )
+        memory = memory_measurer.measure_sequential(
+            algo_func, (text, pattern), **limits
+        )
+        result.update({
+            "sampling": "sequential",
+            "n_runs": timing["n_runs"],
+            "stop_reason": timing["stop_reason"],
+            "time": timing["mean"],
+            "time_delta": timing["delta"],
+            "memory_n_runs": memory["n_runs"],
+            "memory_stop_reason": memory["stop_reason"],
+            "memory": memory["mean"],
+            "memory_delta": memory["delta"]
+        })
+    else:
+        n_runs = cell_n_runs((algo_name, case, len(text)), settings)
+        time_mean, time_delta = time_measurer.measure(
+            algo_func, (text, pattern), n_runs
+        )
+        memory_mean, memory_delta = memory_measurer.measure(
+            algo_func, (text, pattern), n_runs
+        )
+        result.update({
+            "sampling": "fixed",
+            "n_runs": n_runs,
+            "time": time_mean,
+            "time_delta": time_delta,
+            "memory": memory_mean,
+            "memory_delta": memory_delta
+        })
+
+    baseline = settings.get("baseline", DEFAULT_BASELINE)
+    if baseline and baseline != "none":
+        result.update(measure_baseline(
+            baseline, text, pattern, min(result["n_runs"], 101)
+        ))
+        with_ratio(result)
+
+    if settings.get("phases") and get_engine(algo_name).phases:
+        preprocess, scan = get_engine(algo_name).phases
+        for metric, measurer in (
+            ("time", time_measurer), ("memory", memory_measurer)
+        ):
+            phases = measurer.measure_phases(
+                preprocess, scan, text, pattern, result["n_runs"]
+            )
+            for phase, (mean, delta) in phases.items():
+                result[f"{phase}_{metric}"] = mean
+                result[f"{phase}_{metric}_delta"] = delta
+
+    if (settings.get("audit_allocations")
+            and len(text) <= settings.get("audit_max_size", 2**16)):
+        audit = audit_allocations(algo_func, (text, pattern))
+        lines = audit["lines"]
+        result["alloc_total_bytes"] = sum(row["bytes"] for row in lines)
+        result["alloc_total_count"] = sum(row["count"] for row in lines)
+        if lines:
+            top = lines[0]
+            result["alloc_top_line"] = (
+                f"{os.path.basename(top['file'])}:{top['line']}"
+            )
+            result["alloc_top_bytes"] = top["bytes"]
+        result["alloc_report"] = format_report(
+            f"{algo_name} ({case}), размер {len(text)}", audit
+        )
+
+    # Перцентили, MAD и выбросы по сырым замерам
+    for metric, measurer in (
+        ("time", time_measurer), ("memory", memory_measurer)
+    ):
+        for stat, value in describe(measurer.samples).items():
+            result[f"{metric}_{stat}"] = value
+
+    if settings.get("count_ops") and algo_name in INSTRUMENTED:
+        # Отдельный запуск инструментированной версии вне замеров
+        _, counters = INSTRUMENTED[algo_name](text, pattern)
+        for name, value in counters.items():
+            result[f"ops_{name}"] = value
+
+    if matches(settings.get("profile") or [], algo_name, case, len(text)):
+        # Профилирование после замеров — в статистику не попадает
+        result.update(profile_cell(
+            algo_func, (text, pattern),
+            os.path.join(
+                settings.get("profile_dir", "results/profiles"),
+                f"{algo_name}_{case}_{len(text)}"
+            )
+        ))
+
+    result["time_samples"] = time_measurer.samples
+    result["memory_samples"] = memory_measurer.samples
+    result["cell_seconds"] = time.perf_counter() - started
+    return result
+
+
+def measure_cell(
+    algo_name: str, case: str, size: int, settings: dict = None
+) -> dict:
+    """Генерирует данные ячейки и замеряет её (для рабочих процессов)."""
+    text, pattern = TestDataGenerator().generate_case(algo_name, case, size)
+    return run_cell(algo_name, case, text, pattern, settings)
+
+
+def cell_key_fields(
+    algo_name: str, case: str, size: int, env: dict,
+    order: str = "sequential"
+) -> dict:
+    return {
+        "algorithm": algo_name,
+        "case": case,
+        "size": size,
+        "engine_version": engine_version(algorithms[algo_name]),
+        **env,
+        "order": order
+    }
+
+
 def main():
     args = parse_args()
-    selected_algorithms = [args.algorithm] if args.algorithm != "all" else [
-        "naive", "kmp", "boyer_moore", "rabin_karp",
-        "aho_corasick", "apostolico_croche"
-    ]
+    selected_algorithms = (
+        [args.algorithm] if args.algorithm != "all" else list(algorithms)
+    )
     if args.case != "all":
         selected_cases = [args.case]
     else:
         selected_cases = ["best", "worst", "random"]
+    settings = vars(args)
     generator = TestDataGenerator()
-    time_measurer = TimeMeasurer()
-    memory_measurer = MemoryMeasurer()
-
-    try:
-        with open("results/time_results.json", "r", encoding="utf-8") as f:
-            time_results = json.load(f)
-    except FileNotFoundError:
-        time_results = {}
-
-    try:
-        with open("results/memory_results.json", "r", encoding="utf-8") as f:
-            memory_results = json.load(f)
-    except FileNotFoundError:
-        memory_results = {}
-
-    algorithms = {
-        "naive": naive_search,
-        "kmp": kmp_search,
-        "boyer_moore": boyer_moore_search,
-        "rabin_karp": rabin_karp_search,
-        "apostolico_crochemore": apostolico_crochemore_search,
-        "aho_corasick": aho_corasick_search
-    }
-
-    cases = ["best", "worst", "random"]
+    store = ResultsStore(args.results)
+    sample_store = SampleStore(args.samples)
+    env = environment()
+    # Замеры в своём процессе (interleaved) и в отдельных процессах
+    # не смешиваются
+    scope = {**env, "order": args.order}
 
-    for algo_name, algo_func in algorithms.items():
+    # Ячейки, уже измеренные в этом окружении и порядке, пропускаются
+    pending = {}
+    for algo_name in algorithms:
         if algo_name not in selected_algorithms:
             continue
-        print(f"\n--- Тестируем алгоритм: {algo_name} ---")
-        if algo_name not in time_results:
-            time_results[algo_name] = {}
-        if algo_name not in memory_results:
-            memory_results[algo_name] = {}
-
         for case in selected_cases:
-            print(f"\n> Случай: {case}")
-            if case not in time_results[algo_name]:
-                time_results[algo_name][case] = []
-            if case not in memory_results[algo_name]:
-                memory_results[algo_name][case] = []
+            for size in generator.sizes:
+                fields = cell_key_fields(
+                    algo_name, case, size, env, args.order
+                )
+                if ResultsStore.key(fields) not in store:
+                    pending[(algo_name, case, size)] = fields
+    print(f"Ячеек к замеру: {len(pending)}, уже в {args.results}: "
+          f"{len(store.select(scope))}")
 
-            data = generator.generate_all_cases()[algo_name][case]
-            print(f"Данных для обработки: {len(data)}")
+    model = CostModel(store.select(env))
+    plans = {}
+    measured = []
+    settings["cell_plans"] = {}
 
-            for text, pattern in tqdm(data, desc=f"{algo_name} ({case})"):
-                size = len(text)
-                n_runs = get_adaptive_n_runs(size)
-                print(f"  -> size = {size}, n_runs = {n_runs}")
+    def store_result(task, result):
+        record = {**pending[task], **result}
+        plan = plans.get(task, {})
+        record["predicted_seconds"] = plan.get("predicted_seconds")
+        record["plan_action"] = plan.get("action", "pilot")
+        # Сырые замеры — в отдельный .npz, в записи только путь к нему
+        conditions = {
+            name: [math.nan if value is None else value
+                   for value in record.pop(f"{name}_samples")]
+            for name in ("load", "cpu_mhz") if f"{name}_samples" in record
+        }
+        record["samples_file"] = sample_store.save(
+            ResultsStore.key(record),
+            time=record.pop("time_samples"),
+            memory=record.pop("memory_samples"),
+            **conditions
+        )
+        if "alloc_report" in record:
+            with open(args.audit_report, "a", encoding="utf-8") as f:
+                f.write(record.pop("alloc_report") + "\n")
+        store.append(record)
+        model.observe(record)
+        measured.append(record)
 
-                try:
-                    for _ in range(5):  # Прогрев
-                        algo_func(text, pattern)
+    runs_key = "max_runs" if args.sampling == "sequential" else "n_runs"
 
-                    time_mean, time_delta = time_measurer.measure(
-                        algo_func, (text, pattern), n_runs
-                    )
-                    memory_mean, memory_delta = memory_measurer.measure(
-                        algo_func, (text, pattern), n_runs
-                    )
+    def make_plan(cell):
+        n_runs = (
+            args.max_runs if args.sampling == "sequential"
+            else get_adaptive_n_runs(cell[2])
+        )
+        # Чередующиеся замеры идут в текущем процессе без таймаута
+        # запуска: ячейка дольше --timeout задержала бы всю группу
+        plan = plans[cell] = plan_cell(
+            model, cell, n_runs, args.cell_budget, args.timeout,
+            in_process=args.order == "interleaved"
+        )
+        if plan["action"] == "skip":
+            settings["cell_plans"].pop(cell, None)
+            if plan["reason"] == "timeout":
+                logging.info(
+                    f"Пропуск: {cell}, оценка вызова "
+                    f"{plan['predicted_call']:.2f} с больше --timeout"
+                )
+            else:
+                logging.info(
+                    f"Пропуск по бюджету: {cell}, оценка одного запуска "
+                    f"{model.run_time(*cell):.2f} с"
+                )
+        else:
+            settings["cell_plans"][cell] = {
+                runs_key: plan["n_runs"], "timeout": plan["timeout"]
+            }
+        return plan
 
-                    time_results[algo_name][case].append({
-                        "size": size,
-                        "time": time_mean,
-                        "delta": time_delta
-                    })
+    def run_interleaved(cells):
+        groups = {}
+        for cell in cells:
+            groups.setdefault(cell[1:], []).append(cell)
+        for (case, size), group in tqdm(groups.items(), desc="Группы"):
+            group = [
+                cell for cell in group
+                if cell not in plans or make_plan(cell)["action"] != "skip"
+            ]
+            if not group:
+                continue
+            print(f"  -> {case}, size = {size}: "
+                  + ", ".join(cell[0] for cell in group))
+            try:
+                # Кроме худшего случая, данные у всех алгоритмов общие
+                shared = None
+                if case != "worst":
+                    shared = generator.generate_case(group[0][0], case, size)
+                inputs = {
+                    cell: shared if shared is not None
+                    else generator.generate_case(*cell)
+                    for cell in group
+                }
+                timings = measure_group(group, inputs, settings)
+            except Exception as e:
+                logging.error(f"Ошибка: группа {case}, размер {size}: {e}")
+                continue
+            for cell in group:
+                try:
+                    store_result(cell, run_cell(
+                        *cell[:2], *inputs[cell], settings, timings[cell]
+                    ))
+                except Exception as e:
+                    logging.error(
+                        f"Ошибка: {cell[0]} ({case}), размер {size}: {e}"
+                    )
 
-                    memory_results[algo_name][case].append({
-                        "size": size,
-                        "memory": memory_mean,
-                        "delta": memory_delta
-                    })
+    def run_cells(cells):
+        if args.order == "interleaved":
+            run_interleaved(cells)
+            return
+        if args.jobs > 1:
+            cells = [
+                cell for cell in cells
+                if plans.get(cell, {}).get("action") != "skip"
+            ]
+            scheduler = ParallelScheduler(args.jobs)
+            print(f"Процессов: {scheduler.jobs} (CPU {scheduler.cpus})")
+            progress = tqdm(total=len(cells), desc="Ячейки")
 
-                except Exception as e:
+            def on_result(task, result, error):
+                algo_name, case, size = task
+                progress.update(1)
+                if error is not None:
                     logging.error(
-                        f"Ошибка: {algo_name} ({case}), размер {size}: {e}"
+                        f"Ошибка: {algo_name} ({case}), размер {size}: "
+                        f"{error}"
                     )
-                    continue
+                    return
+                # Сохраняем по мере готовности ячеек
+                store_result(task, result)
+
+            scheduler.run(
+                cells, partial(measure_cell, settings=settings), on_result
+            )
+            progress.close()
+            return
+        for algo_name, case, size in tqdm(cells, desc="Ячейки"):
+            # Перед каждой ячейкой план уточняется по только что
+            # измеренным меньшим размерам
+            if (algo_name, case, size) in plans and make_plan(
+                (algo_name, case, size)
+            )["action"] == "skip":
+                continue
+            print(f"  -> {algo_name} ({case}), size = {size}")
+            try:
+                text, pattern = generator.generate_case(
+                    algo_name, case, size
+                )
+                store_result(
+                    (algo_name, case, size),
+                    run_cell(algo_name, case, text, pattern, settings)
+                )
+            except Exception as e:
+                logging.error(
+                    f"Ошибка: {algo_name} ({case}), размер {size}: {e}"
+                )
+
+    # Наименьшие размеры пар без модели замеряются первыми
+    pilot = pilot_cells(model, pending, generator.sizes)
+    if pilot:
+        print(f"Пилотные ячейки для модели стоимости: {len(pilot)}")
+        run_cells(pilot)
+
+    for cell in pending:
+        if cell not in pilot:
+            make_plan(cell)
+    print(format_plan(plans))
+    if args.plan:
+        return
+    run_cells(list(plans))
+
+    unstable = [record for record in measured if record.get("unstable")]
+    if unstable:
+        print(f"Ячеек с нестабильными условиями замеров: {len(unstable)}")
+        for record in unstable:
+            print(f"  {record['algorithm']} ({record['case']}), размер "
+                  f"{record['size']}: {record['unstable_reason']}")
+
+    ratio = prediction_error(measured)
+    if ratio is not None:
+        print(f"Факт / оценка времени ячеек (медиана): {ratio:.2f}")
+
+    if args.baseline != "none":
+        gap = gap_table(
+            record for record in store.select(scope)
+            if record["algorithm"] in selected_algorithms
+            and record["case"] in selected_cases
+            and record.get("baseline") == args.baseline
+        )
+        if gap:
+            print(format_gap(gap, args.baseline))
 
-            # Сохраняем после каждого случая
-            save_results(time_results, memory_results)
+    # JSON-файлы прежнего формата — производные от хранилища
+    save_results(*to_legacy(store.select(scope)))
 
 
 if __name__ == "__main__":
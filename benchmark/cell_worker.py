@@ -0,0 +1,101 @@
+"""
+Модуль cell_worker.py: Замер ячеек в интерпретаторе, под которым он
+запущен (рабочий процесс benchmark.interpreters).
+
+Использует только стандартную библиотеку и src/, поэтому работает и без
+numpy (например, под PyPy). Запрос — объект JSON в stdin:
+    {"cells": [[алгоритм, случай, размер], ...], "runs", "warmup_runs",
+     "warmup_budget", "cell_budget", "baseline"};
+записи ячеек выводятся в stdout по одной строке JSON по мере готовности.
+Данные случайного случая зависят только от размера, поэтому совпадают
+во всех интерпретаторах.
+"""
+import sys
+import json
+import time
+import random
+import platform
+import statistics
+from typing import Iterator, List, Sequence
+
+from benchmark.baseline import DEFAULT_BASELINE, measure_baseline, with_ratio
+from benchmark.results_store import engine_version, environment
+from benchmark.stats import detect_steady_state
+from src.data_generator import TestDataGenerator
+from src.registry import get_engine
+
+
+def measure(
+    func,
+    text: str,
+    pattern: str,
+    runs: int = 11,
+    warmup_runs: int = 50,
+    warmup_budget: float = 2.0,
+    cell_budget: float = 10.0
+) -> dict:
+    """Прогрев до установившегося режима (для JIT) и до runs замеров
+    в пределах cell_budget секунд, но не меньше трёх."""
+    def draw() -> float:
+        started = time.perf_counter()
+        func(text, pattern)
+        return time.perf_counter() - started
+
+    warmup, reason = detect_steady_state(
+        draw, max_runs=warmup_runs, time_budget=warmup_budget
+    )
+    samples: List[float] = []
+    started = time.perf_counter()
+    while len(samples) < runs and (
+        len(samples) < 3 or time.perf_counter() - started < cell_budget
+    ):
+        samples.append(draw())
+    return {
+        "warmup_runs": len(warmup),
+        "warmup_reason": reason,
+        "n_runs": len(samples),
+        "time": statistics.median(samples),
+        "time_min": min(samples),
+        "time_mean": statistics.mean(samples)
+    }
+
+
+def run_cells(
+    cells: Sequence[Sequence],
+    baseline: str = DEFAULT_BASELINE,
+    **options
+) -> Iterator[dict]:
+    generator = TestDataGenerator()
+    env = environment()
+    for algorithm, case, size in cells:
+        random.seed(size)
+        engine = get_engine(algorithm)
+        text, pattern = engine.adapt(
+            *generator.generate_case(algorithm, case, size)
+        )
+        record = {
+            "algorithm": algorithm,
+            "case": case,
+            "size": size,
+            "engine_version": engine_version(engine.search),
+            **env,
+            "implementation": platform.python_implementation(),
+            "executable": sys.executable,
+            **measure(engine.search, text, pattern, **options)
+        }
+        if baseline:
+            record.update(measure_baseline(
+                baseline, text, pattern, options.get("runs", 11)
+            ))
+        yield with_ratio(record)
+
+
+def main() -> None:
+    request = json.load(sys.stdin)
+    cells = request.pop("cells")
+    for record in run_cells(cells, **request):
+        print(json.dumps(record, ensure_ascii=False), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Модуль compare.py: Сравнение двух наборов результатов (базовый и новый)
+по сырым замерам и проверка на значимые замедления.
+
+Пример:
+    python -m benchmark.compare base.jsonl new.jsonl --threshold 0.1
+Код возврата 1, если хотя бы одна ячейка значимо замедлилась больше
+чем на threshold. В каждом хранилище сравниваются записи одного
+окружения (версия Python и CPU); если их несколько, окружение выбирается
+--python-version и --cpu-model, иначе код возврата 2.
+"""
+import sys
+import argparse
+import statistics
+from typing import Dict, List, Optional, Tuple
+
+from benchmark.results_store import ResultsStore, field
+from benchmark.sample_store import SampleStore
+from benchmark.stats import mann_whitney_u
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Сравнивает базовый и новый наборы результатов "
+                    "и сообщает о статистически значимых изменениях."
+    )
+    parser.add_argument("baseline", help="Базовое хранилище (.jsonl)")
+    parser.add_argument("candidate", help="Новое хранилище (.jsonl)")
+    parser.add_argument(
+        "-m", "--metric",
+        choices=["time", "memory"],
+        default="time",
+        help="Сравниваемая метрика (по умолчанию: time)"
+    )
+    parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.01,
+        help="Уровень значимости критерия Манна-Уитни "
+             "(по умолчанию: 0.01)"
+    )
+    parser.add_argument(
+        "-t", "--threshold",
+        type=float,
+        default=0.05,
+        help="Допустимое относительное замедление медианы; "
+             "значимое замедление сверх порога даёт код возврата 1 "
+             "(по умолчанию: 0.05)"
+    )
+    parser.add_argument(
+        "--python-version",
+        default=None,
+        help="Окружение записей: версия Python, например "
+             "\"CPython 3.11.4\" (по умолчанию: единственная в хранилище)"
+    )
+    parser.add_argument(
+        "--cpu-model",
+        default=None,
+        help="Окружение записей: модель CPU "
+             "(по умолчанию: единственная в хранилище)"
+    )
+    parser.add_argument(
+        "--order",
+        choices=["sequential", "interleaved"],
+        default="sequential",
+        help="Сравниваются записи с этим порядком замеров "
+             "(по умолчанию: sequential)"
+    )
+    return parser.parse_args(argv)
+
+
+def select_environment(
+    records: List[dict],
+    python_version: Optional[str] = None,
+    cpu_model: Optional[str] = None
+) -> Tuple[List[dict], Optional[Tuple[str, str]]]:
+    """Записи одного окружения (версия Python, CPU) и само окружение;
+    ValueError, если после фильтров их осталось несколько."""
+    records = [
+        record for record in records
+        if python_version in (None, record.get("python_version"))
+        and cpu_model in (None, record.get("cpu_model"))
+    ]
+    envs = sorted({
+        (record.get("python_version"), record.get("cpu_model"))
+        for record in records
+    })
+    if len(envs) > 1:
+        listed = "; ".join(f"{python} / {cpu}" for python, cpu in envs)
+        raise ValueError(
+            f"Несколько окружений ({listed}): укажите --python-version "
+            f"и/или --cpu-model"
+        )
+    return records, envs[0] if envs else None
+
+
+def index_cells(
+    records: List[dict], order: str = "sequential"
+) -> Dict[Tuple, dict]:
+    """Последняя запись для каждой ячейки (алгоритм, случай, размер)
+    среди записей с порядком замеров order."""
+    cells = {}
+    for record in records:
+        if field(record, "order") != order:
+            continue
+        cells[(record["algorithm"], record["case"], record["size"])] = record
+    return cells
+
+
+def compare_cells(
+    baseline: Dict[Tuple, dict],
+    candidate: Dict[Tuple, dict],
+    metric: str = "time",
+    alpha: float = 0.01
+) -> List[dict]:
+    """Сравнивает общие ячейки и возвращает строки отчёта,
+    отсортированные от сильнейшего замедления к сильнейшему ускорению."""
+    rows = []
+    for cell in sorted(set(baseline) & set(candidate)):
+        files = [
+            data[cell].get("samples_file") for data in (baseline, candidate)
+        ]
+        if not all(files):
+            continue
+        try:
+            base, new = (SampleStore.load(path)[metric] for path in files)
+        except (OSError, KeyError):
+            continue
+        base_median = statistics.median(base)
+        new_median = statistics.median(new)
+        change = (
+            new_median / base_median - 1.0 if base_median else 0.0
+        )
+        _, p_value = mann_whitney_u(list(base), list(new))
+        rows.append({
+            "algorithm": cell[0],
+            "case": cell[1],
+            "size": cell[2],
+            "baseline": base_median,
+            "candidate": new_median,
+            "change": change,
+            "p_value": p_value,
+            "significant": p_value < alpha
+        })
+    rows.sort(key=lambda row: row["change"], reverse=True)
+    return rows
+
+
+def regressions(rows: List[dict], threshold: float) -> List[dict]:
+    return [
+        row for row in rows
+        if row["significant"] and row["change"] > threshold
+    ]
+
+
+def print_report(rows: List[dict], threshold: float) -> None:
+    significant = [row for row in rows if row["significant"]]
+    print(f"Ячеек сравнено: {len(rows)}, "
+          f"значимых изменений: {len(significant)}")
+    if not significant:
+        return
+    print(f"{'Алгоритм':<24}{'Случай':<8}{'Размер':>10}"
+          f"{'База':>12}{'Новое':>12}{'Изм.':>9}{'p':>10}")
+    for row in significant:
+        mark = "  !" if row["change"] > threshold else ""
+        print(f"{row['algorithm']:<24}{row['case']:<8}{row['size']:>10}"
+              f"{row['baseline']:>12.4g}{row['candidate']:>12.4g}"
+              f"{row['change']:>+9.1%}{row['p_value']:>10.2g}{mark}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    selected = {}
+    for name, path in (("База", args.baseline), ("Новое", args.candidate)):
+        try:
+            records, env = select_environment(
+                ResultsStore(path).records, args.python_version,
+                args.cpu_model
+            )
+        except ValueError as e:
+            print(f"{path}: {e}", file=sys.stderr)
+            return 2
+        described = f"{env[0]} / {env[1]}" if env else "нет записей"
+        print(f"{name}: {path} ({described})")
+        selected[name] = index_cells(records, args.order)
+    rows = compare_cells(
+        selected["База"], selected["Новое"], args.metric, args.alpha
+    )
+    print_report(rows, args.threshold)
+    failed = regressions(rows, args.threshold)
+    if failed:
+        print(f"Замедление больше {args.threshold:.0%} "
+              f"в ячейках: {len(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""
+Модуль cost_model.py: Модель стоимости ячеек и план запуска в рамках
+бюджета времени.
+
+Для каждой пары (алгоритм, случай) по уже измеренным ячейкам строятся:
+    время вызова   t(n) = a * n^b — степенная аппроксимация
+                   (power_fit_curve) среднего времени поиска;
+    время запуска  r = c + k * t — линейная связь со временем одного
+                   запуска замера (cell_seconds / n_runs), в которую
+                   входят порождение процесса, замер памяти и прогрев.
+Стоимость ячейки — n_runs * r(t(n)). Модель строится по записям
+хранилища, в том числе прошлых запусков, поэтому уточняется от запуска
+к запуску; в каждую запись попадают предсказанное (predicted_seconds)
+и фактическое (cell_seconds) время ячейки.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from analysis.power_fit import power_fit_curve
+
+# Сколько наименьших размеров замеряется до построения модели
+PILOT_SIZES = 3
+# Степенной закон строится по наибольшим размерам: на малых время
+# вызова занято предобработкой паттерна
+FIT_POINTS = 4
+MIN_RUNS = 6
+# Таймаут запуска — с запасом над предсказанным временем вызова
+TIMEOUT_MARGIN = 4.0
+# Вызовов на запуск, пока наклон r(t) не виден по данным: замер
+# времени и замер памяти (tracemalloc замедляет вызов в разы)
+DEFAULT_RUN_FACTOR = 3.0
+
+Cell = Tuple[str, str, int]
+
+
+class CostModel:
+    def __init__(self, records: Iterable[dict] = ()):
+        # (алгоритм, случай) -> {размер: (время вызова, время запуска)}
+        self.observations: Dict[Tuple[str, str], Dict[int, tuple]] = {}
+        self._fits: Dict[Tuple[str, str], Optional[tuple]] = {}
+        for record in records:
+            self.observe(record)
+
+    def observe(self, record: dict) -> None:
+        """Добавляет измеренную ячейку; более поздние записи того же
+        размера заменяют ранние."""
+        if not record.get("cell_seconds") or not record.get("n_runs") \
+                or not record.get("time"):
+            return
+        pair = (record["algorithm"], record["case"])
+        self.observations.setdefault(pair, {})[record["size"]] = (
+            record["time"], record["cell_seconds"] / record["n_runs"]
+        )
+        self._fits.pop(pair, None)
+
+    def _fit(self, pair: Tuple[str, str]) -> Optional[tuple]:
+        if pair in self._fits:
+            return self._fits[pair]
+        points = self.observations.get(pair, {})
+        fit = None
+        if len(points) >= 2:
+            sizes = np.array(sorted(points), dtype=float)
+            calls = np.array([points[n][0] for n in sorted(points)])
+            runs = np.array([points[n][1] for n in sorted(points)])
+            (a, b), _ = power_fit_curve(
+                sizes[-FIT_POINTS:], calls[-FIT_POINTS:]
+            )
+            k = DEFAULT_RUN_FACTOR
+            if np.ptp(calls) > 0:
+                k = max(float(np.polyfit(calls, runs, 1)[0]), 1.0)
+            c = max(float(np.min(runs - k * calls)), 0.0)
+            fit = (float(a), float(b), k, c)
+        self._fits[pair] = fit
+        return fit
+
+    def call_time(
+        self, algorithm: str, case: str, size: int
+    ) -> Optional[float]:
+        """Предсказанное время одного вызова поиска, с."""
+        fit = self._fit((algorithm, case))
+        if fit is None:
+            return None
+        a, b, _, _ = fit
+        return a * size ** b
+
+    def run_time(
+        self, algorithm: str, case: str, size: int
+    ) -> Optional[float]:
+        """Предсказанное время одного запуска замера, с."""
+        fit = self._fit((algorithm, case))
+        if fit is None:
+            return None
+        _, _, k, c = fit
+        return c + k * self.call_time(algorithm, case, size)
+
+
+def pilot_cells(
+    model: CostModel, cells: Iterable[Cell], sizes: List[int]
+) -> List[Cell]:
+    """Ячейки наименьших размеров для пар, по которым модели ещё нет."""
+    smallest = set(sorted(sizes)[:PILOT_SIZES])
+    return [
+        cell for cell in cells
+        if cell[2] in smallest and model.call_time(*cell) is None
+    ]
+
+
+def plan_cell(
+    model: CostModel,
+    cell: Cell,
+    n_runs: int,
+    cell_budget: Optional[float] = None,
+    timeout: float = 5.0,
+    in_process: bool = False
+) -> dict:
+    """План ячейки: action — run, downsample (меньше запусков), skip
+    (не укладывается в бюджет даже с MIN_RUNS) или unknown (нет модели).
+
+    При in_process запуски идут в текущем процессе без таймаута, поэтому
+    ячейка с оценкой вызова больше timeout пропускается (reason timeout).
+    """
+    call = model.call_time(*cell)
+    if call is None:
+        return {"action": "unknown", "n_runs": n_runs, "timeout": timeout,
+                "predicted_seconds": None}
+    per_run = model.run_time(*cell)
+    plan = {
+        "action": "run",
+        "n_runs": n_runs,
+        "timeout": max(timeout, TIMEOUT_MARGIN * call),
+        "predicted_call": call
+    }
+    if in_process and call > timeout:
+        plan.update(action="skip", n_runs=0, reason="timeout")
+    elif cell_budget is not None and n_runs * per_run > cell_budget:
+        affordable = int(cell_budget // per_run)
+        if affordable < MIN_RUNS:
+            plan.update(action="skip", n_runs=0, reason="budget")
+        else:
+            plan["action"] = "downsample"
+            plan["n_runs"] = affordable
+    plan["predicted_seconds"] = plan["n_runs"] * per_run
+    return plan
+
+
+def format_plan(plans: Dict[Cell, dict]) -> str:
+    counts: Dict[str, int] = {}
+    for plan in plans.values():
+        counts[plan["action"]] = counts.get(plan["action"], 0) + 1
+    total = sum(plan["predicted_seconds"] or 0.0 for plan in plans.values())
+    names = {"run": "полностью", "downsample": "с меньшим числом запусков",
+             "skip": "пропуск", "unknown": "без оценки"}
+    parts = ", ".join(
+        f"{names[action]}: {counts[action]}"
+        for action in names if action in counts
+    )
+    return f"Оценка времени: {total / 60:.1f} мин ({parts})"
+
+
+def prediction_error(records: Iterable[dict]) -> Optional[float]:
+    """Медиана отношения фактического времени ячейки к предсказанному."""
+    ratios = [
+        record["cell_seconds"] / record["predicted_seconds"]
+        for record in records
+        if record.get("predicted_seconds") and record.get("cell_seconds")
+    ]
+    return float(np.median(ratios)) if ratios else None
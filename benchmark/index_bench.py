@@ -0,0 +1,198 @@
+"""
+Модуль index_bench.py: Индекс q-грамм против прохода по всем документам.
+
+Для каждого размера коллекции замеряются построение индекса, размер
+буфера списков и файла, загрузка через mmap и задержка запросов
+(медиана по запросам) к загруженному индексу в сравнении с проходом
+тем же алгоритмом по всем документам. Половина паттернов взята из
+документов, половина — случайные (обычно без вхождений). Проход по всем
+документам на больших коллекциях долог, поэтому, если он дольше
+--budget секунд на запрос, он выполняется на части коллекции, а время
+масштабируется (помечается «~»).
+
+Пример:
+    python -m benchmark.index_bench --documents 10000 1000000 -q 3 \\
+        --pattern-lengths 8 32
+"""
+import os
+import time
+import random
+import string
+import argparse
+import tempfile
+import statistics
+from typing import List, Optional, Tuple
+
+from src.qgram_index import QGramIndex, scan_all, DEFAULT_Q
+from src.registry import engines
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Сравнивает поиск по индексу q-грамм с проходом "
+                    "по всем документам коллекции."
+    )
+    parser.add_argument(
+        "--documents",
+        type=int,
+        nargs="+",
+        default=[10000, 100000],
+        help="Размеры коллекции (по умолчанию: 10000 100000)"
+    )
+    parser.add_argument(
+        "--doc-length",
+        type=int,
+        default=100,
+        help="Средняя длина документа (по умолчанию: 100)"
+    )
+    parser.add_argument(
+        "-q",
+        type=int,
+        default=DEFAULT_Q,
+        help=f"Длина q-граммы (по умолчанию: {DEFAULT_Q})"
+    )
+    parser.add_argument(
+        "-a", "--algorithm",
+        choices=sorted(engines(streaming=True, multi_pattern=False)),
+        default="boyer_moore",
+        help="Алгоритм проверки кандидатов (по умолчанию: boyer_moore)"
+    )
+    parser.add_argument(
+        "--pattern-lengths",
+        type=int,
+        nargs="+",
+        default=[4, 8, 16],
+        help="Длины паттернов (по умолчанию: 4 8 16)"
+    )
+    parser.add_argument(
+        "--queries",
+        type=int,
+        default=20,
+        help="Запросов на длину паттерна (по умолчанию: 20)"
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=2.0,
+        help="Предел времени прохода по всем документам на запрос, с "
+             "(по умолчанию: 2)"
+    )
+    return parser.parse_args(argv)
+
+
+def make_collection(
+    count: int, doc_length: int = 100, seed: int = 0
+) -> List[str]:
+    """count документов длины doc_length / 2 .. 3 * doc_length / 2
+    из строчных латинских букв."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_lowercase
+    return [
+        "".join(rng.choices(
+            alphabet, k=rng.randint(doc_length // 2, 3 * doc_length // 2)
+        ))
+        for _ in range(count)
+    ]
+
+
+def make_queries(
+    documents: List[str], length: int, count: int, seed: int = 0
+) -> List[str]:
+    rng = random.Random(seed)
+    queries = []
+    for i in range(count):
+        document = rng.choice(documents)
+        if i % 2 == 0 and len(document) >= length:
+            pos = rng.randint(0, len(document) - length)
+            queries.append(document[pos:pos + length])
+        else:
+            queries.append(
+                "".join(rng.choices(string.ascii_lowercase, k=length))
+            )
+    return queries
+
+
+def _timed(func, *args) -> Tuple[float, object]:
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def measure_cell(
+    count: int,
+    doc_length: int = 100,
+    q: int = DEFAULT_Q,
+    algorithm: str = "boyer_moore",
+    pattern_lengths: Tuple[int, ...] = (4, 8, 16),
+    queries: int = 20,
+    budget: float = 2.0
+) -> dict:
+    documents = make_collection(count, doc_length)
+    row = {"documents": count, "q": q, "algorithm": algorithm}
+    row["build_time"], index = _timed(QGramIndex.build, documents, q)
+    row["postings_bytes"] = index.nbytes
+    row["grams"] = len(index.directory)
+    row["text_bytes"] = sum(len(document) for document in documents)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.qgram")
+        row["file_bytes"] = index.save(path)
+        row["load_time"], loaded = _timed(QGramIndex.load, path)
+        with loaded:
+            for length in pattern_lengths:
+                latencies, candidates, hits = [], [], 0
+                for pattern in make_queries(documents, length, queries):
+                    elapsed, found = _timed(
+                        loaded.search, documents, pattern, algorithm
+                    )
+                    latencies.append(elapsed)
+                    candidates.append(len(loaded.candidates(pattern)))
+                    hits += len(found)
+                row[f"query_{length}"] = statistics.median(latencies)
+                row[f"candidates_{length}"] = statistics.median(candidates)
+                row[f"hits_{length}"] = hits
+
+                # Проход без индекса: оценка по первому документу
+                pattern = make_queries(documents, length, 1)[0]
+                probe, _ = _timed(scan_all, documents, pattern, algorithm, 1)
+                sample = count
+                if probe * count > budget:
+                    sample = max(1, int(budget / max(probe, 1e-9)))
+                elapsed, found = _timed(
+                    scan_all, documents, pattern, algorithm, sample
+                )
+                row[f"scan_{length}"] = elapsed * count / sample
+                row[f"scan_{length}_estimated"] = sample < count
+                if sample == count and found != loaded.search(
+                    documents, pattern, algorithm
+                ):
+                    raise AssertionError("Индекс: вхождения не совпадают")
+    return row
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    print(f"q = {args.q}, проверка: {args.algorithm}")
+    for count in args.documents:
+        row = measure_cell(
+            count, args.doc_length, args.q, args.algorithm,
+            tuple(args.pattern_lengths), args.queries, args.budget
+        )
+        print(f"\nДокументов: {count}, текст {row['text_bytes'] / 1e6:.1f} "
+              f"МБ, q-грамм: {row['grams']}")
+        print(f"  построение {row['build_time']:.2f} с, списки "
+              f"{row['postings_bytes'] / 1e6:.1f} МБ, файл "
+              f"{row['file_bytes'] / 1e6:.1f} МБ, загрузка "
+              f"{row['load_time'] * 1e3:.1f} мс")
+        print(f"{'m':>6}{'Кандидатов':>12}{'Индекс, мс':>12}"
+              f"{'Проход, мс':>14}{'Ускорение':>11}")
+        for length in args.pattern_lengths:
+            query, scan = row[f"query_{length}"], row[f"scan_{length}"]
+            mark = "~" if row[f"scan_{length}_estimated"] else " "
+            print(f"{length:>6}{row[f'candidates_{length}']:>12.0f}"
+                  f"{query * 1e3:>12.3f}{mark:>5}{scan * 1e3:>9.3f}"
+                  f"{scan / query if query else float('inf'):>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Модуль interleave.py: Чередующийся замер нескольких алгоритмов.
+
+При обычном порядке все размеры одного алгоритма замеряются подряд,
+поэтому изменения частоты CPU, троттлинг и фоновая нагрузка приходятся
+на разные алгоритмы в разное время. Здесь ячейки одной группы (случай
+и размер) замеряются раундами: в каждом раунде каждый алгоритм
+запускается один раз, в случайном порядке, и дрейф условий делится между
+алгоритмами поровну. Замеры идут в текущем процессе после прогрева.
+
+К каждому замеру записываются нагрузка (loadavg за минуту) и частота
+CPU. Ячейка помечается нестабильной (unstable), если частота менялась
+больше чем на FREQ_TOLERANCE или фоновая нагрузка — loadavg без
+собственного процесса замеров — превышала LOAD_LIMIT на ядро.
+"""
+import os
+import glob
+import time
+import random
+import statistics
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+FREQ_TOLERANCE = 0.05
+LOAD_LIMIT = 0.5
+
+_FREQ_FILES = "/sys/devices/system/cpu/cpu[0-9]*/cpufreq/scaling_cur_freq"
+
+
+def cpu_frequency() -> Optional[float]:
+    """Средняя текущая частота ядер, МГц, или None."""
+    values = []
+    for path in glob.glob(_FREQ_FILES):
+        try:
+            with open(path, encoding="ascii") as f:
+                values.append(int(f.read()) / 1000)
+        except (OSError, ValueError):
+            pass
+    if not values:
+        # Без cpufreq (часто в виртуальных машинах) — /proc/cpuinfo
+        try:
+            with open("/proc/cpuinfo", encoding="utf-8") as f:
+                values = [
+                    float(line.split(":", 1)[1])
+                    for line in f if line.startswith("cpu MHz")
+                ]
+        except (OSError, ValueError):
+            return None
+    return statistics.mean(values) if values else None
+
+
+def load_average() -> Optional[float]:
+    try:
+        return os.getloadavg()[0]
+    except (AttributeError, OSError):
+        # Нет в Windows
+        return None
+
+
+def measure_interleaved(
+    calls: Dict[Hashable, Tuple[Callable, tuple]],
+    runs: Dict[Hashable, int],
+    seed: Optional[int] = None
+) -> Dict[Hashable, Dict[str, List[Optional[float]]]]:
+    """Раунды по одному запуску каждого вызова в случайном порядке, пока
+    вызов name не наберёт runs[name] замеров.
+
+    Возвращает {name: {"time": [...], "load": [...], "cpu_mhz": [...]}};
+    нагрузка и частота снимаются перед каждым запуском.
+    """
+    rng = random.Random(seed)
+    samples = {
+        name: {"time": [], "load": [], "cpu_mhz": []} for name in calls
+    }
+    active = [name for name in calls if runs[name] > 0]
+    while active:
+        rng.shuffle(active)
+        for name in active:
+            func, args = calls[name]
+            samples[name]["load"].append(load_average())
+            samples[name]["cpu_mhz"].append(cpu_frequency())
+            started = time.perf_counter()
+            func(*args)
+            samples[name]["time"].append(time.perf_counter() - started)
+        active = [
+            name for name in active
+            if len(samples[name]["time"]) < runs[name]
+        ]
+    return samples
+
+
+def stability(
+    load: List[Optional[float]], cpu_mhz: List[Optional[float]]
+) -> dict:
+    """Сводка условий замеров ячейки и признак нестабильности."""
+    cpus = os.cpu_count() or 1
+    summary: dict = {"unstable_reason": []}
+    loads = [value for value in load if value is not None]
+    if loads:
+        summary["load_mean"] = statistics.mean(loads)
+        summary["load_max"] = max(loads)
+        # Процесс замеров сам занимает одно ядро
+        if (max(loads) - 1.0) / cpus > LOAD_LIMIT:
+            summary["unstable_reason"].append("load")
+    freqs = [value for value in cpu_mhz if value is not None]
+    if freqs:
+        summary["cpu_mhz_min"] = min(freqs)
+        summary["cpu_mhz_max"] = max(freqs)
+        spread = (max(freqs) - min(freqs)) / statistics.median(freqs)
+        summary["cpu_mhz_spread"] = spread
+        if spread > FREQ_TOLERANCE:
+            summary["unstable_reason"].append("frequency")
+    summary["unstable"] = bool(summary["unstable_reason"])
+    summary["unstable_reason"] = ",".join(summary["unstable_reason"])
+    return summary
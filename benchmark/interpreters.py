@@ -0,0 +1,314 @@
+"""
+Модуль interpreters.py: Одни и те же ячейки под несколькими
+интерпретаторами Python и таблица ускорения.
+
+Находит установленные интерпретаторы (python3, python3.X, pypy3, ...
+в PATH и заданные опцией --interpreters), под каждым в отдельном
+процессе выполняет benchmark.cell_worker и дописывает записи в общее
+хранилище. Ключ записи включает версию интерпретатора (python_version),
+поэтому уже измеренные ячейки при повторном запуске пропускаются.
+Затем печатается таблица ускорения относительно базового интерпретатора
+(среднее геометрическое по размерам), отставание от эталона на C под
+каждым интерпретатором и строится график.
+
+Пример:
+    python -m benchmark.interpreters -a kmp boyer_moore --sizes 1024 65536
+"""
+import os
+import sys
+import json
+import shutil
+import argparse
+import subprocess
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from analysis.plot_interpreters import plot_speedups
+from benchmark.baseline import (
+    DEFAULT_BASELINE, reference_names, gap_table, format_gap
+)
+from benchmark.results_store import ResultsStore, cpu_model, engine_version
+from src.data_generator import TestDataGenerator
+from src.registry import engines, get_engine
+
+ALGORITHMS = sorted(engines(multi_pattern=False, reference=False))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CANDIDATES = (
+    ["python3"] + [f"python3.{minor}" for minor in range(6, 16)]
+    + ["pypy3"] + [f"pypy3.{minor}" for minor in range(6, 16)]
+)
+
+_PROBE = (
+    "import json, platform, sys; print(json.dumps({"
+    "'implementation': platform.python_implementation(), "
+    "'version': platform.python_version(), "
+    "'executable': sys.executable}))"
+)
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Сравнивает алгоритмы под несколькими "
+                    "интерпретаторами Python."
+    )
+    parser.add_argument(
+        "--interpreters",
+        nargs="+",
+        default=None,
+        help="Имена или пути интерпретаторов (по умолчанию: поиск в PATH)"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=None,
+        help="Базовый интерпретатор: путь или версия, например "
+             "'CPython 3.11.7' (по умолчанию: текущий)"
+    )
+    parser.add_argument(
+        "-a", "--algorithms",
+        nargs="+",
+        choices=ALGORITHMS,
+        default=ALGORITHMS,
+        help="Алгоритмы (по умолчанию: все)"
+    )
+    parser.add_argument(
+        "--baseline-engine",
+        choices=reference_names(),
+        default=DEFAULT_BASELINE,
+        help="Эталон на C, замеряемый на данных каждой ячейки "
+             f"(по умолчанию: {DEFAULT_BASELINE})"
+    )
+    parser.add_argument(
+        "-c", "--cases",
+        nargs="+",
+        choices=["best", "worst", "random"],
+        default=["best", "worst", "random"],
+        help="Случаи (по умолчанию: все)"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=TestDataGenerator().sizes[:7],
+        help="Размеры (по умолчанию: 1 КБ — 64 КБ)"
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=11,
+        help="Замеров на ячейку после прогрева (по умолчанию: 11)"
+    )
+    parser.add_argument(
+        "--cell-budget",
+        type=float,
+        default=10.0,
+        help="Лимит времени замеров одной ячейки, с (по умолчанию: 10)"
+    )
+    parser.add_argument(
+        "-r", "--results",
+        default="results/interpreters.jsonl",
+        help="Хранилище результатов "
+             "(по умолчанию: results/interpreters.jsonl)"
+    )
+    parser.add_argument(
+        "--plot",
+        default="results/interpreter_speedup.png",
+        help="Файл графика (по умолчанию: results/interpreter_speedup.png)"
+    )
+    return parser.parse_args(argv)
+
+
+def probe(name: str) -> Optional[dict]:
+    """Реализация, версия и исполняемый файл интерпретатора или None."""
+    path = shutil.which(name)
+    if path is None:
+        return None
+    try:
+        completed = subprocess.run(
+            [path, "-c", _PROBE], capture_output=True, text=True,
+            timeout=30, check=True
+        )
+        info = json.loads(completed.stdout)
+    except (OSError, ValueError, subprocess.SubprocessError):
+        return None
+    info["python_version"] = f"{info['implementation']} {info['version']}"
+    return info
+
+
+def discover_interpreters(names: Optional[Sequence[str]] = None) -> List[dict]:
+    """Работающие интерпретаторы без повторов (по исполняемому файлу)
+    в порядке реализации и версии."""
+    found: Dict[str, dict] = {}
+    for name in [sys.executable, *(names or CANDIDATES)]:
+        info = probe(name)
+        if info is not None:
+            found.setdefault(os.path.realpath(info["executable"]), info)
+    return sorted(found.values(), key=lambda info: (
+        info["implementation"],
+        tuple(int(part) for part in info["version"].split(".")[:3]
+              if part.isdigit())
+    ))
+
+
+def engine_versions(names) -> Dict[str, str]:
+    return {
+        name: engine_version(get_engine(name).search)
+        for name in names
+    }
+
+
+def missing_cells(
+    store: ResultsStore, info: dict, cells: Sequence[Tuple[str, str, int]]
+) -> List[Tuple[str, str, int]]:
+    cpu = cpu_model()
+    versions = engine_versions({cell[0] for cell in cells})
+    return [
+        cell for cell in cells
+        if ResultsStore.key({
+            "algorithm": cell[0], "case": cell[1], "size": cell[2],
+            "engine_version": versions[cell[0]],
+            "python_version": info["python_version"], "cpu_model": cpu
+        }) not in store
+    ]
+
+
+def run_interpreter(
+    info: dict,
+    cells: Sequence[Tuple[str, str, int]],
+    store: ResultsStore,
+    runs: int = 11,
+    cell_budget: float = 10.0,
+    baseline: str = DEFAULT_BASELINE
+) -> int:
+    """Замеряет cells под интерпретатором info, дописывая записи в store
+    по мере готовности; возвращает число записанных ячеек."""
+    request = {
+        "cells": [list(cell) for cell in cells],
+        "runs": runs,
+        "cell_budget": cell_budget,
+        "baseline": baseline
+    }
+    proc = subprocess.Popen(
+        [info["executable"], "-m", "benchmark.cell_worker"],
+        cwd=ROOT, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE, text=True
+    )
+    proc.stdin.write(json.dumps(request))
+    proc.stdin.close()
+    written = 0
+    for line in proc.stdout:
+        store.append(json.loads(line))
+        written += 1
+    error = proc.stderr.read().strip()
+    if proc.wait() != 0:
+        reason = error.splitlines()[-1] if error else (
+            f"код возврата {proc.returncode}"
+        )
+        print(f"{info['python_version']}: ошибка рабочего процесса: "
+              f"{reason}", file=sys.stderr)
+    return written
+
+
+def speedup_table(
+    records: Sequence[dict], baseline: str
+) -> Dict[Tuple[str, str], Dict[str, float]]:
+    """{(алгоритм, случай): {интерпретатор: ускорение}} — среднее
+    геометрическое по размерам отношения времени базового интерпретатора
+    ко времени данного (больше 1 — быстрее базового)."""
+    times: Dict[Tuple[str, str, int], Dict[str, float]] = {}
+    for record in records:
+        cell = (record["algorithm"], record["case"], record["size"])
+        times.setdefault(cell, {})[record["python_version"]] = record["time"]
+
+    ratios: Dict[Tuple[str, str], Dict[str, List[float]]] = {}
+    for (algorithm, case, _), by_version in times.items():
+        base = by_version.get(baseline)
+        if not base:
+            continue
+        for version, value in by_version.items():
+            if value > 0:
+                ratios.setdefault((algorithm, case), {}).setdefault(
+                    version, []
+                ).append(base / value)
+    return {
+        pair: {
+            version: float(np.exp(np.mean(np.log(values))))
+            for version, values in by_version.items()
+        }
+        for pair, by_version in ratios.items()
+    }
+
+
+def format_table(
+    table: Dict[Tuple[str, str], Dict[str, float]], versions: List[str]
+) -> str:
+    lines = [f"{'Алгоритм':<22}{'Случай':<8}"
+             + "".join(f"{version:>16}" for version in versions)]
+    for algorithm, case in sorted(table):
+        row = table[(algorithm, case)]
+        lines.append(f"{algorithm:<22}{case:<8}" + "".join(
+            f"{row[version]:>15.2f}x" if version in row else f"{'—':>16}"
+            for version in versions
+        ))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    interpreters = discover_interpreters(args.interpreters)
+    print("Интерпретаторы: " + ", ".join(
+        f"{info['python_version']} ({info['executable']})"
+        for info in interpreters
+    ))
+    if args.baseline is None:
+        baseline = probe(sys.executable)["python_version"]
+    else:
+        info = probe(args.baseline)
+        baseline = info["python_version"] if info else args.baseline
+
+    store = ResultsStore(args.results)
+    cells = [
+        (algorithm, case, size)
+        for algorithm in args.algorithms
+        for case in args.cases
+        for size in args.sizes
+    ]
+    for info in interpreters:
+        pending = missing_cells(store, info, cells)
+        print(f"{info['python_version']}: ячеек к замеру {len(pending)}")
+        if pending:
+            run_interpreter(
+                info, pending, store, args.runs, args.cell_budget,
+                args.baseline_engine
+            )
+
+    versions = [info["python_version"] for info in interpreters]
+    current = engine_versions(args.algorithms)
+    selected = set(cells)
+    # Только текущие версии алгоритмов и выбранные интерпретаторы
+    records = [
+        record for record in store.select({"cpu_model": cpu_model()})
+        if (record["algorithm"], record["case"], record["size"]) in selected
+        and record["engine_version"] == current[record["algorithm"]]
+        and record["python_version"] in versions
+    ]
+    table = speedup_table(records, baseline)
+    print(f"Ускорение относительно {baseline}:")
+    print(format_table(table, versions))
+    for version in versions:
+        gap = gap_table(
+            record for record in records
+            if record["python_version"] == version
+            and record.get("baseline") == args.baseline_engine
+        )
+        if gap:
+            print(f"{version}. " + format_gap(gap, args.baseline_engine))
+    if table:
+        plot_speedups(table, versions, baseline, args.plot)
+        print(f"График: {args.plot}")
+
+
+if __name__ == "__main__":
+    main()
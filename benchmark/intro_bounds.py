@@ -0,0 +1,118 @@
+"""
+Модуль intro_bounds.py: Проверка границ интроспективного поиска.
+
+Сравнивает intro с Бойером-Муром и KMP на двух случаях генератора:
+    worst  — худший случай Бойера-Мура: сравнений у него порядка n * m,
+             у intro (как у KMP) — порядка n;
+    random — обычные данные: intro не переключается на KMP и совпадает
+             с Бойером-Муром по числу сравнений и времени.
+Для каждой пары (случай, алгоритм) выводится показатель степени роста
+числа сравнений по размеру текста.
+
+Пример:
+    python -m benchmark.intro_bounds --sizes 1024 4096 16384
+"""
+import time
+import random
+import argparse
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from analysis.power_fit import power_fit_curve
+from src.algorithms import boyer_moore_search, intro_search, kmp_search
+from src.data_generator import TestDataGenerator
+from src.instrumented import INSTRUMENTED
+
+ENGINES = {
+    "boyer_moore": boyer_moore_search,
+    "kmp": kmp_search,
+    "intro": intro_search
+}
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Сравнивает рост числа сравнений и времени intro, "
+                    "Бойера-Мура и KMP на худшем и случайном случаях."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[2**i for i in range(10, 15)],
+        help="Размеры текста (по умолчанию: 2^10 — 2^14)"
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=3,
+        help="Запусков для замера времени, берётся минимум (по умолчанию: 3)"
+    )
+    return parser.parse_args(argv)
+
+
+def _best_time(func, text: str, pattern: str, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        func(text, pattern)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def measure_bounds(sizes: List[int], runs: int = 3) -> List[dict]:
+    """Строки отчёта: случай, размер, алгоритм, сравнения, время."""
+    generator = TestDataGenerator()
+    random.seed(0)
+    rows = []
+    for case in ("worst", "random"):
+        for size in sizes:
+            text, pattern = generator.generate_case("intro", case, size)
+            for name, func in ENGINES.items():
+                index, counters = INSTRUMENTED[name](text, pattern)
+                rows.append({
+                    "case": case,
+                    "size": size,
+                    "algorithm": name,
+                    "comparisons": counters["comparisons"],
+                    "fallbacks": counters.get("fallbacks", 0),
+                    "time": _best_time(func, text, pattern, runs)
+                })
+    return rows
+
+
+def growth_exponents(rows: List[dict]) -> Dict[Tuple[str, str], float]:
+    """Показатель b в аппроксимации comparisons ≈ a * size^b."""
+    exponents = {}
+    for key in {(row["case"], row["algorithm"]) for row in rows}:
+        cells = [
+            row for row in rows if (row["case"], row["algorithm"]) == key
+        ]
+        if len(cells) < 2:
+            continue
+        (_, b), _ = power_fit_curve(
+            np.array([row["size"] for row in cells], dtype=float),
+            np.array([max(row["comparisons"], 1) for row in cells],
+                     dtype=float)
+        )
+        exponents[key] = b
+    return exponents
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    rows = measure_bounds(args.sizes, args.runs)
+    print(f"{'Случай':<8}{'Размер':>10}  {'Алгоритм':<14}"
+          f"{'Сравнений/n':>12}{'Время, с':>12}{'Откат':>7}")
+    for row in rows:
+        print(f"{row['case']:<8}{row['size']:>10}  {row['algorithm']:<14}"
+              f"{row['comparisons'] / row['size']:>12.2f}"
+              f"{row['time']:>12.4g}{row['fallbacks']:>7}")
+    print("Показатель роста числа сравнений:")
+    for (case, name), b in sorted(growth_exponents(rows).items()):
+        print(f"  {case:<8}{name:<14}n^{b:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,30 @@
-import math
-import statistics
 import tracemalloc
-from typing import Callable, Tuple, Dict, List
+from typing import Callable, Tuple, Dict, List, Optional
+from benchmark.stats import (
+    confidence_interval, sequential_sample, student_t_quantile
+)
 
 
 class MemoryMeasurer:
     def __init__(self):
-        self.t_table: Dict[int, float] = {
-            6: 2.5706,
-            11: 2.2281,
-            16: 2.1314,
-            21: 2.0860,
-            26: 2.0555,
-            31: 2.0423,
-            36: 2.0301,
-            41: 2.0211,
-            51: 2.0086,
-            101: 1.9840
-        }
+        # Сырые замеры последнего вызова measure / measure_sequential
+        self.samples: List[float] = []
 
     def _get_t_value(self, n: int) -> float:
-        valid_keys = [k for k in self.t_table if k <= n]
-        if not valid_keys:
+        if n < 6:
             raise ValueError("Слишком малое количество запусков. Минимум: 6")
-        return self.t_table[max(valid_keys)]
+        return student_t_quantile(0.975, n - 1)
+
+    def _mean_delta(self, values: List[float]) -> Tuple[float, float]:
+        # Тот же интервал, что и при последовательной выборке
+        return confidence_interval(values)
+
+    def _run_once(self, func: Callable, args: Tuple) -> int:
+        tracemalloc.start()
+        func(*args)
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return peak
 
     def measure(
         self,
@@ -34,18 +35,67 @@ class MemoryMeasurer:
         if n_runs < 6:
             raise ValueError("Количество запусков должно быть не менее 6.")
 
-        usages: List[int] = []
+        usages: List[int] = [
+            self._run_once(func, args) for _ in range(n_runs)
+        ]
+        self.samples = usages
+
+        return self._mean_delta(usages)
 
-        for _ in range(n_runs):
-            tracemalloc.start()
-            func(*args)
-            current, peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            usages.append(peak)
+    def _phases_once(
+        self, preprocess: Callable, scan: Callable, text: str, pattern: str
+    ) -> Tuple[int, int]:
+        """Пик предобработки и пик прохода сверх памяти, занятой
+        таблицами."""
+        tracemalloc.start()
+        tables = preprocess(pattern)
+        retained, preprocess_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        scan(text, pattern, tables)
+        current, scan_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return preprocess_peak, scan_peak - retained
 
-        mean_usage = statistics.mean(usages)
-        std_dev = statistics.stdev(usages)
-        t_value = self._get_t_value(n_runs)
-        delta = t_value * (std_dev / math.sqrt(n_runs))
+    def measure_phases(
+        self,
+        preprocess: Callable,
+        scan: Callable,
+        text: str,
+        pattern: str,
+        n_runs: int = 101
+    ) -> Dict[str, Tuple[float, float]]:
+        if n_runs < 6:
+            raise ValueError("Количество запусков должно быть не менее 6.")
 
-        return mean_usage, delta
+        runs = [
+            self._phases_once(preprocess, scan, text, pattern)
+            for _ in range(n_runs)
+        ]
+        return {
+            "preprocess": self._mean_delta([run[0] for run in runs]),
+            "scan": self._mean_delta([run[1] for run in runs])
+        }
+
+    def measure_sequential(
+        self,
+        func: Callable,
+        args: Tuple,
+        target_ci: float = 0.05,
+        min_runs: int = 6,
+        max_runs: int = 1000,
+        time_budget: Optional[float] = None
+    ) -> Dict[str, object]:
+        if min_runs < 6:
+            raise ValueError("Количество запусков должно быть не менее 6.")
+        usages, stop_reason = sequential_sample(
+            lambda: self._run_once(func, args),
+            target_ci, min_runs, max_runs, time_budget
+        )
+        self.samples = usages
+        mean_usage, delta = confidence_interval(usages)
+        return {
+            "mean": mean_usage,
+            "delta": delta,
+            "n_runs": len(usages),
+            "stop_reason": stop_reason
+        }
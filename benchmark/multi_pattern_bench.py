@@ -0,0 +1,147 @@
+"""
+Модуль multi_pattern_bench.py: Сравнение многопаттерновых алгоритмов
+с поиском каждого паттерна отдельно.
+
+Для каждого размера словаря и минимальной длины паттерна замеряются
+Wu-Manber, Commentz-Walter и цикл boyer_moore_search по паттернам.
+Цикл по паттернам на больших словарях не укладывается в разумное время,
+поэтому, если оценка превышает --budget секунд, он выполняется на части
+словаря, а время масштабируется на весь словарь (помечается «~»).
+
+Пример:
+    python -m benchmark.multi_pattern_bench --dict-sizes 10 1000 \\
+        --min-lengths 8 32 --text-size 65536
+"""
+import time
+import random
+import string
+import argparse
+from typing import List, Optional, Sequence, Tuple
+
+from src.algorithms import boyer_moore_preprocess, boyer_moore_scan
+from src.multi_pattern import MULTI_PHASES, Hit
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Сравнивает Wu-Manber и Commentz-Walter с поиском "
+                    "паттернов по одному (Boyer-Moore)."
+    )
+    parser.add_argument(
+        "--dict-sizes",
+        type=int,
+        nargs="+",
+        default=[10, 100, 1000, 10000, 100000],
+        help="Размеры словаря (по умолчанию: 10 — 100000)"
+    )
+    parser.add_argument(
+        "--min-lengths",
+        type=int,
+        nargs="+",
+        default=[4, 8, 16, 32],
+        help="Минимальные длины паттернов (по умолчанию: 4 8 16 32)"
+    )
+    parser.add_argument(
+        "--text-size",
+        type=int,
+        default=1 << 18,
+        help="Длина текста (по умолчанию: 262144)"
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=5.0,
+        help="Предел времени цикла по паттернам на ячейку, с "
+             "(по умолчанию: 5)"
+    )
+    return parser.parse_args(argv)
+
+
+def make_dictionary(
+    count: int, min_length: int, text_size: int, seed: int = 0
+) -> Tuple[str, List[str]]:
+    """Словарь из count паттернов длины min_length..2 * min_length
+    и текст, в который вставлены вхождения части из них."""
+    rng = random.Random(seed)
+    alphabet = string.ascii_lowercase
+    patterns = [
+        "".join(rng.choices(
+            alphabet, k=rng.randint(min_length, 2 * min_length)
+        ))
+        for _ in range(count)
+    ]
+    text = list(rng.choices(alphabet, k=text_size))
+    for _ in range(min(100, count)):
+        pattern = rng.choice(patterns)
+        if len(pattern) <= text_size:
+            pos = rng.randint(0, text_size - len(pattern))
+            text[pos:pos + len(pattern)] = pattern
+    return "".join(text), patterns
+
+
+def per_pattern_boyer_moore(text: str, patterns: Sequence[str]) -> List[Hit]:
+    """Все вхождения каждого паттерна повторным boyer_moore_scan."""
+    hits = []
+    for pattern_id, pattern in enumerate(patterns):
+        tables = boyer_moore_preprocess(pattern)
+        pos = boyer_moore_scan(text, pattern, tables)
+        while pos != -1:
+            hits.append((pattern_id, pos))
+            pos = boyer_moore_scan(text, pattern, tables, pos + 1)
+    hits.sort(key=lambda hit: (hit[1], hit[0]))
+    return hits
+
+
+def _timed(func, *args) -> Tuple[float, object]:
+    started = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - started, result
+
+
+def measure_cell(
+    count: int, min_length: int, text_size: int, budget: float = 5.0
+) -> dict:
+    text, patterns = make_dictionary(count, min_length, text_size)
+    row = {"dict_size": count, "min_length": min_length}
+    hits = None
+    for name, (preprocess, scan) in MULTI_PHASES.items():
+        preprocess_time, tables = _timed(preprocess, patterns)
+        scan_time, found = _timed(scan, text, patterns, tables)
+        row[f"{name}_preprocess"] = preprocess_time
+        row[f"{name}_scan"] = scan_time
+        row[name] = preprocess_time + scan_time
+        if hits is not None and found != hits:
+            raise AssertionError(f"{name}: вхождения не совпадают")
+        hits = found
+    row["hits"] = len(hits)
+
+    # Оценка цикла по первому паттерну; при превышении бюджета — выборка
+    probe, _ = _timed(per_pattern_boyer_moore, text, patterns[:1])
+    sample = count
+    if probe * count > budget:
+        sample = max(1, min(count, int(budget / max(probe, 1e-9))))
+    elapsed, found = _timed(per_pattern_boyer_moore, text, patterns[:sample])
+    row["boyer_moore_loop"] = elapsed * count / sample
+    row["boyer_moore_estimated"] = sample < count
+    if sample == count and found != hits:
+        raise AssertionError("boyer_moore_loop: вхождения не совпадают")
+    return row
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    print(f"Текст: {args.text_size} символов")
+    print(f"{'Словарь':>8}{'m_min':>7}{'Wu-Manber':>12}"
+          f"{'C-Walter':>12}{'BM по одному':>15}{'Вхождений':>11}")
+    for min_length in args.min_lengths:
+        for count in args.dict_sizes:
+            row = measure_cell(count, min_length, args.text_size, args.budget)
+            mark = "~" if row["boyer_moore_estimated"] else " "
+            print(f"{count:>8}{min_length:>7}"
+                  f"{row['wu_manber']:>12.4f}{row['commentz_walter']:>12.4f}"
+                  f"{mark:>6}{row['boyer_moore_loop']:>9.4f}"
+                  f"{row['hits']:>11}")
+
+
+if __name__ == "__main__":
+    main()
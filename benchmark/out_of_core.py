@@ -0,0 +1,361 @@
+"""
+Модуль out_of_core.py: Уровень больших входов (64 МБ — 4 ГБ), которые
+не помещаются в кеши процессора, а при холодном запуске — и в page cache.
+
+Текст ячейки пишется на диск частями (TestDataGenerator.write_case)
+и ни в каком режиме не собирается в одну строку str:
+    mmap    — алгоритм проходит по отображённому файлу напрямую, символы
+              текста — целые (байты), паттерн передаётся как bytes;
+    chunked — файл читается блоками по --block-size байт, блок
+              декодируется в str (latin-1) и перекрывается с предыдущим
+              на m - 1 символ; поиск останавливается на первом вхождении.
+Алгоритмы без возможности bytes_input (src/registry.py), которым нужна
+именно строка (ord(text[i])), в режиме mmap помечаются как неспособные
+работать вне памяти и пропускаются. Каждая ячейка выполняется в отдельном
+процессе: замеряются время, пропускная способность по просмотренным
+байтам, пиковый RSS и его прирост за время поиска. С --cold страницы
+файла перед запуском вытесняются из page cache (posix_fadvise).
+
+Пример:
+    python -m benchmark.out_of_core -a kmp boyer_moore -c worst \\
+        --sizes 67108864 268435456 --mode mmap chunked --cold
+"""
+import os
+import sys
+import json
+import mmap
+import time
+import argparse
+import tempfile
+import multiprocessing
+from typing import Dict, List, Optional, Tuple
+
+from benchmark.results_store import environment
+from src.algorithms import PHASES
+from src.data_generator import TestDataGenerator
+from src.registry import get_engine
+
+MODES = ("mmap", "chunked")
+
+DEFAULT_BLOCK_SIZE = 16 << 20
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    generator = TestDataGenerator()
+    parser = argparse.ArgumentParser(
+        description="Замеры на больших входах, записанных на диск."
+    )
+    parser.add_argument(
+        "-a", "--algorithms",
+        nargs="+",
+        choices=sorted(PHASES),
+        default=sorted(PHASES),
+        help="Алгоритмы (по умолчанию: все)"
+    )
+    parser.add_argument(
+        "-c", "--cases",
+        nargs="+",
+        choices=["best", "worst", "random"],
+        default=["best", "worst", "random"],
+        help="Случаи (по умолчанию: все)"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=generator.large_sizes,
+        help="Размеры в байтах (по умолчанию: 64 МБ — 4 ГБ)"
+    )
+    parser.add_argument(
+        "--mode",
+        nargs="+",
+        choices=MODES,
+        default=list(MODES),
+        help="Способ подачи текста (по умолчанию: оба)"
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=DEFAULT_BLOCK_SIZE,
+        help="Размер блока для chunked, байт (по умолчанию: 16 МБ)"
+    )
+    parser.add_argument(
+        "--cold",
+        action="store_true",
+        help="Вытеснять файл из page cache перед каждым запуском"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=3600.0,
+        help="Предел времени ячейки, с (по умолчанию: 3600)"
+    )
+    parser.add_argument(
+        "--data-dir",
+        default=None,
+        help="Каталог для входных файлов (по умолчанию: временный)"
+    )
+    parser.add_argument(
+        "--keep",
+        action="store_true",
+        help="Не удалять входные файлы и использовать уже записанные"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        default="results/out_of_core.jsonl",
+        help="Файл, в который дописываются записи "
+             "(по умолчанию: results/out_of_core.jsonl)"
+    )
+    return parser.parse_args(argv)
+
+
+def _search_buffer(algorithm: str, buffer, needle: bytes) -> int:
+    preprocess, scan = PHASES[algorithm]
+    return scan(buffer, needle, preprocess(needle))
+
+
+def supports_mmap(algorithm: str) -> bool:
+    """Проходит ли алгоритм по mmap: возможность bytes_input реестра."""
+    return get_engine(algorithm).bytes_input
+
+
+def supported_modes(algorithm: str) -> List[str]:
+    """Режимы, в которых алгоритм работает без строки со всем текстом.
+    chunked доступен любому алгоритму с фазами: поиск в блоке
+    не зависит от остальной части текста."""
+    modes = ["mmap"] if supports_mmap(algorithm) else []
+    if algorithm in PHASES:
+        modes.append("chunked")
+    return modes
+
+
+def search_mmap(algorithm: str, path: str, pattern: str) -> int:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0 if not pattern else -1
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _search_buffer(algorithm, mm, pattern.encode("latin-1"))
+
+
+def search_chunked(
+    algorithm: str,
+    path: str,
+    pattern: str,
+    block_size: int = DEFAULT_BLOCK_SIZE
+) -> int:
+    """Первое вхождение pattern в файл path при чтении блоками."""
+    preprocess, scan = PHASES[algorithm]
+    tables = preprocess(pattern)
+    overlap = max(len(pattern) - 1, 0)
+    base = 0
+    tail = ""
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(block_size)
+            text = tail + data.decode("latin-1")
+            pos = scan(text, pattern, tables)
+            if pos != -1:
+                return base + pos
+            if not data:
+                return -1
+            # Хвост блока, в котором может начинаться вхождение
+            keep = min(overlap, len(text))
+            tail = text[len(text) - keep:]
+            base += len(text) - keep
+
+
+def evict(path: str) -> None:
+    """Вытесняет страницы файла из page cache (без прав root)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _rss() -> Tuple[int, int]:
+    """(текущий, пиковый) RSS процесса в байтах."""
+    values = {}
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "VmHWM"):
+                    values[key] = int(value.split()[0]) * 1024
+    except OSError:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        return peak, peak
+    return values["VmRSS"], values["VmHWM"]
+
+
+def _reset_peak_rss() -> None:
+    # Linux: «5» в clear_refs сбрасывает VmHWM до текущего RSS
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _run_cell(
+    algorithm: str,
+    mode: str,
+    path: str,
+    pattern: str,
+    block_size: int,
+    conn
+) -> None:
+    _reset_peak_rss()
+    baseline, _ = _rss()
+    started = time.perf_counter()
+    if mode == "mmap":
+        index = search_mmap(algorithm, path, pattern)
+    else:
+        index = search_chunked(algorithm, path, pattern, block_size)
+    elapsed = time.perf_counter() - started
+    _, peak = _rss()
+    conn.send({
+        "index": index, "time": elapsed,
+        "peak_rss": peak, "rss_delta": peak - baseline
+    })
+    conn.close()
+
+
+def measure_cell(
+    algorithm: str,
+    mode: str,
+    path: str,
+    pattern: str,
+    expected: int,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    cold: bool = False,
+    timeout: float = 3600.0
+) -> dict:
+    """Один поиск в отдельном процессе; expected — ответ mmap.find."""
+    size = os.path.getsize(path)
+    record = {
+        "algorithm": algorithm, "mode": mode, "size": size,
+        "pattern_length": len(pattern), "cold": cold
+    }
+    if mode not in supported_modes(algorithm):
+        record.update(out_of_core=False, reason=(
+            "алгоритму нужна строка str: символы mmap — целые"
+            if mode == "mmap" else "нет раздельных фаз"
+        ))
+        return record
+
+    if cold:
+        evict(path)
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    proc = multiprocessing.Process(
+        target=_run_cell,
+        args=(algorithm, mode, path, pattern, block_size, sender)
+    )
+    proc.start()
+    sender.close()
+    if not receiver.poll(timeout):
+        proc.terminate()
+        proc.join()
+        record.update(out_of_core=True, reason="таймаут")
+        return record
+    result = receiver.recv()
+    proc.join()
+    if result["index"] != expected:
+        raise AssertionError(
+            f"{algorithm} ({mode}): {result['index']} вместо {expected}"
+        )
+
+    scanned = size if expected == -1 else expected + len(pattern)
+    record.update(result, out_of_core=True, scanned_bytes=scanned)
+    record["mb_per_s"] = (
+        scanned / result["time"] / 1e6 if result["time"] else 0.0
+    )
+    return record
+
+
+def reference_index(path: str, pattern: str) -> int:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0 if not pattern else -1
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(pattern.encode("latin-1"))
+
+
+def prepare_input(
+    generator: TestDataGenerator,
+    algorithm: str,
+    case: str,
+    size: int,
+    data_dir: str,
+    reuse: bool = False
+) -> Tuple[str, str]:
+    """Путь к файлу ячейки и паттерн. Тексты лучшего и случайного
+    случаев общие для всех алгоритмов, худшего — свои."""
+    name = f"{algorithm}_{case}_{size}" if case == "worst" \
+        else f"{case}_{size}"
+    path = os.path.join(data_dir, f"{name}.txt")
+    pattern_path = os.path.join(data_dir, f"{name}.pattern")
+    if reuse and os.path.exists(pattern_path) \
+            and os.path.exists(path) and os.path.getsize(path) == size:
+        with open(pattern_path, encoding="ascii") as f:
+            return path, f.read()
+    pattern = generator.write_case(algorithm, case, size, path)
+    with open(pattern_path, "w", encoding="ascii") as f:
+        f.write(pattern)
+    return path, pattern
+
+
+def _format_row(record: dict) -> str:
+    head = (f"{record['algorithm']:<22}{record['mode']:<9}"
+            f"{record['case']:<8}{record['size'] >> 20:>7} МБ")
+    if not record["out_of_core"] or "time" not in record:
+        return f"{head}  — {record['reason']}"
+    return (f"{head}{record['time']:>10.2f} с"
+            f"{record['mb_per_s']:>9.1f} МБ/с"
+            f"{record['peak_rss'] / 2**20:>9.0f} МБ RSS"
+            f"{record['rss_delta'] / 2**20:>+8.0f}")
+
+
+def run(args, out=sys.stdout) -> List[dict]:
+    generator = TestDataGenerator()
+    records = []
+    env = environment()
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = args.data_dir or tmp
+        os.makedirs(data_dir, exist_ok=True)
+        for size in args.sizes:
+            for case in args.cases:
+                written: Dict[str, str] = {}
+                for algorithm in args.algorithms:
+                    path, pattern = prepare_input(
+                        generator, algorithm, case, size, data_dir,
+                        # Общий текст случая пишется один раз
+                        reuse=args.keep or (case != "worst" and bool(written))
+                    )
+                    written[path] = pattern
+                    expected = reference_index(path, pattern)
+                    for mode in args.mode:
+                        record = measure_cell(
+                            algorithm, mode, path, pattern, expected,
+                            args.block_size, args.cold, args.timeout
+                        )
+                        record.update(case=case, **env)
+                        records.append(record)
+                        print(_format_row(record), file=out, flush=True)
+                        with open(args.output, "a", encoding="utf-8") as f:
+                            f.write(json.dumps(record) + "\n")
+                if not args.keep:
+                    for path in written:
+                        os.remove(path)
+                        os.remove(path[:-len(".txt")] + ".pattern")
+    return records
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    run(parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
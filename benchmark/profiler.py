@@ -0,0 +1,132 @@
+"""
+Модуль profiler.py: Профилирование отдельных ячеек бенчмарка.
+
+Для выбранной ячейки сохраняются два файла:
+    <имя>.pstats — детерминированный профиль cProfile (pstats, snakeviz);
+    <имя>.folded — стеки семплирующего профилировщика в свёрнутом
+                   формате (flamegraph.pl, speedscope, inferno).
+Профилирующие запуски выполняются отдельно от замеров и не попадают
+в статистику.
+"""
+import os
+import sys
+import time
+import cProfile
+import threading
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+def parse_cell_spec(spec: str) -> Tuple[str, Optional[str], Optional[int]]:
+    """Разбирает «алгоритм[:случай[:размер]]»; пропущенные части или
+    «*» означают любую ячейку."""
+    parts = spec.split(":")
+    if not 1 <= len(parts) <= 3 or not parts[0]:
+        raise ValueError(f"Неверный формат ячейки: {spec}")
+    parts += ["*"] * (3 - len(parts))
+    algo, case, size = parts
+    return (
+        algo,
+        None if case == "*" else case,
+        None if size == "*" else int(size)
+    )
+
+
+def matches(
+    specs: List[Tuple[str, Optional[str], Optional[int]]],
+    algo: str, case: str, size: int
+) -> bool:
+    return any(
+        spec_algo in (algo, "*")
+        and spec_case in (case, None)
+        and spec_size in (size, None)
+        for spec_algo, spec_case, spec_size in specs
+    )
+
+
+def _frame_name(frame) -> str:
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def _run_for(func: Callable, args: Tuple, min_duration: float) -> int:
+    """Повторяет func, пока не наберётся min_duration секунд."""
+    runs = 0
+    started = time.perf_counter()
+    while True:
+        func(*args)
+        runs += 1
+        if time.perf_counter() - started >= min_duration:
+            return runs
+
+
+def sample_stacks(
+    func: Callable,
+    args: Tuple,
+    interval: float = 0.001,
+    min_duration: float = 0.5
+) -> Counter:
+    """Семплирующий профиль: фоновый поток периодически снимает стек
+    потока, выполняющего func. Возвращает счётчик свёрнутых стеков."""
+    target = threading.get_ident()
+    stacks: Counter = Counter()
+    done = threading.Event()
+
+    def sampler():
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target)
+            names = []
+            while frame is not None:
+                if frame.f_code is _run_for.__code__:
+                    # Учитываем только стеки внутри func
+                    if names:
+                        stacks[";".join(reversed(names))] += 1
+                    break
+                names.append(_frame_name(frame))
+                frame = frame.f_back
+
+    # Поток с func должен чаще отдавать GIL семплеру
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval))
+    thread = threading.Thread(target=sampler, daemon=True)
+    thread.start()
+    try:
+        _run_for(func, args, min_duration)
+    finally:
+        done.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+    return stacks
+
+
+def profile_cell(
+    func: Callable,
+    args: Tuple,
+    output_prefix: str,
+    min_duration: float = 0.5
+) -> Dict[str, str]:
+    """Профилирует func(*args) и сохраняет .pstats и .folded.
+
+    Возвращает пути к созданным файлам.
+    """
+    directory = os.path.dirname(output_prefix)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    profile = cProfile.Profile()
+    profile.enable()
+    try:
+        _run_for(func, args, min_duration)
+    finally:
+        profile.disable()
+    pstats_path = f"{output_prefix}.pstats"
+    profile.dump_stats(pstats_path)
+
+    stacks = sample_stacks(func, args, min_duration=min_duration)
+    folded_path = f"{output_prefix}.folded"
+    with open(folded_path, "w", encoding="utf-8") as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+    return {"profile_pstats": pstats_path, "profile_folded": folded_path}
@@ -0,0 +1,140 @@
+"""
+Модуль rank_bench.py: Память и скорость поиска по буферу номеров
+символов (src/rank_encoding.py) в сравнении с поиском по str.
+
+Данные — ячейки генератора и их Unicode-варианты: заглавные латинские
+буквы заменяются кириллицей (2 байта на символ в str) или символами вне
+BMP (4 байта). Для каждой ячейки печатаются размер str и буфера,
+время кодирования и пропускная способность поиска (минимум из --runs
+запусков) обычной версией алгоритма и версией _ranked.
+
+Пример:
+    python -m benchmark.rank_bench -a boyer_moore -c worst random \\
+        --sizes 65536 1048576
+"""
+import sys
+import time
+import random
+import string
+import argparse
+from typing import List, Optional, Tuple
+
+from src.data_generator import TestDataGenerator
+from src.rank_encoding import RANKED_PHASES, RankAlphabet, RankedText
+from src.registry import get_engine
+
+# Вариант -> первый символ, на который отображается 'A'
+VARIANTS = {"ascii": None, "bmp": 0x0410, "astral": 0x1F600}
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Сравнивает поиск по str и по буферу номеров символов."
+    )
+    parser.add_argument(
+        "-a", "--algorithms",
+        nargs="+",
+        choices=sorted(RANKED_PHASES),
+        default=sorted(RANKED_PHASES),
+        help="Алгоритмы (по умолчанию: все с версией _ranked)"
+    )
+    parser.add_argument(
+        "-c", "--cases",
+        nargs="+",
+        choices=["best", "worst", "random"],
+        default=["best", "worst", "random"],
+        help="Случаи (по умолчанию: все)"
+    )
+    parser.add_argument(
+        "--variants",
+        nargs="+",
+        choices=list(VARIANTS),
+        default=list(VARIANTS),
+        help="Кодировка символов текста (по умолчанию: все)"
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1 << 16, 1 << 20],
+        help="Размеры (по умолчанию: 65536 1048576)"
+    )
+    parser.add_argument(
+        "--runs",
+        type=int,
+        default=5,
+        help="Запусков на замер (по умолчанию: 5)"
+    )
+    return parser.parse_args(argv)
+
+
+def to_variant(text: str, variant: str) -> str:
+    base = VARIANTS[variant]
+    if base is None:
+        return text
+    return text.translate({
+        ord(c): base + i for i, c in enumerate(string.ascii_uppercase)
+    })
+
+
+def _best(func, *args, runs: int = 5) -> Tuple[float, object]:
+    best, result = float("inf"), None
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def measure_cell(
+    algorithm: str, case: str, size: int, variant: str, runs: int = 5
+) -> dict:
+    random.seed(size)
+    text, pattern = TestDataGenerator().generate_case(algorithm, case, size)
+    text, pattern = to_variant(text, variant), to_variant(pattern, variant)
+    row = {
+        "algorithm": algorithm, "case": case, "size": size,
+        "variant": variant, "str_bytes": sys.getsizeof(text)
+    }
+    row["encode_time"], ranked = _best(
+        lambda: RankedText(text, RankAlphabet.of(text, pattern)), runs=runs
+    )
+    row["buffer_bytes"] = ranked.nbytes
+    row["typecode"] = ranked.alphabet.typecode
+
+    search = get_engine(algorithm).search
+    row["str_time"], expected = _best(search, text, pattern, runs=runs)
+    row["ranked_time"], found = _best(
+        ranked.find, pattern, algorithm, runs=runs
+    )
+    if found != expected:
+        raise AssertionError(f"{algorithm}: {found} != {expected}")
+    return row
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    print(f"{'Алгоритм':<13}{'Случай':<8}{'Вариант':<8}{'Размер':>9}"
+          f"{'str, МБ':>9}{'Буфер, МБ':>11}{'Код., мс':>10}"
+          f"{'str, Мсимв/с':>14}{'ranked':>9}{'Ускор.':>8}")
+    for algorithm in args.algorithms:
+        for case in args.cases:
+            for variant in args.variants:
+                for size in args.sizes:
+                    row = measure_cell(
+                        algorithm, case, size, variant, args.runs
+                    )
+                    str_rate = size / row["str_time"] / 1e6
+                    ranked_rate = size / row["ranked_time"] / 1e6
+                    print(
+                        f"{algorithm:<13}{case:<8}{variant:<8}{size:>9}"
+                        f"{row['str_bytes'] / 1e6:>9.2f}"
+                        f"{row['buffer_bytes'] / 1e6:>11.2f}"
+                        f"{row['encode_time'] * 1e3:>10.2f}"
+                        f"{str_rate:>14.2f}{ranked_rate:>9.2f}"
+                        f"{ranked_rate / str_rate:>7.2f}x"
+                    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Модуль results_store.py: Дописываемое хранилище результатов (JSONL).
+
+Каждая строка файла — одна измеренная ячейка. Ключ ячейки включает
+версию алгоритма, отпечаток окружения и порядок замеров (order), поэтому
+повторный запуск пропускает уже измеренное, а результаты с другой
+машины, другой версии Python или другим способом замера хранятся
+отдельно и не смешиваются.
+"""
+import os
+import json
+import hashlib
+import inspect
+import platform
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+KEY_FIELDS = (
+    "algorithm", "case", "size",
+    "engine_version", "python_version", "cpu_model", "order"
+)
+# Значения полей ключа в записях, снятых до их появления
+KEY_DEFAULTS = {"order": "sequential"}
+
+
+def field(record: dict, name: str):
+    return record.get(name, KEY_DEFAULTS.get(name))
+
+
+def cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def python_version() -> str:
+    return f"{platform.python_implementation()} {platform.python_version()}"
+
+
+def environment() -> Dict[str, str]:
+    """Отпечаток окружения, в котором выполняются замеры."""
+    return {"python_version": python_version(), "cpu_model": cpu_model()}
+
+
+def _referenced_names(code) -> List[str]:
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names += _referenced_names(const)
+    return names
+
+
+def engine_version(func: Callable) -> str:
+    """Короткий хеш исходного кода алгоритма и всех функций и классов
+    его модуля, которые он использует (фазы, таблицы, вспомогательные
+    функции): меняется вместе с кодом."""
+    sources = []
+    seen = set()
+    pending = [func]
+    while pending:
+        obj = pending.pop(0)
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        try:
+            sources.append(inspect.getsource(obj))
+        except (OSError, TypeError):
+            sources.append(f"{obj.__module__}.{obj.__qualname__}")
+        code = getattr(obj, "__code__", None)
+        if code is None:
+            continue
+        for name in _referenced_names(code):
+            ref = obj.__globals__.get(name)
+            if ((inspect.isfunction(ref) or inspect.isclass(ref))
+                    and ref.__module__ == func.__module__):
+                pending.append(ref)
+    digest = hashlib.sha1("\n".join(sources).encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+class ResultsStore:
+    def __init__(self, path: str = "results/results.jsonl"):
+        self.path = path
+        self.records: List[dict] = []
+        self._keys = set()
+        self._load()
+
+    @staticmethod
+    def key(record: dict) -> Tuple:
+        return tuple(
+            record[name] if name not in KEY_DEFAULTS
+            else field(record, name)
+            for name in KEY_FIELDS
+        )
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Оборванная запись прерванного запуска
+                        continue
+                    self.records.append(record)
+                    self._keys.add(self.key(record))
+        except FileNotFoundError:
+            pass
+
+    def __contains__(self, key: Tuple) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def append(self, record: dict) -> None:
+        """Дописывает одну ячейку в конец файла."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with open(self.path, "ab+") as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # Оборванная запись прерванного запуска: новая
+                    # начинается с новой строки, иначе потерялась бы
+                    # при загрузке вместе с ней
+                    f.write(b"\n")
+            f.write(line.encode("utf-8"))
+        self.records.append(record)
+        self._keys.add(self.key(record))
+
+    def select(self, env: Optional[Dict[str, str]] = None) -> List[dict]:
+        """Записи, снятые в заданном окружении (по умолчанию — все)."""
+        if env is None:
+            return list(self.records)
+        return [
+            record for record in self.records
+            if all(field(record, k) == v for k, v in env.items())
+        ]
+
+
+def to_legacy(records: Iterable[dict]) -> Tuple[dict, dict]:
+    """Преобразует записи в прежний формат time/memory_results.json.
+
+    Из записей одной ячейки (например, разных версий алгоритма) берётся
+    последняя по порядку в хранилище, то есть самая новая.
+    """
+    latest = {
+        (record["algorithm"], record["case"], record["size"]): record
+        for record in records
+    }
+    time_results: dict = {}
+    memory_results: dict = {}
+    for record in sorted(latest.values(), key=lambda r: r["size"]):
+        algo, case = record["algorithm"], record["case"]
+        time_results.setdefault(algo, {}).setdefault(case, []).append({
+            "size": record["size"],
+            "time": record["time"],
+            "delta": record["time_delta"]
+        })
+        memory_results.setdefault(algo, {}).setdefault(case, []).append({
+            "size": record["size"],
+            "memory": record["memory"],
+            "delta": record["memory_delta"]
+        })
+    return time_results, memory_results
@@ -0,0 +1,37 @@
+"""
+Модуль sample_store.py: Хранение сырых замеров каждой ячейки
+в сжатом колоночном виде (NumPy .npz, по одному массиву на метрику).
+"""
+import os
+import hashlib
+from typing import Dict, Sequence
+
+import numpy as np
+
+
+class SampleStore:
+    def __init__(self, directory: str = "results/samples"):
+        self.directory = directory
+
+    def path_for(self, key: Sequence) -> str:
+        """Имя файла ячейки: читаемый префикс и хеш полного ключа."""
+        algorithm, case, size = key[:3]
+        digest = hashlib.sha1(repr(tuple(key)).encode("utf-8")).hexdigest()
+        return os.path.join(
+            self.directory, f"{algorithm}_{case}_{size}_{digest[:10]}.npz"
+        )
+
+    def save(self, key: Sequence, **samples: Sequence[float]) -> str:
+        """Сохраняет массивы замеров ячейки, возвращает путь к файлу."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path_for(key)
+        np.savez_compressed(path, **{
+            name: np.asarray(values, dtype=np.float64)
+            for name, values in samples.items()
+        })
+        return path
+
+    @staticmethod
+    def load(path: str) -> Dict[str, np.ndarray]:
+        with np.load(path) as data:
+            return {name: data[name] for name in data.files}
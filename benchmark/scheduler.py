@@ -0,0 +1,133 @@
+"""
+Модуль scheduler.py: Параллельный запуск независимых ячеек бенчмарка
+(алгоритм, случай, размер) на закреплённых за ядрами процессах.
+"""
+import os
+import queue
+import multiprocessing
+from typing import Callable, Hashable, List, Optional, Sequence, Tuple
+
+
+def available_cpus() -> List[int]:
+    """Логические CPU, на которых разрешено работать текущему процессу."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _core_key(cpu: int) -> Hashable:
+    topology = f"/sys/devices/system/cpu/cpu{cpu}/topology"
+    try:
+        with open(f"{topology}/physical_package_id") as f:
+            package = f.read().strip()
+        with open(f"{topology}/core_id") as f:
+            core = f.read().strip()
+    except OSError:
+        return cpu
+    return package, core
+
+
+def physical_cores() -> List[int]:
+    """Возвращает по одному логическому CPU на каждое физическое ядро.
+
+    SMT-соседи (hyper-threading) отбрасываются, чтобы два замера
+    не делили одно ядро и не искажали друг друга.
+    """
+    seen = set()
+    cores = []
+    for cpu in available_cpus():
+        key = _core_key(cpu)
+        if key in seen:
+            continue
+        seen.add(key)
+        cores.append(cpu)
+    return cores
+
+
+def order_largest_first(
+    tasks: Sequence[Tuple], size_key: Callable[[Tuple], int]
+) -> List[Tuple]:
+    """Сортирует задачи по убыванию размера: длинные ячейки стартуют
+    первыми, короткие заполняют «хвост» — так загрузка плотнее."""
+    return sorted(tasks, key=size_key, reverse=True)
+
+
+def _pin_to_cpu(cpu: Optional[int]) -> None:
+    if cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu})
+
+
+def _worker(cpu, func, task_queue, result_queue):
+    _pin_to_cpu(cpu)
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        try:
+            result_queue.put((task, func(*task), None))
+        except Exception as e:
+            result_queue.put((task, None, f"{type(e).__name__}: {e}"))
+
+
+class ParallelScheduler:
+    def __init__(self, jobs: int = 1, poll_interval: float = 1.0):
+        if jobs < 1:
+            raise ValueError("Количество процессов должно быть не менее 1.")
+        cores = physical_cores()
+        self.jobs = min(jobs, len(cores))
+        self.cpus = cores[:self.jobs]
+        self.poll_interval = poll_interval
+
+    def run(
+        self,
+        tasks: Sequence[Tuple],
+        func: Callable,
+        on_result: Callable[[Tuple, object, Optional[str]], None],
+        size_key: Callable[[Tuple], int] = lambda task: task[-1]
+    ) -> None:
+        """Выполняет func(*task) для каждой задачи в пуле процессов.
+
+        Каждый процесс закреплён за своим физическим ядром; дочерние
+        процессы замеров наследуют эту привязку. on_result(task, result,
+        error) вызывается в родительском процессе сразу по готовности
+        ячейки, поэтому результаты можно сохранять инкрементально.
+        """
+        ordered = order_largest_first(tasks, size_key)
+        task_queue = multiprocessing.Queue()
+        result_queue = multiprocessing.Queue()
+        for task in ordered:
+            task_queue.put(task)
+        for _ in self.cpus:
+            task_queue.put(None)
+
+        workers = [
+            multiprocessing.Process(
+                target=_worker,
+                args=(cpu, func, task_queue, result_queue)
+            )
+            for cpu in self.cpus
+        ]
+        for proc in workers:
+            proc.start()
+
+        remaining = len(ordered)
+        try:
+            while remaining:
+                try:
+                    task, result, error = result_queue.get(
+                        timeout=self.poll_interval
+                    )
+                except queue.Empty:
+                    if not any(proc.is_alive() for proc in workers):
+                        raise RuntimeError(
+                            "Все рабочие процессы завершились, "
+                            f"не обработано ячеек: {remaining}"
+                        )
+                    continue
+                remaining -= 1
+                on_result(task, result, error)
+        finally:
+            for proc in workers:
+                proc.join(timeout=self.poll_interval)
+                if proc.is_alive():
+                    proc.terminate()
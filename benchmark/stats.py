@@ -0,0 +1,230 @@
+"""
+Модуль stats.py: Статистика для замеров — точные квантили распределения
+Стьюдента, последовательная выборка до заданной точности, определение
+установившегося режима при прогреве, описательная статистика выборок
+и сравнение двух выборок (критерий Манна-Уитни).
+"""
+import math
+import time
+import statistics
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+_FPMIN = 1e-300
+
+
+def _beta_continued_fraction(a: float, b: float, x: float) -> float:
+    """Цепная дробь для неполной бета-функции (метод Лентца)."""
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c = 1.0
+    d = 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > _FPMIN else _FPMIN)
+    h = d
+    for m in range(1, 300):
+        m2 = 2 * m
+        for aa in (
+            m * (b - m) * x / ((qam + m2) * (a + m2)),
+            -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))
+        ):
+            d = 1.0 + aa * d
+            d = 1.0 / (d if abs(d) > _FPMIN else _FPMIN)
+            c = 1.0 + aa / c
+            c = c if abs(c) > _FPMIN else _FPMIN
+            delta = d * c
+            h *= delta
+        if abs(delta - 1.0) < 1e-15:
+            break
+    return h
+
+
+def regularized_beta(x: float, a: float, b: float) -> float:
+    """Регуляризованная неполная бета-функция I_x(a, b)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    front = math.exp(
+        math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+        + a * math.log(x) + b * math.log1p(-x)
+    )
+    if x < (a + 1.0) / (a + b + 2.0):
+        return front * _beta_continued_fraction(a, b, x) / a
+    return 1.0 - front * _beta_continued_fraction(b, a, 1.0 - x) / b
+
+
+def student_t_cdf(t: float, df: float) -> float:
+    tail = 0.5 * regularized_beta(df / (df + t * t), df / 2.0, 0.5)
+    return 1.0 - tail if t > 0 else tail
+
+
+@lru_cache(maxsize=None)
+def student_t_quantile(p: float, df: float) -> float:
+    """Квантиль распределения Стьюдента уровня p для df степеней свободы."""
+    if not 0.0 < p < 1.0:
+        raise ValueError("Уровень квантиля должен быть в интервале (0, 1).")
+    if df <= 0:
+        raise ValueError("Число степеней свободы должно быть положительным.")
+    if p == 0.5:
+        return 0.0
+    if p < 0.5:
+        return -student_t_quantile(1.0 - p, df)
+
+    low, high = 0.0, 1.0
+    while student_t_cdf(high, df) < p:
+        low, high = high, high * 2.0
+    while high - low > 1e-12 * high:
+        middle = (low + high) / 2.0
+        if student_t_cdf(middle, df) < p:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2.0
+
+
+def confidence_interval(
+    samples: List[float], confidence: float = 0.95
+) -> Tuple[float, float]:
+    """Среднее и полуширина доверительного интервала."""
+    n = len(samples)
+    if n < 2:
+        raise ValueError("Для интервала нужно не менее двух замеров.")
+    t_value = student_t_quantile(0.5 + confidence / 2.0, n - 1)
+    delta = t_value * statistics.stdev(samples) / math.sqrt(n)
+    return statistics.mean(samples), delta
+
+
+def sequential_sample(
+    draw: Callable[[], float],
+    target_ci: float = 0.05,
+    min_runs: int = 6,
+    max_runs: int = 1000,
+    time_budget: Optional[float] = None,
+    confidence: float = 0.95
+) -> Tuple[List[float], str]:
+    """Снимает замеры draw(), пока относительная полуширина интервала
+    не станет меньше target_ci, либо пока не исчерпан лимит запусков
+    или времени.
+
+    Возвращает замеры и причину остановки: "precision", "max_runs"
+    или "time_budget".
+    """
+    if min_runs < 2:
+        raise ValueError("Минимальное количество запусков — 2.")
+    samples: List[float] = []
+    started = time.perf_counter()
+    while True:
+        samples.append(draw())
+        if len(samples) < min_runs:
+            continue
+        mean, delta = confidence_interval(samples, confidence)
+        if delta <= target_ci * abs(mean):
+            return samples, "precision"
+        if len(samples) >= max_runs:
+            return samples, "max_runs"
+        if (time_budget is not None
+                and time.perf_counter() - started >= time_budget):
+            return samples, "time_budget"
+
+
+def detect_steady_state(
+    draw: Callable[[], float],
+    window: int = 5,
+    rel_tol: float = 0.1,
+    max_runs: int = 50,
+    time_budget: Optional[float] = 1.0
+) -> Tuple[List[float], str]:
+    """Повторяет draw(), пока последние window замеров не стабилизируются
+    (коэффициент вариации окна не больше rel_tol).
+
+    Первый вызов выполняется всегда. Возвращает замеры и причину
+    остановки: "steady", "max_runs" или "time_budget".
+    """
+    if window < 2:
+        raise ValueError("Окно стабилизации должно быть не менее 2.")
+    samples: List[float] = []
+    started = time.perf_counter()
+    while True:
+        samples.append(draw())
+        recent = samples[-window:]
+        if len(recent) == window:
+            mean = statistics.mean(recent)
+            if statistics.stdev(recent) <= rel_tol * abs(mean):
+                return samples, "steady"
+        if len(samples) >= max_runs:
+            return samples, "max_runs"
+        if (time_budget is not None
+                and time.perf_counter() - started >= time_budget):
+            return samples, "time_budget"
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Перцентиль q (0..100) с линейной интерполяцией между порядковыми
+    статистиками."""
+    if not samples:
+        raise ValueError("Пустая выборка.")
+    ordered = sorted(samples)
+    position = (len(ordered) - 1) * q / 100.0
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    fraction = position - lower
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * fraction
+
+
+def describe(
+    samples: Sequence[float], outlier_z: float = 3.5
+) -> Dict[str, float]:
+    """Перцентили, медианное абсолютное отклонение (MAD) и число
+    выбросов по модифицированной z-оценке |0.6745 (x - медиана) / MAD|."""
+    median = statistics.median(samples)
+    mad = statistics.median(abs(x - median) for x in samples)
+    if mad > 0:
+        outliers = sum(
+            1 for x in samples if abs(0.6745 * (x - median) / mad) > outlier_z
+        )
+    else:
+        outliers = sum(1 for x in samples if x != median)
+    return {
+        "min": min(samples),
+        "p50": median,
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "max": max(samples),
+        "mad": mad,
+        "outliers": outliers
+    }
+
+
+def mann_whitney_u(
+    x: Sequence[float], y: Sequence[float]
+) -> Tuple[float, float]:
+    """Двусторонний критерий Манна-Уитни: статистика U для x и p-значение
+    (нормальное приближение с поправками на связи и непрерывность)."""
+    n1, n2 = len(x), len(y)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("Обе выборки должны быть непустыми.")
+    combined = sorted([(v, 0) for v in x] + [(v, 1) for v in y])
+    n = n1 + n2
+    rank_sum_x = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        average_rank = (i + j) / 2.0 + 1.0
+        ties = j - i + 1
+        tie_term += ties ** 3 - ties
+        rank_sum_x += average_rank * sum(
+            1 for k in range(i, j + 1) if combined[k][1] == 0
+        )
+        i = j + 1
+
+    u = rank_sum_x - n1 * (n1 + 1) / 2.0
+    mu = n1 * n2 / 2.0
+    sigma = math.sqrt(
+        n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1)))
+    ) if n > 1 else 0.0
+    if sigma == 0:
+        return u, 1.0
+    z = (abs(u - mu) - 0.5) / sigma
+    return u, min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2.0)))
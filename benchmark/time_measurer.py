@@ -1,32 +1,49 @@
-import math
-import statistics
 import multiprocessing
-from typing import Callable, Tuple, Dict
+from typing import Callable, Tuple, Dict, List, Optional
+from benchmark.stats import (
+    confidence_interval, sequential_sample, detect_steady_state,
+    student_t_quantile
+)
 
 
 class TimeMeasurer:
     def __init__(self, timeout: float = 5.0):
         self.timeout = timeout
-        self.t_table: Dict[int, float] = {
-            6: 2.5706,
-            11: 2.2281,
-            16: 2.1314,
-            21: 2.0860,
-            26: 2.0555,
-            31: 2.0423,
-            36: 2.0301,
-            41: 2.0211,
-            51: 2.0086,
-            101: 1.9840
-        }
+        # Сырые замеры последнего вызова measure / measure_sequential
+        self.samples: List[float] = []
 
     def _get_t_value(self, n: int) -> float:
-        """Возвращает t-значение для заданного n
-        (ближайшее меньшее из таблицы)."""
-        valid_keys = [k for k in self.t_table if k <= n]
-        if not valid_keys:
+        """t-квантиль 0.975 для n замеров (n - 1 степеней свободы)."""
+        if n < 6:
             raise ValueError("Слишком малое количество запусков. Минимум: 6")
-        return self.t_table[max(valid_keys)]
+        return student_t_quantile(0.975, n - 1)
+
+    def warm_up(
+        self,
+        func: Callable,
+        args: Tuple,
+        window: int = 5,
+        rel_tol: float = 0.1,
+        max_runs: int = 50,
+        time_budget: Optional[float] = 1.0
+    ) -> Tuple[int, str]:
+        """Прогревает func в текущем процессе до стабилизации времени.
+
+        Возвращает число прогревочных запусков и причину остановки.
+        Крупные входы, один запуск которых дольше time_budget,
+        прогреваются ровно один раз.
+        """
+        import time
+
+        def draw() -> float:
+            start = time.perf_counter()
+            func(*args)
+            return time.perf_counter() - start
+
+        times, reason = detect_steady_state(
+            draw, window, rel_tol, max_runs, time_budget
+        )
+        return len(times), reason
 
     def _timed_run(self, func: Callable, args: Tuple, return_dict):
         import time
@@ -35,6 +52,50 @@ class TimeMeasurer:
         end = time.perf_counter()
         return_dict["time"] = end - start
 
+    def _timed_phases_run(
+        self, preprocess: Callable, scan: Callable,
+        text: str, pattern: str, return_dict
+    ):
+        import time
+        start = time.perf_counter()
+        tables = preprocess(pattern)
+        middle = time.perf_counter()
+        scan(text, pattern, tables)
+        end = time.perf_counter()
+        return_dict["preprocess"] = middle - start
+        return_dict["scan"] = end - middle
+
+    def _run_in_process(self, target: Callable, args: Tuple) -> dict:
+        """Запуск target(*args, return_dict) в отдельном процессе
+        с таймаутом."""
+        manager = multiprocessing.Manager()
+        return_dict = manager.dict()
+        proc = multiprocessing.Process(
+            target=target,
+            args=(
+                *args,
+                return_dict
+            )
+        )
+        proc.start()
+        proc.join(timeout=self.timeout)
+
+        if proc.is_alive():
+            proc.terminate()
+            raise TimeoutError(
+                f"Функция превысила таймаут в {self.timeout} секунд."
+            )
+
+        return dict(return_dict)
+
+    def _run_once(self, func: Callable, args: Tuple) -> float:
+        """Один замер в отдельном процессе с таймаутом."""
+        return self._run_in_process(self._timed_run, (func, args))["time"]
+
+    def _mean_delta(self, values: List[float]) -> Tuple[float, float]:
+        # Тот же интервал, что и при последовательной выборке
+        return confidence_interval(values)
+
     def measure(
         self,
         func: Callable,
@@ -44,32 +105,60 @@ class TimeMeasurer:
         if n_runs < 6:
             raise ValueError("Количество запусков должно быть не менее 6.")
 
-        times = []
-        for _ in range(n_runs):
-            manager = multiprocessing.Manager()
-            return_dict = manager.dict()
-            proc = multiprocessing.Process(
-                target=self._timed_run,
-                args=(
-                    func,
-                    args,
-                    return_dict
-                )
-            )
-            proc.start()
-            proc.join(timeout=self.timeout)
+        times = [self._run_once(func, args) for _ in range(n_runs)]
+        self.samples = times
 
-            if proc.is_alive():
-                proc.terminate()
-                raise TimeoutError(
-                    f"Функция превысила таймаут в {self.timeout} секунд."
-                )
+        return self._mean_delta(times)
+
+    def measure_phases(
+        self,
+        preprocess: Callable,
+        scan: Callable,
+        text: str,
+        pattern: str,
+        n_runs: int = 101
+    ) -> Dict[str, Tuple[float, float]]:
+        """Раздельные замеры фаз: построение таблиц по паттерну
+        и проход по тексту. Возвращает {фаза: (среднее, delta)}."""
+        if n_runs < 6:
+            raise ValueError("Количество запусков должно быть не менее 6.")
 
-            times.append(return_dict["time"])
+        runs = [
+            self._run_in_process(
+                self._timed_phases_run, (preprocess, scan, text, pattern)
+            )
+            for _ in range(n_runs)
+        ]
+        return {
+            phase: self._mean_delta([run[phase] for run in runs])
+            for phase in ("preprocess", "scan")
+        }
 
-        mean_time = statistics.mean(times)
-        std_dev = statistics.stdev(times)
-        t_value = self._get_t_value(n_runs)
-        delta = t_value * (std_dev / math.sqrt(n_runs))
+    def measure_sequential(
+        self,
+        func: Callable,
+        args: Tuple,
+        target_ci: float = 0.05,
+        min_runs: int = 6,
+        max_runs: int = 1000,
+        time_budget: Optional[float] = None
+    ) -> Dict[str, object]:
+        """Замеряет, пока полуширина 95% интервала не станет меньше
+        target_ci от среднего (или не исчерпан лимит запусков/времени).
 
-        return mean_time, delta
+        t-значение вычисляется точно для любого числа запусков.
+        """
+        if min_runs < 6:
+            raise ValueError("Количество запусков должно быть не менее 6.")
+        times, stop_reason = sequential_sample(
+            lambda: self._run_once(func, args),
+            target_ci, min_runs, max_runs, time_budget
+        )
+        self.samples = times
+        mean_time, delta = confidence_interval(times)
+        return {
+            "mean": mean_time,
+            "delta": delta,
+            "n_runs": len(times),
+            "stop_reason": stop_reason
+        }
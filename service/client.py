@@ -0,0 +1,103 @@
+"""
+Модуль client.py: Асинхронный клиент сервиса поиска.
+
+Запросы одного соединения уходят конвейером: request() отправляет строку
+и ждёт ответа с тем же id, не мешая другим запросам.
+"""
+import json
+import asyncio
+import itertools
+from typing import Dict, List, Optional
+
+from service.server import MAX_LINE
+
+
+class SearchError(RuntimeError):
+    """Ошибка, возвращённая сервисом."""
+
+
+class SearchClient:
+    def __init__(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._reading = asyncio.ensure_future(self._read_responses())
+
+    @classmethod
+    async def connect(
+        cls,
+        path: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 8765
+    ) -> "SearchClient":
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(
+                path, limit=MAX_LINE
+            )
+        else:
+            reader, writer = await asyncio.open_connection(
+                host, port, limit=MAX_LINE
+            )
+        return cls(reader, writer)
+
+    async def _read_responses(self) -> None:
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self._pending.pop(response.get("id"), None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(
+                        ConnectionError("Соединение с сервисом закрыто")
+                    )
+            self._pending.clear()
+
+    async def request(self, **fields) -> dict:
+        """Отправляет запрос и возвращает ответ; ошибка сервиса —
+        SearchError."""
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        line = json.dumps({"id": request_id, **fields}, ensure_ascii=False)
+        self._writer.write(line.encode("utf-8") + b"\n")
+        await self._writer.drain()
+        response = await future
+        if "error" in response:
+            raise SearchError(response["error"])
+        return response
+
+    async def compile(self, algorithm: str, pattern: str) -> str:
+        response = await self.request(
+            op="compile", algorithm=algorithm, pattern=pattern
+        )
+        return response["handle"]
+
+    async def search(self, text: str, **options) -> int:
+        """options: handle или algorithm и pattern, а также start, end,
+        reverse, ignore_case."""
+        response = await self.request(op="search", text=text, **options)
+        return response["result"]
+
+    async def search_batch(self, texts: List[str], **options) -> List[int]:
+        response = await self.request(op="search", texts=texts, **options)
+        return response["results"]
+
+    async def stats(self) -> dict:
+        return (await self.request(op="stats"))["stats"]
+
+    async def close(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        await self._reading
@@ -0,0 +1,189 @@
+"""
+Модуль loadgen.py: Генератор нагрузки для сервиса поиска.
+
+Открывает несколько соединений и держит заданное число запросов
+в полёте (конвейер внутри соединений), затем выводит пропускную
+способность и задержки p50/p99.
+
+Пример (сервер поднимается в том же процессе на временном сокете):
+    python -m service.loadgen --spawn --requests 2000 --concurrency 32
+"""
+import os
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+from typing import List, Optional
+
+from benchmark.stats import percentile
+from service.client import SearchClient
+from service.server import SearchServer
+from src.algorithms import PHASES
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Нагрузочный клиент сервиса поиска."
+    )
+    parser.add_argument("--socket", help="Unix-сокет сервиса")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--spawn",
+        action="store_true",
+        help="Поднять сервис в этом процессе на временном сокете"
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=None,
+        help="Процессов пула для --spawn (по умолчанию: число CPU)"
+    )
+    parser.add_argument(
+        "-n", "--requests",
+        type=int,
+        default=1000,
+        help="Число запросов (по умолчанию: 1000)"
+    )
+    parser.add_argument(
+        "-c", "--concurrency",
+        type=int,
+        default=16,
+        help="Запросов в полёте одновременно (по умолчанию: 16)"
+    )
+    parser.add_argument(
+        "--connections",
+        type=int,
+        default=4,
+        help="Число соединений (по умолчанию: 4)"
+    )
+    parser.add_argument(
+        "-b", "--batch",
+        type=int,
+        default=1,
+        help="Текстов в одном запросе (по умолчанию: 1)"
+    )
+    parser.add_argument(
+        "-s", "--size",
+        type=int,
+        default=4096,
+        help="Длина текста (по умолчанию: 4096)"
+    )
+    parser.add_argument(
+        "-a", "--algorithm",
+        choices=sorted(PHASES),
+        default="kmp",
+        help="Алгоритм (по умолчанию: kmp)"
+    )
+    parser.add_argument(
+        "--pattern-length",
+        type=int,
+        default=16,
+        help="Длина паттерна (по умолчанию: 16)"
+    )
+    return parser.parse_args(argv)
+
+
+def make_corpus(
+    count: int, size: int, pattern_length: int, seed: int = 0
+) -> tuple:
+    """Случайные тексты над алфавитом ACGT и паттерн, который встречается
+    примерно в половине из них."""
+    rng = random.Random(seed)
+    pattern = "".join(rng.choices("ACGT", k=pattern_length))
+    texts = []
+    for i in range(count):
+        text = "".join(rng.choices("ACGT", k=size))
+        if i % 2 == 0 and size >= pattern_length:
+            pos = rng.randint(0, size - pattern_length)
+            text = text[:pos] + pattern + text[pos + pattern_length:]
+        texts.append(text)
+    return texts, pattern
+
+
+async def run_load(
+    clients: List[SearchClient],
+    requests: int,
+    concurrency: int,
+    batch: int = 1,
+    size: int = 4096,
+    algorithm: str = "kmp",
+    pattern_length: int = 16
+) -> dict:
+    """Выполняет requests запросов, держа concurrency в полёте, и
+    возвращает пропускную способность и перцентили задержки (мс)."""
+    texts, pattern = make_corpus(max(batch, 16), size, pattern_length)
+    handle = await clients[0].compile(algorithm, pattern)
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+
+    async def user(client: SearchClient, offset: int) -> None:
+        for number in remaining:
+            first = (offset + number) % len(texts)
+            chunk = (texts[first:] + texts[:first])[:batch]
+            started = time.perf_counter()
+            if batch == 1:
+                await client.search(chunk[0], handle=handle)
+            else:
+                await client.search_batch(chunk, handle=handle)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        user(clients[i % len(clients)], i) for i in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(latencies),
+        "texts": len(latencies) * batch,
+        "elapsed": elapsed,
+        "throughput": len(latencies) / elapsed,
+        "text_throughput": len(latencies) * batch / elapsed,
+        "mb_per_s": len(latencies) * batch * size / elapsed / 1e6,
+        "p50_ms": percentile(latencies, 50) * 1e3,
+        "p99_ms": percentile(latencies, 99) * 1e3,
+        "max_ms": max(latencies) * 1e3
+    }
+
+
+def print_report(report: dict) -> None:
+    print(f"Запросов: {report['requests']}, текстов: {report['texts']}, "
+          f"время: {report['elapsed']:.2f} с")
+    print(f"Пропускная способность: {report['throughput']:.0f} запр/с, "
+          f"{report['text_throughput']:.0f} текстов/с, "
+          f"{report['mb_per_s']:.1f} МБ/с")
+    print(f"Задержка: p50 {report['p50_ms']:.2f} мс, "
+          f"p99 {report['p99_ms']:.2f} мс, max {report['max_ms']:.2f} мс")
+
+
+async def _main(args) -> dict:
+    server = None
+    path = args.socket
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.spawn:
+            path = os.path.join(tmp, "search.sock")
+            server = SearchServer(args.workers)
+            await server.start(path)
+        clients = [
+            await SearchClient.connect(path, args.host, args.port)
+            for _ in range(args.connections)
+        ]
+        try:
+            return await run_load(
+                clients, args.requests, args.concurrency, args.batch,
+                args.size, args.algorithm, args.pattern_length
+            )
+        finally:
+            for client in clients:
+                await client.close()
+            if server is not None:
+                await server.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    print_report(asyncio.run(_main(parse_args(argv))))
+
+
+if __name__ == "__main__":
+    main()
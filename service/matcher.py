@@ -0,0 +1,50 @@
+"""
+Модуль matcher.py: Поиск в рабочих процессах сервиса.
+
+Функции выполняются в процессах пула. Таблицы паттернов (результат
+предобработки) кешируются в каждом процессе, поэтому повторные запросы
+с тем же паттерном сразу переходят к проходу по тексту.
+"""
+from functools import lru_cache, partial
+from typing import Any, List, Optional
+
+from src.algorithms import (
+    ASCII_CASE_FOLD, PHASES, REVERSE_PHASES, fold_rsearch, fold_search
+)
+
+COMPILED_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=COMPILED_CACHE_SIZE)
+def compiled(algorithm: str, pattern: str) -> Any:
+    """Таблицы алгоритма для паттерна (кешируются в процессе)."""
+    preprocess, _ = PHASES[algorithm]
+    return preprocess(pattern)
+
+
+def scan_batch(
+    algorithm: str,
+    pattern: str,
+    texts: List[str],
+    start: int = 0,
+    end: Optional[int] = None,
+    reverse: bool = False,
+    ignore_case: bool = False
+) -> List[int]:
+    """Индексы первого (или последнего) вхождения pattern в каждом тексте."""
+    if algorithm not in PHASES:
+        raise ValueError(f"Неизвестный алгоритм: {algorithm}")
+    preprocess = partial(compiled, algorithm)
+    _, scan = (REVERSE_PHASES if reverse else PHASES)[algorithm]
+    results = []
+    for text in texts:
+        if ignore_case:
+            fold = fold_rsearch if reverse else fold_search
+            index = fold(
+                preprocess, scan, text, pattern, ASCII_CASE_FOLD, start, end
+            )
+        else:
+            tables = preprocess(pattern[::-1] if reverse else pattern)
+            index = scan(text, pattern, tables, start=start, end=end)
+        results.append(index)
+    return results
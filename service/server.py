@@ -0,0 +1,253 @@
+"""
+Модуль server.py: Локальный сервис поиска подстроки на asyncio.
+
+Протокол — строки JSON (по одному объекту на строку) через Unix-сокет
+или TCP на localhost. Каждый запрос несёт id, ответ возвращается с тем же
+id, поэтому клиент может отправлять запросы, не дожидаясь ответов
+(конвейер): ответы приходят по мере готовности. Операции:
+    compile — {"op": "compile", "algorithm", "pattern"} -> {"handle"};
+    search  — {"op": "search", "handle" | "algorithm" + "pattern",
+               "text" | "texts", "start", "end", "reverse",
+               "ignore_case"} -> {"result"} или {"results"} для "texts";
+    stats   — счётчики сервиса;
+    ping    — проверка соединения.
+Проход по тексту выполняется в пуле процессов, так что цикл событий
+не блокируется; пакет "texts" делится между процессами пула.
+
+Пример:
+    python -m service.server --socket /tmp/search.sock --workers 4
+"""
+import os
+import json
+import asyncio
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from service.matcher import scan_batch
+from src.algorithms import PHASES
+
+# Предел длины строки запроса: тексты передаются внутри JSON
+MAX_LINE = 1 << 28
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Локальный сервис поиска подстроки."
+    )
+    parser.add_argument(
+        "--socket",
+        help="Путь к Unix-сокету (по умолчанию — TCP на --host:--port)"
+    )
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Адрес TCP (по умолчанию: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="Порт TCP (по умолчанию: 8765)"
+    )
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=None,
+        help="Процессов в пуле (по умолчанию: число CPU)"
+    )
+    parser.add_argument(
+        "--max-inflight",
+        type=int,
+        default=64,
+        help="Одновременно обрабатываемых запросов одного соединения "
+             "(по умолчанию: 64)"
+    )
+    return parser.parse_args(argv)
+
+
+def pattern_handle(algorithm: str, pattern: str) -> str:
+    digest = hashlib.sha1(f"{algorithm}\0{pattern}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class SearchServer:
+    def __init__(self, workers: Optional[int] = None, max_inflight: int = 64):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_inflight = max_inflight
+        self.patterns: Dict[str, Tuple[str, str]] = {}
+        self.stats = {"requests": 0, "texts": 0, "errors": 0}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    async def start(
+        self,
+        path: Optional[str] = None,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ) -> asyncio.AbstractServer:
+        """Запускает пул и слушает Unix-сокет path или TCP host:port."""
+        self._pool = ProcessPoolExecutor(self.workers)
+        if path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._serve, path=path, limit=MAX_LINE
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._serve, host, port, limit=MAX_LINE
+            )
+        return self._server
+
+    @property
+    def address(self):
+        return self._server.sockets[0].getsockname()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            # Открытые соединения дочитывают до EOF и завершаются
+            for writer in self._connections.values():
+                writer.close()
+            await asyncio.gather(
+                *self._connections, return_exceptions=True
+            )
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown()
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = asyncio.current_task()
+        self._connections[connection] = writer
+        write_lock = asyncio.Lock()
+        inflight = asyncio.Semaphore(self.max_inflight)
+        tasks = set()
+
+        async def respond(line: bytes) -> None:
+            try:
+                response = await self.handle_line(line)
+            finally:
+                inflight.release()
+            async with write_lock:
+                writer.write(
+                    json.dumps(response, ensure_ascii=False).encode("utf-8")
+                    + b"\n"
+                )
+                await writer.drain()
+
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                # Следующий запрос читается, не дожидаясь ответа на текущий
+                await inflight.acquire()
+                task = asyncio.ensure_future(respond(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            pass
+        finally:
+            del self._connections[connection]
+            writer.close()
+
+    async def handle_line(self, line: bytes) -> dict:
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            self.stats["errors"] += 1
+            return {"id": None, "error": f"Неверный JSON: {e}"}
+        if not isinstance(request, dict):
+            self.stats["errors"] += 1
+            return {"id": None, "error": "Запрос должен быть объектом JSON"}
+        return await self.handle(request)
+
+    async def handle(self, request: dict) -> dict:
+        self.stats["requests"] += 1
+        request_id = request.get("id")
+        op = request.get("op", "search")
+        try:
+            if op == "search":
+                return {"id": request_id, **await self.search(request)}
+            if op == "compile":
+                handle = self.compile(request["algorithm"], request["pattern"])
+                return {"id": request_id, "handle": handle}
+            if op == "stats":
+                stats = dict(self.stats, patterns=len(self.patterns))
+                return {"id": request_id, "stats": stats}
+            if op == "ping":
+                return {"id": request_id, "pong": True}
+            raise ValueError(f"Неизвестная операция: {op}")
+        except Exception as e:
+            self.stats["errors"] += 1
+            return {"id": request_id, "error": f"{type(e).__name__}: {e}"}
+
+    def compile(self, algorithm: str, pattern: str) -> str:
+        """Регистрирует паттерн; таблицы строятся в процессах пула при
+        первом поиске и остаются в их кеше."""
+        if algorithm not in PHASES:
+            raise ValueError(f"Неизвестный алгоритм: {algorithm}")
+        handle = pattern_handle(algorithm, pattern)
+        self.patterns[handle] = (algorithm, pattern)
+        return handle
+
+    async def search(self, request: dict) -> dict:
+        if "handle" in request:
+            try:
+                algorithm, pattern = self.patterns[request["handle"]]
+            except KeyError:
+                raise ValueError(f"Неизвестный паттерн: {request['handle']}")
+        else:
+            algorithm = request.get("algorithm", "kmp")
+            pattern = request["pattern"]
+            if algorithm not in PHASES:
+                raise ValueError(f"Неизвестный алгоритм: {algorithm}")
+
+        batch = "texts" in request
+        texts = request["texts"] if batch else [request["text"]]
+        self.stats["texts"] += len(texts)
+        options = (
+            request.get("start", 0), request.get("end"),
+            bool(request.get("reverse", False)),
+            bool(request.get("ignore_case", False))
+        )
+
+        # Пакет делится на части по числу процессов пула
+        loop = asyncio.get_running_loop()
+        chunk = max(1, -(-len(texts) // self.workers))
+        parts = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._pool, scan_batch, algorithm, pattern,
+                texts[i:i + chunk], *options
+            )
+            for i in range(0, len(texts), chunk)
+        ))
+        results = [index for part in parts for index in part]
+        return {"results": results} if batch else {"result": results[0]}
+
+
+async def serve(args) -> None:
+    server = SearchServer(args.workers, args.max_inflight)
+    listener = await server.start(args.socket, args.host, args.port)
+    print(f"Сервис слушает {server.address}, процессов: {server.workers}")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    try:
+        asyncio.run(serve(parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,46 +1,242 @@
 """
 Модуль algorithms.py: Реализация алгоритмов поиска подстроки в строке.
 """
+import string
+from array import array
+from collections import deque
+from functools import partial
+from typing import Callable, Optional, Tuple
+
+
+# Каждый алгоритм разделён на две фазы:
+#   <алгоритм>_preprocess(pattern) — построение таблиц по паттерну;
+#   <алгоритм>_scan(text, pattern, tables) — проход по тексту.
+# Функции *_search объединяют фазы; PHASES позволяет замерять их отдельно.
+#
+# Все проходы принимают границы start/end (как str.find, отрицательные
+# считаются от конца) и ищут вхождение целиком внутри text[start:end]
+# без копирования текста; возвращается индекс в исходном тексте.
+# Функции *_rsearch ищут последнее вхождение (как str.rfind): проход
+# *_rscan идёт справа налево по таблицам перевёрнутого паттерна.
+#
+# Параметр table — таблица str.translate, сопоставляющая символу один
+# символ (например, ASCII_CASE_FOLD для поиска без учёта регистра).
+# Таблицы алгоритма строятся по свёрнутому паттерну, а текст сворачивается
+# блоками по FOLD_BLOCK позиций с перекрытием m - 1: копируется не больше
+# одного блока, и свёртка выполняется за один проход translate. Блок
+# не короче FOLD_PATTERN_BLOCKS * m, поэтому перекрытие сворачивается
+# и просматривается повторно не больше чем для 1 / FOLD_PATTERN_BLOCKS
+# текста при любой длине паттерна.
+
+ASCII_CASE_FOLD = str.maketrans(
+    string.ascii_uppercase, string.ascii_lowercase
+)
+FOLD_BLOCK = 1 << 16
+FOLD_PATTERN_BLOCKS = 4
+
+
+def _bounds(n: int, start: int, end: Optional[int]) -> Tuple[int, int]:
+    if start > n:
+        # Как в str.find: за концом текста не находится даже пустой паттерн
+        return n + 1, n
+    start, end, _ = slice(start, end).indices(n)
+    return start, end
+
+
+def _startswith(text) -> Callable:
+    """text.startswith; у буферов без него (mmap) — сравнение среза."""
+    startswith = getattr(text, "startswith", None)
+    if startswith is not None:
+        return startswith
+    return lambda pattern, i: text[i:i + len(pattern)] == pattern
+
+
+def _check_table(table: dict) -> None:
+    for value in table.values():
+        if not (isinstance(value, int)
+                or isinstance(value, str) and len(value) == 1):
+            # Удаление или замена на несколько символов сдвинули бы индексы
+            raise ValueError(
+                "Таблица свёртки должна отображать символ в один символ"
+            )
+
+
+def fold_search(
+    preprocess: Callable,
+    scan: Callable,
+    text: str,
+    pattern: str,
+    table: dict,
+    start: int = 0,
+    end: Optional[int] = None,
+    block: int = FOLD_BLOCK
+) -> int:
+    """Первое вхождение pattern в text[start:end] после свёртки обоих
+    по table; индекс — в исходном тексте."""
+    _check_table(table)
+    start, end = _bounds(len(text), start, end)
+    folded = pattern.translate(table)
+    tables = preprocess(folded)
+    m = len(folded)
+    if m == 0:
+        return scan(text, folded, tables, start=start, end=end)
+
+    block = max(block, FOLD_PATTERN_BLOCKS * m)
+    pos = start
+    while True:
+        stop = min(end, pos + block + m - 1)
+        index = scan(text[pos:stop].translate(table), folded, tables)
+        if index != -1:
+            return pos + index
+        if stop >= end:
+            return -1
+        pos += block
+
+
+def fold_rsearch(
+    preprocess: Callable,
+    rscan: Callable,
+    text: str,
+    pattern: str,
+    table: dict,
+    start: int = 0,
+    end: Optional[int] = None,
+    block: int = FOLD_BLOCK
+) -> int:
+    """Последнее вхождение pattern в text[start:end] после свёртки."""
+    _check_table(table)
+    start, end = _bounds(len(text), start, end)
+    folded = pattern.translate(table)
+    tables = preprocess(folded[::-1])
+    m = len(folded)
+    if m == 0:
+        return rscan(text, folded, tables, start=start, end=end)
+
+    block = max(block, FOLD_PATTERN_BLOCKS * m)
+    stop = end
+    while True:
+        pos = max(start, stop - block - m + 1)
+        index = rscan(text[pos:stop].translate(table), folded, tables)
+        if index != -1:
+            return pos + index
+        if pos <= start:
+            return -1
+        stop -= block
 
 
 # Наивный алгоритм
-def naive_search(text: str, pattern: str) -> int:
-    n, m = len(text), len(pattern)
+def naive_preprocess(pattern: str) -> None:
+    return None
+
+
+def naive_scan(
+    text: str,
+    pattern: str,
+    tables: None = None,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
 
     if m == 0:
-        return 0
-    if n < m:
+        return start if start <= end else -1
+    if end - start < m:
         return -1
 
-    for i in range(n - m + 1):
-        if text[i:i + m] == pattern:
+    # startswith сравнивает на месте, без среза text[i:i + m]
+    startswith = _startswith(text)
+    for i in range(start, end - m + 1):
+        if startswith(pattern, i):
             return i
     return -1
 
 
-# Алгоритм Кнута-Морриса-Пратта (KMP)
-def kmp_search(text: str, pattern: str) -> int:
-    n, m = len(text), len(pattern)
+def naive_rscan(
+    text: str,
+    pattern: str,
+    tables: None = None,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
 
     if m == 0:
-        return 0
-    if n < m:
+        return end if start <= end else -1
+    if end - start < m:
         return -1
 
-    def compute_lps(p: str) -> list:
-        lps = [0] * len(p)
-        length = 0
-        for i in range(1, len(p)):
-            while length > 0 and p[i] != p[length]:
-                length = lps[length - 1]
-            if p[i] == p[length]:
-                length += 1
-                lps[i] = length
-        return lps
+    startswith = _startswith(text)
+    for i in range(end - m, start - 1, -1):
+        if startswith(pattern, i):
+            return i
+    return -1
 
-    lps = compute_lps(pattern)
-    i = j = 0
-    while i < n:
+
+def naive_search(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_search(
+            naive_preprocess, naive_scan, text, pattern, table, start, end
+        )
+    return naive_scan(text, pattern, naive_preprocess(pattern), start, end)
+
+
+def naive_rsearch(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_rsearch(
+            naive_preprocess, naive_rscan, text, pattern, table, start, end
+        )
+    return naive_rscan(text, pattern, naive_preprocess(pattern), start, end)
+
+
+# Префикс-функция (LPS) для KMP и Апостолико-Крошмора
+def compute_lps(p: str) -> list:
+    lps = [0] * len(p)
+    length = 0
+    for i in range(1, len(p)):
+        while length > 0 and p[i] != p[length]:
+            length = lps[length - 1]
+        if p[i] == p[length]:
+            length += 1
+            lps[i] = length
+    return lps
+
+
+# Алгоритм Кнута-Морриса-Пратта (KMP)
+def kmp_preprocess(pattern: str) -> list:
+    return compute_lps(pattern)
+
+
+def kmp_scan(
+    text: str,
+    pattern: str,
+    lps: list,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
+
+    if m == 0:
+        return start if start <= end else -1
+    if end - start < m:
+        return -1
+
+    i, j = start, 0
+    while i < end:
         if text[i] == pattern[j]:
             i += 1
             j += 1
@@ -54,21 +250,219 @@ def kmp_search(text: str, pattern: str) -> int:
     return -1
 
 
-# Алгоритм Бойера-Мура
-def boyer_moore_search(text: str, pattern: str) -> int:
-    n, m = len(text), len(pattern)
+def kmp_rscan(
+    text: str,
+    pattern: str,
+    lps: list,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    """lps — префикс-функция перевёрнутого паттерна."""
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
 
     if m == 0:
-        return 0
-    if n < m:
+        return end if start <= end else -1
+    if end - start < m:
         return -1
 
-    def bad_char_heuristic(p: str) -> dict:
-        return {p[i]: i for i in range(len(p))}
+    i, j = end - 1, 0
+    while i >= start:
+        if text[i] == pattern[m - 1 - j]:
+            i -= 1
+            j += 1
+            if j == m:
+                return i + 1
+        else:
+            if j != 0:
+                j = lps[j - 1]
+            else:
+                i -= 1
+    return -1
 
-    bad_char = bad_char_heuristic(pattern)
-    s = 0
-    while s <= n - m:
+
+def kmp_search(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_search(
+            kmp_preprocess, kmp_scan, text, pattern, table, start, end
+        )
+    return kmp_scan(text, pattern, kmp_preprocess(pattern), start, end)
+
+
+def kmp_rsearch(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_rsearch(
+            kmp_preprocess, kmp_rscan, text, pattern, table, start, end
+        )
+    return kmp_rscan(
+        text, pattern, kmp_preprocess(pattern[::-1]), start, end
+    )
+
+
+# KMP, скомпилированный в детерминированный автомат (DFA)
+DFA_MAX_CELLS = 1 << 20
+
+
+def kmp_dfa_preprocess(pattern: str, max_cells: int = DFA_MAX_CELLS) -> tuple:
+    """Таблица переходов автомата по сжатому алфавиту паттерна.
+
+    Возвращает (классы, таблица, lps): классы — {символ: столбец},
+    таблица — плоский array, где состояние хранится сразу как смещение
+    строки (j * k), поэтому переход — одно обращение table[state + col].
+    Символы не из паттерна переводят автомат в начальное состояние.
+    Если таблица больше max_cells ячеек, классы и таблица — None,
+    и поиск идёт по префикс-функции, как в kmp_scan.
+    """
+    m = len(pattern)
+    lps = compute_lps(pattern)
+    classes = {c: col for col, c in enumerate(sorted(set(pattern)))}
+    k = len(classes)
+    if m == 0 or k * (m + 1) > max_cells:
+        return None, None, lps
+
+    table = array("l", [0]) * (k * (m + 1))
+    for j in range(m + 1):
+        for c, col in classes.items():
+            if j < m and pattern[j] == c:
+                target = (j + 1) * k
+            elif j == 0:
+                target = 0
+            else:
+                # Переход из j совпадает с переходом из lps[j - 1]
+                target = table[lps[j - 1] * k + col]
+            table[j * k + col] = target
+    return classes, table, lps
+
+
+def kmp_dfa_scan(
+    text: str,
+    pattern: str,
+    tables: tuple,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    classes, table, lps = tables
+    if classes is None:
+        return kmp_scan(text, pattern, lps, start, end)
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
+
+    if end - start < m:
+        return -1
+
+    accept = m * len(classes)
+    get = classes.get
+    state = 0
+    # Индексирование, а не итерация: у mmap итерация даёт bytes длины 1,
+    # а text[i] — код байта, как у bytes
+    for i in range(start, end):
+        col = get(text[i])
+        state = table[state + col] if col is not None else 0
+        if state == accept:
+            return i - m + 1
+    return -1
+
+
+def kmp_dfa_rscan(
+    text: str,
+    pattern: str,
+    tables: tuple,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    """tables — автомат перевёрнутого паттерна."""
+    classes, table, lps = tables
+    if classes is None:
+        return kmp_rscan(text, pattern, lps, start, end)
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
+
+    if end - start < m:
+        return -1
+
+    accept = m * len(classes)
+    get = classes.get
+    state = 0
+    for i in range(end - 1, start - 1, -1):
+        col = get(text[i])
+        state = table[state + col] if col is not None else 0
+        if state == accept:
+            return i
+    return -1
+
+
+def kmp_dfa_search(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_search(
+            kmp_dfa_preprocess, kmp_dfa_scan, text, pattern, table,
+            start, end
+        )
+    return kmp_dfa_scan(
+        text, pattern, kmp_dfa_preprocess(pattern), start, end
+    )
+
+
+def kmp_dfa_rsearch(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_rsearch(
+            kmp_dfa_preprocess, kmp_dfa_rscan, text, pattern, table,
+            start, end
+        )
+    return kmp_dfa_rscan(
+        text, pattern, kmp_dfa_preprocess(pattern[::-1]), start, end
+    )
+
+
+# Алгоритм Бойера-Мура
+def bad_char_heuristic(p: str) -> dict:
+    return {p[i]: i for i in range(len(p))}
+
+
+def boyer_moore_preprocess(pattern: str) -> dict:
+    return bad_char_heuristic(pattern)
+
+
+def boyer_moore_scan(
+    text: str,
+    pattern: str,
+    bad_char: dict,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
+
+    if m == 0:
+        return start if start <= end else -1
+    if end - start < m:
+        return -1
+
+    s = start
+    while s <= end - m:
         j = m - 1
         while j >= 0 and pattern[j] == text[s + j]:
             j -= 1
@@ -79,32 +473,111 @@ def boyer_moore_search(text: str, pattern: str) -> int:
     return -1
 
 
-# Алгоритм Рабина-Карпа
-def rabin_karp_search(
+def boyer_moore_rscan(
     text: str,
     pattern: str,
-    d: int = 256,
-    q: int = 101
+    bad_char: dict,
+    start: int = 0,
+    end: Optional[int] = None
 ) -> int:
-    n, m = len(text), len(pattern)
+    """bad_char — таблица стоп-символов перевёрнутого паттерна: окно
+    сравнивается слева направо и сдвигается влево."""
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
 
     if m == 0:
-        return 0
-    if n < m:
+        return end if start <= end else -1
+    if end - start < m:
         return -1
 
-    h_pattern = h_window = 0
-    h = pow(d, m - 1, q)
+    s = end - m
+    while s >= start:
+        j = m - 1
+        while j >= 0 and pattern[m - 1 - j] == text[s + m - 1 - j]:
+            j -= 1
+        if j < 0:
+            return s
+        else:
+            s -= max(1, j - bad_char.get(text[s + m - 1 - j], -1))
+    return -1
+
+
+def boyer_moore_search(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_search(
+            boyer_moore_preprocess, boyer_moore_scan, text, pattern, table,
+            start, end
+        )
+    return boyer_moore_scan(
+        text, pattern, boyer_moore_preprocess(pattern), start, end
+    )
 
+
+def boyer_moore_rsearch(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_rsearch(
+            boyer_moore_preprocess, boyer_moore_rscan, text, pattern, table,
+            start, end
+        )
+    return boyer_moore_rscan(
+        text, pattern, boyer_moore_preprocess(pattern[::-1]), start, end
+    )
+
+
+# Алгоритм Рабина-Карпа
+def rabin_karp_preprocess(
+    pattern: str,
+    d: int = 256,
+    q: int = 101
+) -> tuple:
+    """Хеш паттерна и множитель d^(m-1) mod q для скользящего хеша."""
+    m = len(pattern)
+    h_pattern = 0
     for i in range(m):
         h_pattern = (d * h_pattern + ord(pattern[i])) % q
+    return h_pattern, pow(d, max(m - 1, 0), q)
+
+
+def rabin_karp_scan(
+    text: str,
+    pattern: str,
+    tables: tuple,
+    d: int = 256,
+    q: int = 101,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
+
+    if m == 0:
+        return start if start <= end else -1
+    if end - start < m:
+        return -1
+
+    h_pattern, h = tables
+    # Начальный хеш окна зависит от текста, поэтому считается при проходе
+    h_window = 0
+    for i in range(start, start + m):
         h_window = (d * h_window + ord(text[i])) % q
 
-    for i in range(n - m + 1):
+    for i in range(start, end - m + 1):
         if h_pattern == h_window:
-            if text[i:i + m] == pattern:
+            if text.startswith(pattern, i):
                 return i
-        if i < n - m:
+        if i < end - m:
             h_window = (
                 d * (h_window - ord(text[i]) * h)
                 + ord(text[i + m])
@@ -114,29 +587,108 @@ def rabin_karp_search(
     return -1
 
 
-def apostolico_crochemore_search(text: str, pattern: str) -> int:
-    n, m = len(text), len(pattern)
-    if m == 0 or n == 0:
-        return -1
-    if m > n:
+def rabin_karp_rscan(
+    text: str,
+    pattern: str,
+    tables: tuple,
+    d: int = 256,
+    q: int = 101,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    """tables — хеш перевёрнутого паттерна: окно хешируется справа
+    налево и скользит влево."""
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
+
+    if m == 0:
+        return end if start <= end else -1
+    if end - start < m:
         return -1
 
-    # Построение префиксной функции (LPS)
-    def compute_lps(p):
-        lps = [0] * m
-        length = 0
-        for i in range(1, m):
-            while length > 0 and p[i] != p[length]:
-                length = lps[length - 1]
-            if p[i] == p[length]:
-                length += 1
-                lps[i] = length
-        return lps
+    h_pattern, h = tables
+    h_window = 0
+    for i in range(end - 1, end - m - 1, -1):
+        h_window = (d * h_window + ord(text[i])) % q
 
-    lps = compute_lps(pattern)
-    shift = 0
+    for i in range(end - m, start - 1, -1):
+        if h_pattern == h_window:
+            if text.startswith(pattern, i):
+                return i
+        if i > start:
+            h_window = (
+                d * (h_window - ord(text[i + m - 1]) * h)
+                + ord(text[i - 1])
+            ) % q
+            if h_window < 0:
+                h_window += q
+    return -1
+
+
+def rabin_karp_search(
+    text: str,
+    pattern: str,
+    d: int = 256,
+    q: int = 101,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_search(
+            partial(rabin_karp_preprocess, d=d, q=q),
+            partial(rabin_karp_scan, d=d, q=q),
+            text, pattern, table, start, end
+        )
+    return rabin_karp_scan(
+        text, pattern, rabin_karp_preprocess(pattern, d, q), d, q,
+        start, end
+    )
+
+
+def rabin_karp_rsearch(
+    text: str,
+    pattern: str,
+    d: int = 256,
+    q: int = 101,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_rsearch(
+            partial(rabin_karp_preprocess, d=d, q=q),
+            partial(rabin_karp_rscan, d=d, q=q),
+            text, pattern, table, start, end
+        )
+    return rabin_karp_rscan(
+        text, pattern, rabin_karp_preprocess(pattern[::-1], d, q), d, q,
+        start, end
+    )
+
+
+# Алгоритм Апостолико-Крошмора
+def apostolico_crochemore_preprocess(pattern: str) -> list:
+    return compute_lps(pattern)
+
+
+def apostolico_crochemore_scan(
+    text: str,
+    pattern: str,
+    lps: list,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
+    if m == 0 or end <= start:
+        return -1
+    if m > end - start:
+        return -1
+
+    shift = start
     j = 0
-    while shift <= n - m:
+    while shift <= end - m:
         while j < m and pattern[j] == text[shift + j]:
             j += 1
         if j == m:
@@ -149,49 +701,128 @@ def apostolico_crochemore_search(text: str, pattern: str) -> int:
     return -1
 
 
-def aho_corasick_search(text: str, pattern: str) -> int:
-    from collections import deque
+def apostolico_crochemore_rscan(
+    text: str,
+    pattern: str,
+    lps: list,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    """lps — префикс-функция перевёрнутого паттерна."""
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
+    if m == 0 or end <= start:
+        return -1
+    if m > end - start:
+        return -1
+
+    shift = end - m
+    j = 0
+    while shift >= start:
+        last = shift + m - 1
+        while j < m and pattern[m - 1 - j] == text[last - j]:
+            j += 1
+        if j == m:
+            return shift
+        if j == 0:
+            shift -= 1
+        else:
+            shift -= max(1, j - lps[j - 1])
+        j = 0
+    return -1
+
+
+def apostolico_crochemore_search(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_search(
+            apostolico_crochemore_preprocess, apostolico_crochemore_scan,
+            text, pattern, table, start, end
+        )
+    return apostolico_crochemore_scan(
+        text, pattern, apostolico_crochemore_preprocess(pattern), start, end
+    )
+
+
+def apostolico_crochemore_rsearch(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_rsearch(
+            apostolico_crochemore_preprocess, apostolico_crochemore_rscan,
+            text, pattern, table, start, end
+        )
+    return apostolico_crochemore_rscan(
+        text, pattern, apostolico_crochemore_preprocess(pattern[::-1]),
+        start, end
+    )
+
+
+# Алгоритм Ахо-Корасик
+class TrieNode:
+    def __init__(self):
+        self.children = {}
+        self.fail = None
+        self.output = []
+
+
+def build_trie(pattern: str) -> TrieNode:
+    root = TrieNode()
+    node = root
+    for char in pattern:
+        if char not in node.children:
+            node.children[char] = TrieNode()
+        node = node.children[char]
+    node.output.append(0)
+    return root
 
-    class Node:
-        def __init__(self):
-            self.children = {}
-            self.fail = None
-            self.output = []
 
-    def build_trie(pattern):
-        root = Node()
-        node = root
-        for char in pattern:
-            if char not in node.children:
-                node.children[char] = Node()
-            node = node.children[char]
-        node.output.append(0)
-        return root
+def build_failure_links(root: TrieNode) -> None:
+    queue = deque()
+    for child in root.children.values():
+        child.fail = root
+        queue.append(child)
 
-    def build_failure_links(root):
-        queue = deque()
-        for child in root.children.values():
-            child.fail = root
+    while queue:
+        current = queue.popleft()
+        for key, child in current.children.items():
+            fail = current.fail
+            while fail and key not in fail.children:
+                fail = fail.fail
+            if fail and key in fail.children:
+                child.fail = fail.children[key]
+            else:
+                child.fail = root
+            child.output += child.fail.output
             queue.append(child)
 
-        while queue:
-            current = queue.popleft()
-            for key, child in current.children.items():
-                fail = current.fail
-                while fail and key not in fail.children:
-                    fail = fail.fail
-                if fail and key in fail.children:
-                    child.fail = fail.children[key]
-                else:
-                    child.fail = root
-                child.output += child.fail.output
-                queue.append(child)
 
+def aho_corasick_preprocess(pattern: str) -> TrieNode:
     root = build_trie(pattern)
     build_failure_links(root)
+    return root
+
 
+def aho_corasick_scan(
+    text: str,
+    pattern: str,
+    root: TrieNode,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    start, end = _bounds(len(text), start, end)
     node = root
-    for i, c in enumerate(text):
+    for i in range(start, end):
+        c = text[i]
         while node and c not in node.children:
             node = node.fail
         if not node:
@@ -203,6 +834,213 @@ def aho_corasick_search(text: str, pattern: str) -> int:
     return -1
 
 
+def aho_corasick_rscan(
+    text: str,
+    pattern: str,
+    root: TrieNode,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    """root — автомат перевёрнутого паттерна."""
+    start, end = _bounds(len(text), start, end)
+    node = root
+    for i in range(end - 1, start - 1, -1):
+        c = text[i]
+        while node and c not in node.children:
+            node = node.fail
+        if not node:
+            node = root
+            continue
+        node = node.children[c]
+        if node.output:
+            return i
+    return -1
+
+
+def aho_corasick_search(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_search(
+            aho_corasick_preprocess, aho_corasick_scan, text, pattern, table,
+            start, end
+        )
+    return aho_corasick_scan(
+        text, pattern, aho_corasick_preprocess(pattern), start, end
+    )
+
+
+def aho_corasick_rsearch(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_rsearch(
+            aho_corasick_preprocess, aho_corasick_rscan, text, pattern, table,
+            start, end
+        )
+    return aho_corasick_rscan(
+        text, pattern, aho_corasick_preprocess(pattern[::-1]), start, end
+    )
+
+
+# Интроспективный поиск: Бойер-Мур с откатом на KMP
+INTRO_BUDGET = 4
+
+
+def intro_preprocess(pattern: str) -> tuple:
+    """Таблица стоп-символов для Бойера-Мура и LPS для отката на KMP."""
+    return bad_char_heuristic(pattern), compute_lps(pattern)
+
+
+def intro_scan(
+    text: str,
+    pattern: str,
+    tables: tuple,
+    start: int = 0,
+    end: Optional[int] = None,
+    budget: int = INTRO_BUDGET
+) -> int:
+    """Бойер-Мур, пока сравнений не больше budget на символ пройденного
+    текста, затем KMP с текущей позиции. Все позиции левее неё Бойер-Мур
+    уже исключил, поэтому худший случай — O(budget * n + m), а на обычных
+    данных работает только Бойер-Мур."""
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
+
+    if m == 0:
+        return start if start <= end else -1
+    if end - start < m:
+        return -1
+
+    bad_char, lps = tables
+    work = 0
+    s = start
+    while s <= end - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == text[s + j]:
+            j -= 1
+        if j < 0:
+            return s
+        work += m - j
+        if work > budget * (s - start + m):
+            return kmp_scan(text, pattern, lps, s, end)
+        s += max(1, j - bad_char.get(text[s + j], -1))
+    return -1
+
+
+def intro_rscan(
+    text: str,
+    pattern: str,
+    tables: tuple,
+    start: int = 0,
+    end: Optional[int] = None,
+    budget: int = INTRO_BUDGET
+) -> int:
+    """tables — таблицы перевёрнутого паттерна."""
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
+
+    if m == 0:
+        return end if start <= end else -1
+    if end - start < m:
+        return -1
+
+    bad_char, lps = tables
+    work = 0
+    s = end - m
+    while s >= start:
+        j = m - 1
+        while j >= 0 and pattern[m - 1 - j] == text[s + m - 1 - j]:
+            j -= 1
+        if j < 0:
+            return s
+        work += m - j
+        if work > budget * (end - s):
+            return kmp_rscan(text, pattern, lps, start, s + m)
+        s -= max(1, j - bad_char.get(text[s + m - 1 - j], -1))
+    return -1
+
+
+def intro_search(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_search(
+            intro_preprocess, intro_scan, text, pattern, table, start, end
+        )
+    return intro_scan(text, pattern, intro_preprocess(pattern), start, end)
+
+
+def intro_rsearch(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_rsearch(
+            intro_preprocess, intro_rscan, text, pattern, table, start, end
+        )
+    return intro_rscan(
+        text, pattern, intro_preprocess(pattern[::-1]), start, end
+    )
+
+
+# Фазы алгоритмов: имя -> (предобработка, проход по тексту)
+PHASES = {
+    "naive": (naive_preprocess, naive_scan),
+    "kmp": (kmp_preprocess, kmp_scan),
+    "kmp_dfa": (kmp_dfa_preprocess, kmp_dfa_scan),
+    "boyer_moore": (boyer_moore_preprocess, boyer_moore_scan),
+    "rabin_karp": (rabin_karp_preprocess, rabin_karp_scan),
+    "apostolico_crochemore": (
+        apostolico_crochemore_preprocess, apostolico_crochemore_scan
+    ),
+    "aho_corasick": (aho_corasick_preprocess, aho_corasick_scan),
+    "intro": (intro_preprocess, intro_scan)
+}
+
+# Фазы поиска с конца: имя -> (предобработка, проход справа налево);
+# предобработке передаётся перевёрнутый паттерн
+REVERSE_PHASES = {
+    "naive": (naive_preprocess, naive_rscan),
+    "kmp": (kmp_preprocess, kmp_rscan),
+    "kmp_dfa": (kmp_dfa_preprocess, kmp_dfa_rscan),
+    "boyer_moore": (boyer_moore_preprocess, boyer_moore_rscan),
+    "rabin_karp": (rabin_karp_preprocess, rabin_karp_rscan),
+    "apostolico_crochemore": (
+        apostolico_crochemore_preprocess, apostolico_crochemore_rscan
+    ),
+    "aho_corasick": (aho_corasick_preprocess, aho_corasick_rscan),
+    "intro": (intro_preprocess, intro_rscan)
+}
+
+# Поиск последнего вхождения: имя -> *_rsearch
+REVERSE_SEARCH = {
+    "naive": naive_rsearch,
+    "kmp": kmp_rsearch,
+    "kmp_dfa": kmp_dfa_rsearch,
+    "boyer_moore": boyer_moore_rsearch,
+    "rabin_karp": rabin_karp_rsearch,
+    "apostolico_crochemore": apostolico_crochemore_rsearch,
+    "aho_corasick": aho_corasick_rsearch,
+    "intro": intro_rsearch
+}
+
+
 if __name__ == "__main__":
     text = "ABABDABACDABABCABAB"
     pattern = "ABABCABAB"
@@ -2,10 +2,17 @@ import random
 import string
 from typing import List, Tuple, Dict
 
+# Случайные байты -> символы 'A', 'B', 'C' (потоковая запись)
+_ABC_TABLE = bytes(b"ABC"[i % 3] for i in range(256))
+
 
 class TestDataGenerator:
     def __init__(self):
         self.sizes = [2**i for i in range(10, 25)]  # 1 КБ — 16 МБ
+        # Уровень больших входов: пишутся на диск, в памяти не строятся
+        self.large_sizes = [2**i for i in range(26, 33)]  # 64 МБ — 4 ГБ
+        # Паттерн хранится строкой, поэтому его длина ограничена
+        self.large_pattern_max = 1 << 16
         self.characters = string.ascii_letters + string.digits
 
     def generate_all_cases(self) -> Dict[
@@ -13,23 +20,29 @@ class TestDataGenerator:
     ]:
         data = {}
         for algo in ['naive', 'kmp', 'boyer_moore', 'rabin_karp',
-                     'apostolico_crochemore', 'aho_corasick']:
+                     'apostolico_crochemore', 'aho_corasick', 'intro',
+                     'kmp_dfa']:
             data[algo] = {
-                'best': [
-                    self._generate_best_case(size)
-                    for size in self.sizes
-                ],
-                'worst': [
-                    self._generate_worst_case(algo, size)
-                    for size in self.sizes
-                ],
-                'random': [
-                    self._generate_random_case(size)
+                case: [
+                    self.generate_case(algo, case, size)
                     for size in self.sizes
                 ]
+                for case in ('best', 'worst', 'random')
             }
         return data
 
+    def generate_case(
+        self, algo: str, case: str, size: int
+    ) -> Tuple[str, str]:
+        """Генерирует данные для одной ячейки (алгоритм, случай, размер)."""
+        if case == 'best':
+            return self._generate_best_case(size)
+        if case == 'worst':
+            return self._generate_worst_case(algo, size)
+        if case == 'random':
+            return self._generate_random_case(size)
+        raise ValueError(f"Неизвестный случай: {case}")
+
     def _generate_best_case(self, size: int) -> Tuple[str, str]:
         pattern_length = max(100, size // 10)
         pattern = 'A' * pattern_length
@@ -37,35 +50,32 @@ class TestDataGenerator:
         return text, pattern
 
     def _generate_worst_case(self, algo: str, size: int) -> Tuple[str, str]:
+        pattern, unit = self._worst_case_unit(algo)
+        return self._generate_repeating_pattern(unit, size), pattern
+
+    def _worst_case_unit(self, algo: str) -> Tuple[str, str]:
+        """Паттерн худшего случая и звено, повторением которого
+        строится текст."""
         if algo == 'naive':
-            pattern = 'A' * 999 + 'B'
-            text = 'A' * size
-        elif algo == 'kmp':
-            pattern = 'A' * 1000 + 'B'
-            text = self._generate_repeating_pattern(
-                'A' * 999 + 'C', size
-            )
-        elif algo == 'boyer_moore':
-            pattern = 'A' * 100 + 'B'
-            text = self._generate_repeating_pattern(
-                'A' * 100 + 'C', size
-            )
-        elif algo == 'rabin_karp':
+            return 'A' * 999 + 'B', 'A'
+        if algo in ('kmp', 'kmp_dfa'):
+            return 'A' * 1000 + 'B', 'A' * 999 + 'C'
+        if algo == 'boyer_moore':
+            return 'A' * 100 + 'B', 'A' * 100 + 'C'
+        if algo == 'rabin_karp':
             pattern = "ABC"
             fake_match = "ABC"
             noise = "X"
-            base_unit = fake_match[:-1] + noise  # "ABX"
-            text = (
-                base_unit * (size // len(base_unit) + 1)
-            )[:size]
-        elif algo == 'apostolico_crochemore':
-            pattern = 'A' * 1000 + 'B'
-            text = 'A' * size
-        elif algo == 'aho_corasick':
-            pattern = 'ABC'
-            base_unit = 'ABA'
-            text = (base_unit * (size // len(base_unit) + 1))[:size]
-        return text[:size], pattern
+            return pattern, fake_match[:-1] + noise  # "ABX"
+        if algo == 'apostolico_crochemore':
+            return 'A' * 1000 + 'B', 'A'
+        if algo == 'aho_corasick':
+            return 'ABC', 'ABA'
+        if algo == 'intro':
+            # Худший случай Бойера-Мура с эвристикой стоп-символа:
+            # m - 1 совпадений на каждое окно и сдвиг на 1
+            return 'B' + 'A' * 999, 'A'
+        raise ValueError(f"Неизвестный алгоритм: {algo}")
 
     def _generate_random_case(self, size: int) -> Tuple[str, str]:
         text = ''.join(random.choices(['A', 'B', 'C'], k=size))
@@ -84,6 +94,73 @@ class TestDataGenerator:
             pattern * (target_length // len(pattern) + 1)
         )[:target_length]
 
+    def write_case(
+        self,
+        algo: str,
+        case: str,
+        size: int,
+        path: str,
+        chunk_size: int = 1 << 20
+    ) -> str:
+        """Пишет текст ячейки в файл path частями по chunk_size байт, не
+        собирая его в памяти, и возвращает паттерн.
+
+        Случаи те же, что у generate_case, но длина паттерна не больше
+        large_pattern_max.
+        """
+        with open(path, "wb") as f:
+            if case == 'best':
+                pattern_length = min(
+                    max(100, size // 10), self.large_pattern_max, size
+                )
+                pattern = 'A' * pattern_length
+                self._write_repeated(f, pattern, pattern_length, chunk_size)
+                self._write_repeated(
+                    f, 'B', size - pattern_length, chunk_size
+                )
+            elif case == 'worst':
+                pattern, unit = self._worst_case_unit(algo)
+                self._write_repeated(f, unit, size, chunk_size)
+            elif case == 'random':
+                pattern = self._write_random(f, size, chunk_size)
+            else:
+                raise ValueError(f"Неизвестный случай: {case}")
+        return pattern
+
+    def _write_repeated(
+        self, f, unit: str, length: int, chunk_size: int
+    ) -> None:
+        # Кусок кратен длине звена, чтобы повторение не сбивалось на стыках
+        piece = (unit * max(1, chunk_size // len(unit))).encode("ascii")
+        while length > 0:
+            f.write(piece[:length])
+            length -= min(len(piece), length)
+
+    def _write_random(self, f, size: int, chunk_size: int) -> str:
+        pattern_length = min(
+            max(10, size // 100), self.large_pattern_max, size
+        )
+        absent = random.random() < 0.3
+        # Иначе паттерн вырезается из текста по мере записи
+        pos = -1 if absent else random.randint(0, size - pattern_length)
+        pieces = []
+        written = 0
+        for chunk in self._random_chunks(size, chunk_size):
+            lo = max(pos - written, 0)
+            hi = min(pos + pattern_length - written, len(chunk))
+            if lo < hi:
+                pieces.append(chunk[lo:hi])
+            f.write(chunk)
+            written += len(chunk)
+        if absent:
+            return 'A' * (pattern_length - 1) + 'X'
+        return b"".join(pieces).decode("ascii")
+
+    def _random_chunks(self, size: int, chunk_size: int):
+        for start in range(0, size, chunk_size):
+            n = min(chunk_size, size - start)
+            yield random.randbytes(n).translate(_ABC_TABLE)
+
 
 # Пример использования
 if __name__ == "__main__":
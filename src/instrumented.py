@@ -0,0 +1,391 @@
+"""
+Модуль instrumented.py: Инструментированные версии алгоритмов из
+algorithms.py, подсчитывающие элементарные операции.
+
+Каждая функция повторяет логику исходного алгоритма и возвращает пару
+(индекс, счётчики). Исходные алгоритмы не меняются, поэтому без явного
+вызова этих версий накладных расходов нет.
+
+Общие счётчики:
+    comparisons       — сравнения символов текста и паттерна;
+    shifts            — сдвиги окна (позиции паттерна относительно текста);
+    shift_total       — суммарная длина сдвигов;
+    avg_shift         — средняя длина сдвига;
+    preprocess_steps  — шаги построения вспомогательных таблиц.
+"""
+from collections import deque
+from typing import Dict, Tuple
+
+from src.algorithms import DFA_MAX_CELLS, INTRO_BUDGET
+
+Counters = Dict[str, float]
+
+
+def _new_counters(**extra: int) -> Counters:
+    counters = {
+        "comparisons": 0,
+        "shifts": 0,
+        "shift_total": 0,
+        "preprocess_steps": 0
+    }
+    counters.update(extra)
+    return counters
+
+
+def _finish(index: int, counters: Counters) -> Tuple[int, Counters]:
+    shifts = counters["shifts"]
+    counters["avg_shift"] = counters["shift_total"] / shifts if shifts else 0
+    return index, counters
+
+
+def _compute_lps(p: str, counters: Counters) -> list:
+    lps = [0] * len(p)
+    length = 0
+    for i in range(1, len(p)):
+        while length > 0 and p[i] != p[length]:
+            counters["preprocess_steps"] += 1
+            length = lps[length - 1]
+        counters["preprocess_steps"] += 1
+        if p[i] == p[length]:
+            length += 1
+            lps[i] = length
+    return lps
+
+
+def _kmp_scan(
+    text: str, pattern: str, lps: list, i: int, counters: Counters
+) -> int:
+    """Проход KMP по тексту начиная с позиции i."""
+    n, m = len(text), len(pattern)
+    j = 0
+    while i < n:
+        counters["comparisons"] += 1
+        if text[i] == pattern[j]:
+            i += 1
+            j += 1
+            if j == m:
+                return i - j
+        else:
+            counters["shifts"] += 1
+            if j != 0:
+                counters["shift_total"] += j - lps[j - 1]
+                j = lps[j - 1]
+            else:
+                counters["shift_total"] += 1
+                i += 1
+    return -1
+
+
+def naive_search_counted(text: str, pattern: str) -> Tuple[int, Counters]:
+    counters = _new_counters()
+    n, m = len(text), len(pattern)
+
+    if m == 0:
+        return _finish(0, counters)
+    if n < m:
+        return _finish(-1, counters)
+
+    for i in range(n - m + 1):
+        # text.startswith(pattern, i) сравнивает символы до
+        # первого несовпадения
+        k = 0
+        while k < m:
+            counters["comparisons"] += 1
+            if text[i + k] != pattern[k]:
+                break
+            k += 1
+        if k == m:
+            return _finish(i, counters)
+        counters["shifts"] += 1
+        counters["shift_total"] += 1
+    return _finish(-1, counters)
+
+
+def kmp_search_counted(text: str, pattern: str) -> Tuple[int, Counters]:
+    counters = _new_counters()
+    n, m = len(text), len(pattern)
+
+    if m == 0:
+        return _finish(0, counters)
+    if n < m:
+        return _finish(-1, counters)
+
+    lps = _compute_lps(pattern, counters)
+    return _finish(_kmp_scan(text, pattern, lps, 0, counters), counters)
+
+
+def kmp_dfa_search_counted(
+    text: str, pattern: str, max_cells: int = DFA_MAX_CELLS
+) -> Tuple[int, Counters]:
+    """Сравнением считается переход автомата (одно обращение к таблице
+    на символ текста), шагом предобработки — заполненная ячейка таблицы.
+    Дополнительно: fallbacks — 1, если таблица превысила max_cells и поиск
+    шёл по префикс-функции."""
+    counters = _new_counters(fallbacks=0)
+    n, m = len(text), len(pattern)
+
+    if m == 0:
+        return _finish(0, counters)
+    if n < m:
+        return _finish(-1, counters)
+
+    lps = _compute_lps(pattern, counters)
+    alphabet = sorted(set(pattern))
+    if len(alphabet) * (m + 1) > max_cells:
+        counters["fallbacks"] = 1
+        return _finish(_kmp_scan(text, pattern, lps, 0, counters), counters)
+
+    delta = [{} for _ in range(m + 1)]
+    for j in range(m + 1):
+        for c in alphabet:
+            counters["preprocess_steps"] += 1
+            if j < m and pattern[j] == c:
+                delta[j][c] = j + 1
+            elif j == 0:
+                delta[j][c] = 0
+            else:
+                delta[j][c] = delta[lps[j - 1]][c]
+
+    j = 0
+    for i, c in enumerate(text):
+        counters["comparisons"] += 1
+        target = delta[j].get(c, 0)
+        # Выравнивание паттерна сдвигается с i - j на i + 1 - target
+        shift = j + 1 - target
+        if shift > 0:
+            counters["shifts"] += 1
+            counters["shift_total"] += shift
+        j = target
+        if j == m:
+            return _finish(i - m + 1, counters)
+    return _finish(-1, counters)
+
+
+def boyer_moore_search_counted(
+    text: str, pattern: str
+) -> Tuple[int, Counters]:
+    counters = _new_counters()
+    n, m = len(text), len(pattern)
+
+    if m == 0:
+        return _finish(0, counters)
+    if n < m:
+        return _finish(-1, counters)
+
+    bad_char = {}
+    for i in range(m):
+        counters["preprocess_steps"] += 1
+        bad_char[pattern[i]] = i
+
+    s = 0
+    while s <= n - m:
+        j = m - 1
+        while j >= 0:
+            counters["comparisons"] += 1
+            if pattern[j] != text[s + j]:
+                break
+            j -= 1
+        if j < 0:
+            return _finish(s, counters)
+        shift = max(1, j - bad_char.get(text[s + j], -1))
+        counters["shifts"] += 1
+        counters["shift_total"] += shift
+        s += shift
+    return _finish(-1, counters)
+
+
+def rabin_karp_search_counted(
+    text: str,
+    pattern: str,
+    d: int = 256,
+    q: int = 101
+) -> Tuple[int, Counters]:
+    """Дополнительно: hash_hits — совпадения хешей, spurious_hits —
+    ложные совпадения (коллизии), потребовавшие проверки посимвольно."""
+    counters = _new_counters(hash_hits=0, spurious_hits=0)
+    n, m = len(text), len(pattern)
+
+    if m == 0:
+        return _finish(0, counters)
+    if n < m:
+        return _finish(-1, counters)
+
+    h_pattern = h_window = 0
+    h = pow(d, m - 1, q)
+
+    for i in range(m):
+        counters["preprocess_steps"] += 1
+        h_pattern = (d * h_pattern + ord(pattern[i])) % q
+        h_window = (d * h_window + ord(text[i])) % q
+
+    for i in range(n - m + 1):
+        if h_pattern == h_window:
+            counters["hash_hits"] += 1
+            k = 0
+            while k < m:
+                counters["comparisons"] += 1
+                if text[i + k] != pattern[k]:
+                    break
+                k += 1
+            if k == m:
+                return _finish(i, counters)
+            counters["spurious_hits"] += 1
+        if i < n - m:
+            counters["shifts"] += 1
+            counters["shift_total"] += 1
+            h_window = (
+                d * (h_window - ord(text[i]) * h)
+                + ord(text[i + m])
+            ) % q
+            if h_window < 0:
+                h_window += q
+    return _finish(-1, counters)
+
+
+def apostolico_crochemore_search_counted(
+    text: str, pattern: str
+) -> Tuple[int, Counters]:
+    counters = _new_counters()
+    n, m = len(text), len(pattern)
+    if m == 0 or n == 0:
+        return _finish(-1, counters)
+    if m > n:
+        return _finish(-1, counters)
+
+    lps = _compute_lps(pattern, counters)
+    shift = 0
+    j = 0
+    while shift <= n - m:
+        while j < m:
+            counters["comparisons"] += 1
+            if pattern[j] != text[shift + j]:
+                break
+            j += 1
+        if j == m:
+            return _finish(shift, counters)
+        step = 1 if j == 0 else max(1, j - lps[j - 1])
+        counters["shifts"] += 1
+        counters["shift_total"] += step
+        shift += step
+        j = 0
+    return _finish(-1, counters)
+
+
+def aho_corasick_search_counted(
+    text: str, pattern: str
+) -> Tuple[int, Counters]:
+    """Дополнительно: failure_links — переходы по суффиксным ссылкам
+    при сканировании текста. Сравнением считается проверка наличия
+    перехода по символу из текущего узла."""
+    counters = _new_counters(failure_links=0)
+
+    class Node:
+        def __init__(self, depth=0):
+            self.children = {}
+            self.fail = None
+            self.output = []
+            self.depth = depth
+
+    root = Node()
+    node = root
+    for char in pattern:
+        counters["preprocess_steps"] += 1
+        if char not in node.children:
+            node.children[char] = Node(node.depth + 1)
+        node = node.children[char]
+    node.output.append(0)
+
+    queue = deque()
+    for child in root.children.values():
+        child.fail = root
+        queue.append(child)
+    while queue:
+        current = queue.popleft()
+        for key, child in current.children.items():
+            fail = current.fail
+            while fail and key not in fail.children:
+                counters["preprocess_steps"] += 1
+                fail = fail.fail
+            counters["preprocess_steps"] += 1
+            if fail and key in fail.children:
+                child.fail = fail.children[key]
+            else:
+                child.fail = root
+            child.output += child.fail.output
+            queue.append(child)
+
+    node = root
+    for i, c in enumerate(text):
+        while node:
+            counters["comparisons"] += 1
+            if c in node.children:
+                break
+            counters["failure_links"] += 1
+            # Переход по ссылке сдвигает паттерн на разницу глубин,
+            # выход из корня — на длину совпавшего префикса плюс один
+            counters["shifts"] += 1
+            if node.fail is not None:
+                counters["shift_total"] += node.depth - node.fail.depth
+            else:
+                counters["shift_total"] += 1
+            node = node.fail
+        if not node:
+            node = root
+            continue
+        node = node.children[c]
+        if node.output:
+            return _finish(i - len(pattern) + 1, counters)
+    return _finish(-1, counters)
+
+
+def intro_search_counted(
+    text: str, pattern: str, budget: int = INTRO_BUDGET
+) -> Tuple[int, Counters]:
+    """Дополнительно: fallbacks — 1, если поиск переключился
+    с Бойера-Мура на KMP, иначе 0."""
+    counters = _new_counters(fallbacks=0)
+    n, m = len(text), len(pattern)
+
+    if m == 0:
+        return _finish(0, counters)
+    if n < m:
+        return _finish(-1, counters)
+
+    bad_char = {}
+    for i in range(m):
+        counters["preprocess_steps"] += 1
+        bad_char[pattern[i]] = i
+    lps = _compute_lps(pattern, counters)
+
+    s = 0
+    while s <= n - m:
+        j = m - 1
+        while j >= 0:
+            counters["comparisons"] += 1
+            if pattern[j] != text[s + j]:
+                break
+            j -= 1
+        if j < 0:
+            return _finish(s, counters)
+        if counters["comparisons"] > budget * (s + m):
+            counters["fallbacks"] = 1
+            return _finish(_kmp_scan(text, pattern, lps, s, counters),
+                           counters)
+        shift = max(1, j - bad_char.get(text[s + j], -1))
+        counters["shifts"] += 1
+        counters["shift_total"] += shift
+        s += shift
+    return _finish(-1, counters)
+
+
+# Соответствие имён алгоритмов бенчмарка их инструментированным версиям
+INSTRUMENTED = {
+    "naive": naive_search_counted,
+    "kmp": kmp_search_counted,
+    "kmp_dfa": kmp_dfa_search_counted,
+    "boyer_moore": boyer_moore_search_counted,
+    "rabin_karp": rabin_karp_search_counted,
+    "apostolico_crochemore": apostolico_crochemore_search_counted,
+    "aho_corasick": aho_corasick_search_counted,
+    "intro": intro_search_counted
+}
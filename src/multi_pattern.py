@@ -0,0 +1,219 @@
+"""
+Модуль multi_pattern.py: Поиск набора паттернов с пропусками текста.
+
+Оба алгоритма, как Бойер-Мур, сдвигают окно на расстояние до длины
+кратчайшего паттерна и не просматривают большую часть символов текста,
+тогда как Ахо-Корасик читает каждый символ.
+    Wu-Manber        — таблица сдвигов по блокам из B символов;
+    Commentz-Walter  — бор перевёрнутых паттернов со сдвигами shift1/shift2.
+Результат — все вхождения (номер паттерна, позиция), включая
+перекрывающиеся, в порядке позиции и номера.
+"""
+import math
+from collections import deque
+from typing import Dict, List, Optional, Sequence, Tuple
+
+Hit = Tuple[int, int]
+
+
+def _check_patterns(patterns: Sequence[str]) -> None:
+    if any(not pattern for pattern in patterns):
+        raise ValueError("Набор паттернов не должен содержать пустых строк")
+
+
+# Алгоритм Ву-Манбера
+def wu_manber_preprocess(
+    patterns: Sequence[str], block: Optional[int] = None
+) -> tuple:
+    """Возвращает (shift, hash, m, B).
+
+    Рассматриваются первые m символов каждого паттерна (m — длина
+    кратчайшего). shift — {блок: сдвиг} по всем блокам этих префиксов,
+    блокам вне таблицы соответствует сдвиг m - B + 1; hash — {блок:
+    номера паттернов}, префикс которых оканчивается этим блоком.
+    По умолчанию B = ⌈log_σ(2 * m * k)⌉ в пределах [1, m].
+    """
+    _check_patterns(patterns)
+    if not patterns:
+        return {}, {}, 0, 0
+    m = min(len(pattern) for pattern in patterns)
+    if block is None:
+        sigma = max(2, len(set("".join(patterns))))
+        block = math.ceil(math.log(2 * m * len(patterns), sigma))
+    block = max(1, min(block, m))
+
+    shift: Dict[str, int] = {}
+    hashed: Dict[str, List[int]] = {}
+    default = m - block + 1
+    for pattern_id, pattern in enumerate(patterns):
+        for q in range(block, m + 1):
+            key = pattern[q - block:q]
+            distance = m - q
+            if distance < shift.get(key, default):
+                shift[key] = distance
+        hashed.setdefault(pattern[m - block:m], []).append(pattern_id)
+    return shift, hashed, m, block
+
+
+def wu_manber_scan(
+    text: str, patterns: Sequence[str], tables: tuple
+) -> List[Hit]:
+    shift, hashed, m, block = tables
+    n = len(text)
+    hits: List[Hit] = []
+    if m == 0 or n < m:
+        return hits
+
+    default = m - block + 1
+    i = m - 1
+    while i < n:
+        key = text[i - block + 1:i + 1]
+        step = shift.get(key, default)
+        if step == 0:
+            start = i - m + 1
+            for pattern_id in hashed[key]:
+                if text.startswith(patterns[pattern_id], start):
+                    hits.append((pattern_id, start))
+            step = 1
+        i += step
+    hits.sort(key=lambda hit: (hit[1], hit[0]))
+    return hits
+
+
+def wu_manber_search(
+    text: str, patterns: Sequence[str], block: Optional[int] = None
+) -> List[Hit]:
+    return wu_manber_scan(
+        text, patterns, wu_manber_preprocess(patterns, block)
+    )
+
+
+# Алгоритм Коменц-Вальтер
+class CWNode:
+    __slots__ = (
+        "children", "depth", "parent", "fail", "output", "shift1", "shift2"
+    )
+
+    def __init__(self, depth: int = 0, parent: "CWNode" = None):
+        self.children = {}
+        self.depth = depth
+        self.parent = parent
+        self.fail = None
+        self.output = []
+        self.shift1 = 0
+        self.shift2 = 0
+
+
+def commentz_walter_preprocess(patterns: Sequence[str]) -> tuple:
+    """Бор перевёрнутых паттернов со сдвигами и таблица char.
+
+    Для узла v (слово word(v) — прочитанный справа налево суффикс окна):
+        shift1(v) — min(wmin, d(u) - d(v)) по узлам u, для которых
+                    word(v) — собственный суффикс word(u);
+        shift2(v) — то же только по концевым узлам u, и не больше
+                    shift2 родителя;
+        char(c)   — min(wmin + 1, наименьшая глубина узла с меткой c).
+    Возвращает (корень, char, wmin).
+    """
+    _check_patterns(patterns)
+    root = CWNode()
+    if not patterns:
+        return root, {}, 0
+    wmin = min(len(pattern) for pattern in patterns)
+
+    char: Dict[str, int] = {}
+    nodes = []
+    for pattern_id, pattern in enumerate(patterns):
+        node = root
+        for c in reversed(pattern):
+            child = node.children.get(c)
+            if child is None:
+                child = CWNode(node.depth + 1, node)
+                node.children[c] = child
+                nodes.append(child)
+                if child.depth < char.get(c, wmin + 1):
+                    char[c] = child.depth
+            node = child
+        node.output.append(pattern_id)
+
+    # Суффиксные ссылки, как у Ахо-Корасик; узлы идут в порядке обхода
+    # в ширину, чтобы ссылка родителя была готова раньше ссылки потомка
+    order = []
+    queue = deque([root])
+    while queue:
+        current = queue.popleft()
+        for c, child in current.children.items():
+            fail = current.fail
+            while fail is not None and c not in fail.children:
+                fail = fail.fail
+            child.fail = fail.children[c] if fail is not None else root
+            queue.append(child)
+            order.append(child)
+
+    root.shift1 = root.shift2 = wmin
+    for node in order:
+        node.shift1 = node.shift2 = wmin
+    for node in order:
+        distance = node.depth - node.fail.depth
+        if distance < node.fail.shift1:
+            node.fail.shift1 = distance
+        if node.output:
+            # Концевой узел задаёт shift2 всем узлам своей цепочки ссылок
+            target = node.fail
+            while target is not None:
+                distance = node.depth - target.depth
+                if distance < target.shift2:
+                    target.shift2 = distance
+                target = target.fail
+    for node in order:
+        if node.parent.shift2 < node.shift2:
+            node.shift2 = node.parent.shift2
+    return root, char, wmin
+
+
+def commentz_walter_scan(
+    text: str, patterns: Sequence[str], tables: tuple
+) -> List[Hit]:
+    root, char, wmin = tables
+    n = len(text)
+    hits: List[Hit] = []
+    if wmin == 0 or n < wmin:
+        return hits
+
+    default = wmin + 1
+    i = wmin - 1
+    while i < n:
+        node = root
+        j = 0
+        while True:
+            for pattern_id in node.output:
+                hits.append((pattern_id, i - j + 1))
+            if j > i:
+                c = None
+                break
+            c = text[i - j]
+            child = node.children.get(c)
+            if child is None:
+                break
+            node = child
+            j += 1
+        # Сдвиг по символу несовпадения, ограниченный shift2
+        bad = char.get(c, default) - j - 1 if c is not None else 0
+        i += min(max(node.shift1, bad), node.shift2)
+    hits.sort(key=lambda hit: (hit[1], hit[0]))
+    return hits
+
+
+def commentz_walter_search(
+    text: str, patterns: Sequence[str]
+) -> List[Hit]:
+    return commentz_walter_scan(
+        text, patterns, commentz_walter_preprocess(patterns)
+    )
+
+
+# Фазы многопаттерновых алгоритмов: имя -> (предобработка, проход)
+MULTI_PHASES = {
+    "wu_manber": (wu_manber_preprocess, wu_manber_scan),
+    "commentz_walter": (commentz_walter_preprocess, commentz_walter_scan)
+}
@@ -0,0 +1,227 @@
+"""
+Модуль qgram_index.py: Инвертированный индекс q-грамм по коллекции
+документов.
+
+Для каждой q-граммы хранится список документов, в которых она
+встречается: номера по возрастанию записываются разностями соседних
+(первый — сам номер) в array наименьшего подходящего типа ('B', 'H',
+'I' или 'Q'), и все списки склеены в один буфер. Запрос пересекает
+списки q-грамм паттерна начиная с самого короткого, а каждый
+документ-кандидат проверяется алгоритмом из реестра (src/registry.py):
+таблицы паттерна строятся один раз на запрос. Паттерны короче q
+проверяются во всех документах.
+
+Формат файла: MAGIC, длина каталога (8 байт, little-endian), каталог
+в JSON (q, число документов, порядок байтов, {грамма: [тип, смещение,
+длина]}) и буфер списков. Загруженный индекс отображает файл через mmap
+и декодирует только списки запрошенных q-грамм. Сами документы индекс
+не хранит: проверке передаётся последовательность их текстов.
+"""
+import os
+import sys
+import json
+import mmap
+from array import array
+from itertools import accumulate
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.registry import get_engine
+
+MAGIC = b"QGRAMIDX1\n"
+DEFAULT_Q = 3
+
+# Типы array для разностей в порядке роста размера элемента
+_TYPECODES = ("B", "H", "I", "Q")
+
+
+def _typecode(max_value: int) -> str:
+    for code in _TYPECODES:
+        if max_value < 1 << (8 * array(code).itemsize):
+            return code
+    raise OverflowError("Номер документа не помещается в 64 бита")
+
+
+def encode_postings(doc_ids: Sequence[int]) -> Tuple[str, bytes]:
+    """Возрастающие номера -> (тип array, байты разностей)."""
+    deltas = [doc_ids[0]] + [
+        doc_ids[i] - doc_ids[i - 1] for i in range(1, len(doc_ids))
+    ]
+    code = _typecode(max(deltas))
+    return code, array(code, deltas).tobytes()
+
+
+def decode_postings(code: str, data, byteswap: bool = False) -> List[int]:
+    deltas = array(code)
+    deltas.frombytes(data)
+    if byteswap:
+        deltas.byteswap()
+    return list(accumulate(deltas))
+
+
+class QGramIndex:
+    def __init__(
+        self,
+        q: int,
+        n_documents: int,
+        directory: Dict[str, list],
+        buffer,
+        byteorder: str = sys.byteorder
+    ):
+        self.q = q
+        self.n_documents = n_documents
+        # грамма -> [тип array, смещение в buffer, длина в байтах]
+        self.directory = directory
+        self.buffer = buffer
+        self.byteorder = byteorder
+        self._file = None
+        self._mmap = None
+
+    @classmethod
+    def build(
+        cls, documents: Iterable[str], q: int = DEFAULT_Q
+    ) -> "QGramIndex":
+        if q < 1:
+            raise ValueError("q должно быть не меньше 1")
+        postings: Dict[str, array] = {}
+        n_documents = 0
+        for doc_id, document in enumerate(documents):
+            n_documents += 1
+            for gram in {
+                document[i:i + q] for i in range(len(document) - q + 1)
+            }:
+                ids = postings.get(gram)
+                if ids is None:
+                    ids = postings[gram] = array("Q")
+                ids.append(doc_id)
+
+        directory = {}
+        buffer = bytearray()
+        for gram, ids in postings.items():
+            code, data = encode_postings(ids)
+            directory[gram] = [code, len(buffer), len(data)]
+            buffer += data
+        return cls(q, n_documents, directory, bytes(buffer))
+
+    @property
+    def nbytes(self) -> int:
+        """Размер буфера списков, байт."""
+        return len(self.buffer)
+
+    def postings(self, gram: str) -> List[int]:
+        entry = self.directory.get(gram)
+        if entry is None:
+            return []
+        code, offset, length = entry
+        return decode_postings(
+            code, self.buffer[offset:offset + length],
+            self.byteorder != sys.byteorder
+        )
+
+    def candidates(self, pattern: str) -> Sequence[int]:
+        """Документы, содержащие все q-граммы паттерна."""
+        q = self.q
+        if len(pattern) < q:
+            return range(self.n_documents)
+        grams = {pattern[i:i + q] for i in range(len(pattern) - q + 1)}
+        if any(gram not in self.directory for gram in grams):
+            return []
+        # Начиная с самого короткого списка: промежуточный результат мал
+        ordered = sorted(grams, key=lambda gram: self.directory[gram][2])
+        result = set(self.postings(ordered[0]))
+        for gram in ordered[1:]:
+            if not result:
+                break
+            result.intersection_update(self.postings(gram))
+        return sorted(result)
+
+    def search(
+        self,
+        documents: Sequence[str],
+        pattern: str,
+        algorithm: str = "boyer_moore"
+    ) -> List[Tuple[int, int]]:
+        """(номер документа, первое вхождение) для всех документов
+        с вхождением pattern."""
+        phases = get_engine(algorithm).phases
+        if phases is None:
+            raise ValueError(f"У алгоритма {algorithm} нет фаз")
+        preprocess, scan = phases
+        tables = preprocess(pattern)
+        found = []
+        for doc_id in self.candidates(pattern):
+            pos = scan(documents[doc_id], pattern, tables)
+            if pos != -1:
+                found.append((doc_id, pos))
+        return found
+
+    def save(self, path: str) -> int:
+        """Записывает индекс в файл; возвращает размер файла, байт."""
+        header = json.dumps({
+            "q": self.q,
+            "documents": self.n_documents,
+            "byteorder": self.byteorder,
+            "grams": self.directory
+        }, ensure_ascii=False).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            f.write(self.buffer)
+        return os.path.getsize(path)
+
+    @classmethod
+    def load(cls, path: str) -> "QGramIndex":
+        """Открывает индекс через mmap; списки читаются по запросу."""
+        f = open(path, "rb")
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Пустой файл не отображается
+            f.close()
+            raise ValueError(f"{path}: не файл индекса q-грамм")
+        if mapped[:len(MAGIC)] != MAGIC:
+            mapped.close()
+            f.close()
+            raise ValueError(f"{path}: не файл индекса q-грамм")
+        start = len(MAGIC) + 8
+        length = int.from_bytes(mapped[len(MAGIC):start], "little")
+        header = json.loads(mapped[start:start + length].decode("utf-8"))
+        index = cls(
+            header["q"], header["documents"], header["grams"],
+            memoryview(mapped)[start + length:], header["byteorder"]
+        )
+        index._file = f
+        index._mmap = mapped
+        return index
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            # memoryview держит отображение: освобождается первым
+            self.buffer.release()
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+
+    def __enter__(self) -> "QGramIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def scan_all(
+    documents: Sequence[str],
+    pattern: str,
+    algorithm: str = "boyer_moore",
+    limit: Optional[int] = None
+) -> List[Tuple[int, int]]:
+    """То же, что QGramIndex.search, проходом по первым limit
+    документам без индекса."""
+    preprocess, scan = get_engine(algorithm).phases
+    tables = preprocess(pattern)
+    found = []
+    for doc_id in range(len(documents) if limit is None else limit):
+        pos = scan(documents[doc_id], pattern, tables)
+        if pos != -1:
+            found.append((doc_id, pos))
+    return found
@@ -0,0 +1,233 @@
+"""
+Модуль rank_encoding.py: Кодирование текста плотными номерами символов.
+
+str, в которой есть хотя бы один символ вне Latin-1, хранит 2 или 4 байта
+на символ, а таблицы алгоритмов — словари с ключами-символами. Здесь
+текст и паттерн переводятся в номера символов общего алфавита (0..σ-1
+в порядке кодов) в компактном буфере: bytes при σ ≤ 256, иначе
+array('H') или array('I'). Перевод выполняется на C: str.translate
+и encode, а при σ ≤ 256 для символов вне Latin-1 — кодек charmap (как
+у однобайтовых кодировок), он быстрее translate на таких строках. Каждый
+символ заменяется ровно одним номером, поэтому смещения в буфере
+совпадают со смещениями в исходной строке.
+
+Версии алгоритмов с суффиксом _ranked индексируют таблицы-списки длины σ
+номером символа напрямую:
+    boyer_moore — стоп-символы bad_char[номер];
+    kmp_dfa     — автомат table[состояние + номер] по всему алфавиту,
+                  без классов символов паттерна.
+Остальные алгоритмы с bytes_input (src/registry.py) работают на буфере
+bytes без изменений.
+"""
+import sys
+import codecs
+from array import array
+from itertools import islice
+from typing import Iterable, Optional
+
+from src.algorithms import DFA_MAX_CELLS, _bounds, compute_lps, kmp_scan
+from src.registry import get_engine
+
+
+class RankAlphabet:
+    def __init__(self, symbols: Iterable[str]):
+        self.symbols = sorted(set(symbols))
+        self.size = len(self.symbols)
+        self.ranks = {c: rank for rank, c in enumerate(self.symbols)}
+        # Символ -> символ с кодом, равным номеру, для str.translate
+        self._encode_table = {
+            ord(c): rank for c, rank in self.ranks.items()
+        }
+        self._decode_table = dict(enumerate(self.symbols))
+        if self.size <= 1 << 8:
+            self.typecode = "B"
+            # Таблица декодирования charmap: байт -> символ; U+FFFE —
+            # байт без символа
+            self._charmap = "".join(self.symbols).ljust(256, "\ufffe")
+            self._encoding_map = codecs.charmap_build(self._charmap)
+            self._use_charmap = self.symbols[-1:] > ["\xff"]
+        elif self.size <= 1 << 16:
+            self.typecode = "H"
+        else:
+            self.typecode = "I"
+
+    @classmethod
+    def of(cls, *texts: str) -> "RankAlphabet":
+        """Алфавит всех символов texts."""
+        symbols = set()
+        for text in texts:
+            symbols.update(text)
+        return cls(symbols)
+
+    def __contains__(self, text: str) -> bool:
+        """Все ли символы text входят в алфавит."""
+        return self.ranks.keys() >= set(text)
+
+    def encode(self, text: str):
+        """Буфер номеров символов: bytes или array(typecode)."""
+        if self.typecode == "B" and self._use_charmap:
+            try:
+                return codecs.charmap_encode(
+                    text, "strict", self._encoding_map
+                )[0]
+            except UnicodeEncodeError:
+                raise ValueError("В тексте есть символы вне алфавита")
+        if text not in self:
+            raise ValueError("В тексте есть символы вне алфавита")
+        ranked = text.translate(self._encode_table)
+        if self.typecode == "B":
+            return ranked.encode("latin-1")
+        # Номера до 2^16 — одно слово UTF-16; surrogatepass пропускает
+        # номера из диапазона суррогатов
+        encoding = "utf-16-le" if self.typecode == "H" else "utf-32-le"
+        buffer = array(self.typecode)
+        buffer.frombytes(ranked.encode(encoding, "surrogatepass"))
+        if sys.byteorder == "big":
+            buffer.byteswap()
+        return buffer
+
+    def decode(self, buffer) -> str:
+        if self.typecode == "B":
+            return codecs.charmap_decode(
+                bytes(buffer), "strict", self._charmap
+            )[0]
+        return "".join(map(chr, buffer)).translate(self._decode_table)
+
+
+def buffer_nbytes(buffer) -> int:
+    """Размер данных буфера номеров, байт."""
+    if isinstance(buffer, array):
+        return len(buffer) * buffer.itemsize
+    return len(buffer)
+
+
+# Бойер-Мур со стоп-символами в списке
+def boyer_moore_ranked_preprocess(pattern, sigma: int) -> list:
+    bad_char = [-1] * sigma
+    for i, rank in enumerate(pattern):
+        bad_char[rank] = i
+    return bad_char
+
+
+def boyer_moore_ranked_scan(
+    text,
+    pattern,
+    bad_char: list,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
+
+    if m == 0:
+        return start if start <= end else -1
+    if end - start < m:
+        return -1
+
+    s = start
+    while s <= end - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == text[s + j]:
+            j -= 1
+        if j < 0:
+            return s
+        s += max(1, j - bad_char[text[s + j]])
+    return -1
+
+
+# KMP-автомат по всему алфавиту
+def kmp_dfa_ranked_preprocess(
+    pattern, sigma: int, max_cells: int = DFA_MAX_CELLS
+) -> tuple:
+    """(таблица, lps): состояние хранится как смещение строки j * σ;
+    если таблица больше max_cells, она None и поиск идёт по lps."""
+    m = len(pattern)
+    lps = compute_lps(pattern)
+    if m == 0 or sigma * (m + 1) > max_cells:
+        return None, lps
+
+    table = array("l", [0]) * (sigma * (m + 1))
+    for j in range(m + 1):
+        row = j * sigma
+        if j > 0:
+            # Переходы из j совпадают с переходами из lps[j - 1]
+            fallback = lps[j - 1] * sigma
+            table[row:row + sigma] = table[fallback:fallback + sigma]
+        if j < m:
+            table[row + pattern[j]] = (j + 1) * sigma
+    return table, lps
+
+
+def kmp_dfa_ranked_scan(
+    text,
+    pattern,
+    tables: tuple,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    table, lps = tables
+    if table is None:
+        return kmp_scan(text, pattern, lps, start, end)
+    start, end = _bounds(len(text), start, end)
+    m = len(pattern)
+
+    if end - start < m:
+        return -1
+
+    accept = len(table) - len(table) // (m + 1)
+    state = 0
+    for i, rank in enumerate(islice(text, start, end), start):
+        state = table[state + rank]
+        if state == accept:
+            return i - m + 1
+    return -1
+
+
+RANKED_PHASES = {
+    "boyer_moore": (boyer_moore_ranked_preprocess, boyer_moore_ranked_scan),
+    "kmp_dfa": (kmp_dfa_ranked_preprocess, kmp_dfa_ranked_scan)
+}
+
+
+class RankedText:
+    """Текст, один раз закодированный номерами символов, для многих
+    запросов; индексы — в исходной строке."""
+
+    def __init__(self, text: str, alphabet: Optional[RankAlphabet] = None):
+        self.alphabet = alphabet or RankAlphabet.of(text)
+        self.buffer = self.alphabet.encode(text)
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    @property
+    def nbytes(self) -> int:
+        return buffer_nbytes(self.buffer)
+
+    def find(
+        self,
+        pattern: str,
+        algorithm: str = "boyer_moore",
+        start: int = 0,
+        end: Optional[int] = None
+    ) -> int:
+        if pattern not in self.alphabet:
+            # Символа паттерна нет в тексте
+            return -1
+        ranked = self.alphabet.encode(pattern)
+        if algorithm in RANKED_PHASES:
+            preprocess, scan = RANKED_PHASES[algorithm]
+            tables = preprocess(ranked, self.alphabet.size)
+        else:
+            engine = get_engine(algorithm)
+            # Многопаттерновые алгоритмы приняли бы байтовый паттерн
+            # за набор паттернов
+            if not (engine.bytes_input and engine.phases
+                    and not engine.multi_pattern
+                    and isinstance(self.buffer, bytes)):
+                raise ValueError(
+                    f"Алгоритм {algorithm} не работает с буфером номеров"
+                )
+            preprocess, scan = engine.phases
+            tables = preprocess(ranked)
+        return scan(self.buffer, ranked, tables, start=start, end=end)
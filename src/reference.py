@@ -0,0 +1,194 @@
+"""
+Модуль reference.py: Эталонные алгоритмы — обёртки над поиском на C.
+
+    str_find   — str.find / str.rfind;
+    bytes_find — bytes.find / bytes.rfind (а также mmap и bytearray);
+    re         — re.search по экранированному паттерну; последнее
+                 вхождение — жадный префикс с опережающей проверкой.
+Функции следуют соглашениям src/algorithms.py (фазы, границы start/end,
+параметр table), поэтому эталон подставляется везде, где и алгоритмы
+на чистом Python.
+"""
+import re
+from typing import Optional
+
+from src.algorithms import _bounds, fold_rsearch, fold_search
+
+
+# str.find
+def str_find_preprocess(pattern: str) -> None:
+    return None
+
+
+def str_find_scan(
+    text: str,
+    pattern: str,
+    tables: None = None,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    return str.find(text, pattern, start, end)
+
+
+def str_find_rscan(
+    text: str,
+    pattern: str,
+    tables: None = None,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    return str.rfind(text, pattern, start, end)
+
+
+def str_find_search(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_search(
+            str_find_preprocess, str_find_scan, text, pattern, table,
+            start, end
+        )
+    return str.find(text, pattern, start, end)
+
+
+def str_find_rsearch(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_rsearch(
+            str_find_preprocess, str_find_rscan, text, pattern, table,
+            start, end
+        )
+    return str.rfind(text, pattern, start, end)
+
+
+# bytes.find: метод самого буфера, поэтому подходит и для mmap. Границы
+# разрешаются заранее: mmap.find не принимает end=None и, в отличие
+# от bytes.find, находит пустой паттерн при start за концом
+def bytes_find_preprocess(pattern: bytes) -> None:
+    return None
+
+
+def bytes_find_scan(
+    text: bytes,
+    pattern: bytes,
+    tables: None = None,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    if isinstance(text, str):
+        raise TypeError("bytes_find принимает bytes, а не str")
+    start, end = _bounds(len(text), start, end)
+    if start > end:
+        return -1
+    return text.find(pattern, start, end)
+
+
+def bytes_find_rscan(
+    text: bytes,
+    pattern: bytes,
+    tables: None = None,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    if isinstance(text, str):
+        raise TypeError("bytes_find принимает bytes, а не str")
+    start, end = _bounds(len(text), start, end)
+    if start > end:
+        return -1
+    return text.rfind(pattern, start, end)
+
+
+def bytes_find_search(
+    text: bytes,
+    pattern: bytes,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    return bytes_find_scan(text, pattern, None, start, end)
+
+
+def bytes_find_rsearch(
+    text: bytes,
+    pattern: bytes,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    return bytes_find_rscan(text, pattern, None, start, end)
+
+
+# re: скомпилированное выражение кэшируется модулем re
+def re_preprocess(pattern: str):
+    return re.compile(re.escape(pattern))
+
+
+def re_scan(
+    text: str,
+    pattern: str,
+    tables=None,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    start, end = _bounds(len(text), start, end)
+    if start > end:
+        return -1
+    match = (tables or re_preprocess(pattern)).search(text, start, end)
+    return match.start() if match is not None else -1
+
+
+def _last_match_regex(pattern: str):
+    """Жадное .* до последней позиции, с которой начинается pattern."""
+    if isinstance(pattern, str):
+        return re.compile("(?s:.*)(?=" + re.escape(pattern) + ")")
+    return re.compile(b"(?s:.*)(?=" + re.escape(pattern) + b")")
+
+
+def re_rscan(
+    text: str,
+    pattern: str,
+    tables=None,
+    start: int = 0,
+    end: Optional[int] = None
+) -> int:
+    """tables не используется: выражение строится по самому паттерну."""
+    start, end = _bounds(len(text), start, end)
+    if start > end:
+        return -1
+    match = _last_match_regex(pattern).match(text, start, end)
+    return match.end() if match is not None else -1
+
+
+def re_search(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_search(
+            re_preprocess, re_scan, text, pattern, table, start, end
+        )
+    return re_scan(text, pattern, re_preprocess(pattern), start, end)
+
+
+def re_rsearch(
+    text: str,
+    pattern: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    table: Optional[dict] = None
+) -> int:
+    if table is not None:
+        return fold_rsearch(
+            re_preprocess, re_rscan, text, pattern, table, start, end
+        )
+    return re_rscan(text, pattern, None, start, end)
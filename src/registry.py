@@ -0,0 +1,204 @@
+"""
+Модуль registry.py: Реестр алгоритмов поиска и их возможностей.
+
+Алгоритм описывается записью Engine: функция поиска search, фазы
+(предобработка, проход), поиск с конца rsearch и возможности:
+    multi_pattern — ищет набор паттернов: search(text, patterns);
+    streaming     — проход принимает границы start/end, поэтому текст
+                    можно подавать блоками с перекрытием m - 1;
+    bytes_input   — принимает bytes (паттерн) и текст bytes или любой
+                    индексируемый буфер байтов: bytearray, mmap;
+    str_input     — принимает str;
+    all_matches   — возвращает все вхождения, а не первое.
+Эталонные алгоритмы (reference=True) — обёртки над str.find, bytes.find
+и re (src/reference.py); с ними сравниваются алгоритмы на чистом Python.
+
+Сторонние алгоритмы подключаются точками входа группы
+ENTRY_POINT_GROUP. Объект точки входа — Engine, список Engine или
+функция, которая их возвращает; в pyproject.toml пакета:
+    [project.entry-points."substring_search.engines"]
+    my_engine = "my_package.engines:ENGINE"
+"""
+import warnings
+from importlib import metadata
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src import algorithms, multi_pattern, reference
+
+ENTRY_POINT_GROUP = "substring_search.engines"
+
+CAPABILITIES = (
+    "multi_pattern", "streaming", "bytes_input", "str_input",
+    "all_matches", "reference"
+)
+
+
+class Engine:
+    def __init__(
+        self,
+        name: str,
+        search: Callable,
+        phases: Optional[Tuple[Callable, Callable]] = None,
+        rsearch: Optional[Callable] = None,
+        multi_pattern: bool = False,
+        streaming: bool = False,
+        bytes_input: bool = False,
+        str_input: bool = True,
+        all_matches: bool = False,
+        reference: bool = False
+    ):
+        if streaming and phases is None:
+            raise ValueError(
+                f"{name}: для поиска блоками нужны фазы preprocess/scan"
+            )
+        if not (bytes_input or str_input):
+            raise ValueError(f"{name}: не принимает ни str, ни bytes")
+        self.name = name
+        self.search = search
+        self.phases = phases
+        self.rsearch = rsearch
+        self.multi_pattern = multi_pattern
+        self.streaming = streaming
+        self.bytes_input = bytes_input
+        self.str_input = str_input
+        self.all_matches = all_matches
+        self.reference = reference
+
+    def capabilities(self) -> Dict[str, bool]:
+        return {name: getattr(self, name) for name in CAPABILITIES}
+
+    def adapt(self, text, pattern):
+        """text и pattern в типе, который принимает алгоритм
+        (str и bytes переводятся друг в друга по latin-1: байт — символ).
+        """
+        if isinstance(text, str) and not self.str_input:
+            return text.encode("latin-1"), _convert(pattern, str.encode)
+        if not isinstance(text, str) and not self.bytes_input:
+            return bytes(text).decode("latin-1"), _convert(
+                pattern, bytes.decode
+            )
+        return text, pattern
+
+    def __repr__(self) -> str:
+        flags = ", ".join(
+            name for name, value in self.capabilities().items() if value
+        )
+        return f"Engine({self.name!r}: {flags})"
+
+
+def _convert(pattern, method):
+    if isinstance(pattern, (list, tuple)):
+        return [method(item, "latin-1") for item in pattern]
+    return method(pattern, "latin-1")
+
+
+ENGINES: Dict[str, Engine] = {}
+_plugins_loaded = False
+
+
+def register(engine: Engine, replace: bool = False) -> Engine:
+    if engine.name in ENGINES and not replace:
+        raise ValueError(f"Алгоритм {engine.name} уже зарегистрирован")
+    ENGINES[engine.name] = engine
+    return engine
+
+
+def load_entry_points(group: str = ENTRY_POINT_GROUP) -> List[str]:
+    """Регистрирует алгоритмы установленных пакетов; возвращает их имена.
+    Точки входа с ошибками пропускаются с предупреждением."""
+    found = metadata.entry_points()
+    if hasattr(found, "select"):
+        points = found.select(group=group)
+    else:
+        # Python < 3.10: словарь {группа: точки входа}
+        points = found.get(group, [])
+    names = []
+    for point in points:
+        try:
+            loaded = point.load()
+            if callable(loaded):
+                loaded = loaded()
+            for engine in (
+                [loaded] if isinstance(loaded, Engine) else list(loaded)
+            ):
+                if not isinstance(engine, Engine):
+                    raise TypeError(f"ожидался Engine, получен {engine!r}")
+                names.append(register(engine).name)
+        except Exception as e:
+            warnings.warn(
+                f"Точка входа {point.name} ({point.value}) пропущена: {e}"
+            )
+    return names
+
+
+def _ensure_plugins() -> None:
+    global _plugins_loaded
+    if not _plugins_loaded:
+        _plugins_loaded = True
+        load_entry_points()
+
+
+def engines(**capabilities: bool) -> Dict[str, Engine]:
+    """Зарегистрированные алгоритмы с заданными значениями возможностей,
+    например engines(multi_pattern=False, reference=False)."""
+    unknown = set(capabilities) - set(CAPABILITIES)
+    if unknown:
+        raise ValueError(f"Неизвестные возможности: {sorted(unknown)}")
+    _ensure_plugins()
+    return {
+        name: engine for name, engine in ENGINES.items()
+        if all(
+            getattr(engine, key) == value
+            for key, value in capabilities.items()
+        )
+    }
+
+
+def get_engine(name: str) -> Engine:
+    _ensure_plugins()
+    if name not in ENGINES:
+        raise ValueError(f"Неизвестный алгоритм: {name}")
+    return ENGINES[name]
+
+
+# Алгоритмы на чистом Python индексируют текст, поэтому проходят и по mmap;
+# rabin_karp хеширует ord(символ) и потому не принимает bytes
+for _name, _phases in algorithms.PHASES.items():
+    register(Engine(
+        _name,
+        getattr(algorithms, f"{_name}_search"),
+        phases=_phases,
+        rsearch=algorithms.REVERSE_SEARCH[_name],
+        streaming=True,
+        bytes_input=_name != "rabin_karp"
+    ))
+
+for _name, _phases in multi_pattern.MULTI_PHASES.items():
+    register(Engine(
+        _name,
+        getattr(multi_pattern, f"{_name}_search"),
+        phases=_phases,
+        multi_pattern=True,
+        # Wu-Manber склеивает блоки символов в строку
+        bytes_input=_name == "commentz_walter",
+        all_matches=True
+    ))
+
+register(Engine(
+    "str_find", reference.str_find_search,
+    phases=(reference.str_find_preprocess, reference.str_find_scan),
+    rsearch=reference.str_find_rsearch,
+    streaming=True, reference=True
+))
+register(Engine(
+    "bytes_find", reference.bytes_find_search,
+    phases=(reference.bytes_find_preprocess, reference.bytes_find_scan),
+    rsearch=reference.bytes_find_rsearch,
+    streaming=True, bytes_input=True, str_input=False, reference=True
+))
+register(Engine(
+    "re", reference.re_search,
+    phases=(reference.re_preprocess, reference.re_scan),
+    rsearch=reference.re_rsearch,
+    streaming=True, bytes_input=True, reference=True
+))
@@ -1,15 +1,71 @@
 import os
+import mmap
 import unittest
+import io
+import sys
 import json
+import asyncio
+import tempfile
+import random
+import statistics
 from unittest.mock import patch
 from benchmark.time_measurer import TimeMeasurer
 from benchmark.memory_measurer import MemoryMeasurer
 from src.data_generator import TestDataGenerator
 from src.algorithms import (
     naive_search, kmp_search, boyer_moore_search, rabin_karp_search,
-    aho_corasick_search, apostolico_crochemore_search
+    aho_corasick_search, apostolico_crochemore_search, intro_search,
+    INTRO_BUDGET, kmp_dfa_search, kmp_dfa_preprocess, kmp_dfa_scan
 )
+from src.algorithms import (
+    PHASES, REVERSE_SEARCH, ASCII_CASE_FOLD, FOLD_BLOCK, fold_search,
+    fold_rsearch, kmp_rscan
+)
+from src.instrumented import INSTRUMENTED
 from benchmark import time_measurer
+from benchmark.scheduler import (
+    ParallelScheduler, physical_cores, order_largest_first
+)
+from benchmark.results_store import (
+    ResultsStore, environment, engine_version, to_legacy
+)
+from benchmark.stats import (
+    student_t_quantile, confidence_interval, sequential_sample,
+    detect_steady_state, percentile, describe, mann_whitney_u
+)
+from benchmark import compare
+from benchmark.intro_bounds import measure_bounds, growth_exponents
+from benchmark.allocation_audit import audit_allocations, format_report
+from benchmark.profiler import (
+    parse_cell_spec, matches, profile_cell, sample_stacks
+)
+from benchmark.sample_store import SampleStore
+from benchmark import out_of_core
+from benchmark import interpreters
+from benchmark.baseline import gap_table, format_gap, measure_baseline
+from benchmark.cost_model import (
+    CostModel, pilot_cells, plan_cell, prediction_error, MIN_RUNS
+)
+from benchmark.multi_pattern_bench import (
+    make_dictionary, per_pattern_boyer_moore, measure_cell
+)
+from src.multi_pattern import (
+    wu_manber_search, commentz_walter_search, wu_manber_preprocess
+)
+from src import registry
+from src.qgram_index import (
+    QGramIndex, scan_all, encode_postings, decode_postings
+)
+from benchmark import index_bench
+from benchmark.interleave import measure_interleaved, stability
+from src.rank_encoding import RankAlphabet, RankedText, buffer_nbytes
+from benchmark import rank_bench
+from src.registry import Engine, engines, get_engine
+from src.reference import bytes_find_search, bytes_find_rsearch
+from service.server import SearchServer
+from tools import grep as tree_grep
+from service.client import SearchClient, SearchError
+from service.loadgen import run_load
 import benchmark
 
 
@@ -156,13 +212,30 @@ class TestBenchmarkStructure(unittest.TestCase):
 class TestTimeMeasurerExtra(unittest.TestCase):
     def test_get_t_value_exact_match(self):
         tm = TimeMeasurer()
-        self.assertEqual(tm._get_t_value(6), 2.5706)
-        self.assertEqual(tm._get_t_value(11), 2.2281)
-        self.assertEqual(tm._get_t_value(101), 1.9840)
-
-    def test_get_t_value_nearest_lower(self):
-        tm = TimeMeasurer()
-        self.assertEqual(tm._get_t_value(15), 2.2281)
+        self.assertAlmostEqual(tm._get_t_value(6), 2.5706, places=4)
+        self.assertAlmostEqual(tm._get_t_value(11), 2.2281, places=4)
+        self.assertAlmostEqual(tm._get_t_value(101), 1.9840, places=4)
+
+    def test_get_t_value_any_n(self):
+        # Точный квантиль для любого n, а не ближайший меньший из таблицы
+        for measurer in (TimeMeasurer(), MemoryMeasurer()):
+            self.assertAlmostEqual(
+                measurer._get_t_value(15), 2.1448, places=4
+            )
+            self.assertAlmostEqual(
+                measurer._get_t_value(1000), 1.9623, places=4
+            )
+
+    def test_fixed_and_sequential_intervals_agree(self):
+        samples = [1.0, 1.2, 0.9, 1.1, 1.05, 0.95, 1.3]
+        self.assertEqual(
+            TimeMeasurer()._mean_delta(samples),
+            confidence_interval(samples)
+        )
+        self.assertEqual(
+            MemoryMeasurer()._mean_delta(samples),
+            confidence_interval(samples)
+        )
 
     def test_get_t_value_too_low_raises(self):
         tm = TimeMeasurer()
@@ -480,5 +553,1661 @@ class TestAdvancedSubstringSearchAlgorithms(unittest.TestCase):
                 self.assertEqual(algo(text, pattern), -1)
 
 
+class TestParallelScheduler(unittest.TestCase):
+    def test_physical_cores_not_empty(self):
+        cores = physical_cores()
+        self.assertGreater(len(cores), 0)
+        self.assertEqual(len(cores), len(set(cores)))
+
+    def test_order_largest_first(self):
+        tasks = [("kmp", "best", 1024), ("kmp", "best", 4096),
+                 ("naive", "worst", 2048)]
+        ordered = order_largest_first(tasks, lambda task: task[2])
+        self.assertEqual([t[2] for t in ordered], [4096, 2048, 1024])
+
+    def test_jobs_capped_by_physical_cores(self):
+        scheduler = ParallelScheduler(jobs=10 ** 6)
+        self.assertEqual(scheduler.jobs, len(physical_cores()))
+
+    def test_run_reports_every_task(self):
+        results = {}
+        errors = []
+
+        def on_result(task, result, error):
+            if error is not None:
+                errors.append(task)
+            else:
+                results[task] = result
+
+        tasks = [(1, 5), (7, 2), (3, 3)]
+        ParallelScheduler(jobs=2).run(tasks, max, on_result)
+        self.assertEqual(errors, [])
+        self.assertEqual(results, {(1, 5): 5, (7, 2): 7, (3, 3): 3})
+
+    def test_run_reports_errors(self):
+        received = []
+        ParallelScheduler(jobs=1).run(
+            [("abc", 10)], int,
+            lambda task, result, error: received.append(error)
+        )
+        self.assertEqual(len(received), 1)
+        self.assertIn("ValueError", received[0])
+
+
+class TestResultsStore(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "results.jsonl")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def make_record(self, size, **env):
+        return {
+            "algorithm": "kmp", "case": "best", "size": size,
+            "engine_version": engine_version(kmp_search),
+            **(env or environment()),
+            "time": 0.001, "time_delta": 0.0001,
+            "memory": 100, "memory_delta": 1
+        }
+
+    def test_append_and_reload(self):
+        store = ResultsStore(self.path)
+        record = self.make_record(1024)
+        store.append(record)
+        reloaded = ResultsStore(self.path)
+        self.assertEqual(len(reloaded), 1)
+        self.assertIn(ResultsStore.key(record), reloaded)
+        self.assertNotIn(ResultsStore.key(self.make_record(2048)), reloaded)
+
+    def test_truncated_line_is_skipped(self):
+        ResultsStore(self.path).append(self.make_record(1024))
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"algorithm": "kmp", "ca')
+        self.assertEqual(len(ResultsStore(self.path)), 1)
+
+    def test_append_after_truncated_line(self):
+        ResultsStore(self.path).append(self.make_record(1024))
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"algorithm": "kmp", "ca')
+        record = self.make_record(2048)
+        ResultsStore(self.path).append(record)
+        reloaded = ResultsStore(self.path)
+        self.assertEqual(len(reloaded), 2)
+        self.assertIn(ResultsStore.key(record), reloaded)
+
+    def test_order_is_part_of_key(self):
+        store = ResultsStore(self.path)
+        legacy = self.make_record(1024)
+        store.append(legacy)
+        interleaved = {**self.make_record(1024), "order": "interleaved"}
+        self.assertIn(
+            ResultsStore.key({**legacy, "order": "sequential"}), store
+        )
+        self.assertNotIn(ResultsStore.key(interleaved), store)
+        store.append(interleaved)
+        self.assertEqual(len(ResultsStore(self.path)), 2)
+        self.assertEqual(
+            store.select({"order": "sequential"}), [legacy]
+        )
+        self.assertEqual(
+            store.select({"order": "interleaved"}), [interleaved]
+        )
+
+    def test_to_legacy_keeps_newest_engine_version(self):
+        store = ResultsStore(self.path)
+        old = {**self.make_record(1024), "engine_version": "old"}
+        store.append(old)
+        store.append(self.make_record(2048))
+        store.append({**self.make_record(1024), "time": 0.002})
+        self.assertEqual(len(store), 3)
+        time_results, memory_results = to_legacy(store.select())
+        self.assertEqual(
+            [entry["size"] for entry in time_results["kmp"]["best"]],
+            [1024, 2048]
+        )
+        self.assertEqual(time_results["kmp"]["best"][0]["time"], 0.002)
+        self.assertEqual(len(memory_results["kmp"]["best"]), 2)
+
+    def test_environments_kept_separately(self):
+        store = ResultsStore(self.path)
+        store.append(self.make_record(1024))
+        other = {"python_version": "PyPy 3.10", "cpu_model": "Other CPU"}
+        store.append(self.make_record(1024, **other))
+        self.assertEqual(len(store.select(environment())), 1)
+        self.assertEqual(len(store.select(other)), 1)
+
+    def test_engine_version_depends_on_source(self):
+        self.assertEqual(
+            engine_version(kmp_search), engine_version(kmp_search)
+        )
+        self.assertNotEqual(
+            engine_version(kmp_search), engine_version(naive_search)
+        )
+
+    def test_to_legacy_format(self):
+        time_results, memory_results = to_legacy(
+            [self.make_record(2048), self.make_record(1024)]
+        )
+        self.assertEqual(
+            time_results["kmp"]["best"][0],
+            {"size": 1024, "time": 0.001, "delta": 0.0001}
+        )
+        self.assertEqual(
+            memory_results["kmp"]["best"][1],
+            {"size": 2048, "memory": 100, "delta": 1}
+        )
+
+
+class TestSequentialSampling(unittest.TestCase):
+    def test_t_quantile_known_values(self):
+        known = {5: 2.5706, 10: 2.2281, 25: 2.0595, 50: 2.0086, 100: 1.9840}
+        for df, t_value in known.items():
+            with self.subTest(df=df):
+                self.assertAlmostEqual(
+                    student_t_quantile(0.975, df), t_value, places=4
+                )
+
+    def test_t_quantile_any_n(self):
+        self.assertAlmostEqual(student_t_quantile(0.975, 14), 2.1448, 4)
+        self.assertAlmostEqual(student_t_quantile(0.025, 14), -2.1448, 4)
+        self.assertAlmostEqual(student_t_quantile(0.975, 10 ** 6), 1.96, 3)
+
+    def test_confidence_interval(self):
+        mean, delta = confidence_interval([1.0, 2.0, 3.0])
+        self.assertEqual(mean, 2.0)
+        self.assertAlmostEqual(delta, 4.3027 / 3 ** 0.5, places=3)
+
+    def test_stops_on_precision(self):
+        samples, reason = sequential_sample(lambda: 1.0, min_runs=6)
+        self.assertEqual(reason, "precision")
+        self.assertEqual(len(samples), 6)
+
+    def test_stops_on_max_runs(self):
+        values = iter([1.0, 100.0] * 50)
+        samples, reason = sequential_sample(
+            lambda: next(values), target_ci=0.001, max_runs=20
+        )
+        self.assertEqual(reason, "max_runs")
+        self.assertEqual(len(samples), 20)
+
+    def test_stops_on_time_budget(self):
+        values = iter([1.0, 100.0] * 50)
+        samples, reason = sequential_sample(
+            lambda: next(values), target_ci=0.001, time_budget=0.0
+        )
+        self.assertEqual(reason, "time_budget")
+        self.assertEqual(len(samples), 6)
+
+    def test_memory_measure_sequential(self):
+        result = MemoryMeasurer().measure_sequential(
+            naive_search, ("A" * 1000, "A" * 5), target_ci=0.05
+        )
+        self.assertEqual(result["stop_reason"], "precision")
+        self.assertGreaterEqual(result["n_runs"], 6)
+        self.assertGreater(result["mean"], 0)
+
+
+class TestWarmUp(unittest.TestCase):
+    def test_steady_samples_stop_after_window(self):
+        samples, reason = detect_steady_state(lambda: 1.0, window=5)
+        self.assertEqual(reason, "steady")
+        self.assertEqual(len(samples), 5)
+
+    def test_stabilizes_after_slow_start(self):
+        values = iter([10.0, 5.0, 2.0] + [1.0] * 50)
+        samples, reason = detect_steady_state(
+            lambda: next(values), window=4, time_budget=None
+        )
+        self.assertEqual(reason, "steady")
+        self.assertEqual(len(samples), 7)
+
+    def test_unstable_samples_hit_max_runs(self):
+        values = iter([1.0, 3.0] * 50)
+        samples, reason = detect_steady_state(
+            lambda: next(values), max_runs=12, time_budget=None
+        )
+        self.assertEqual(reason, "max_runs")
+        self.assertEqual(len(samples), 12)
+
+    def test_time_budget_allows_single_run(self):
+        samples, reason = detect_steady_state(lambda: 1.0, time_budget=0.0)
+        self.assertEqual(reason, "time_budget")
+        self.assertEqual(len(samples), 1)
+
+    def test_time_measurer_warm_up(self):
+        runs, reason = TimeMeasurer().warm_up(
+            naive_search, ("A" * 1000, "A" * 5), time_budget=0.5
+        )
+        self.assertGreaterEqual(runs, 1)
+        self.assertIn(reason, ("steady", "max_runs", "time_budget"))
+
+
+class TestRawSamples(unittest.TestCase):
+    def test_percentile_interpolation(self):
+        samples = [4.0, 1.0, 3.0, 2.0, 5.0]
+        self.assertEqual(percentile(samples, 0), 1.0)
+        self.assertEqual(percentile(samples, 50), 3.0)
+        self.assertEqual(percentile(samples, 100), 5.0)
+        self.assertAlmostEqual(percentile(samples, 95), 4.8)
+
+    def test_describe_flags_outliers(self):
+        samples = [1.0, 1.1, 0.9, 1.0, 1.05, 0.95, 50.0]
+        stats = describe(samples)
+        self.assertEqual(stats["p50"], 1.0)
+        self.assertEqual(stats["outliers"], 1)
+        self.assertEqual(stats["max"], 50.0)
+        self.assertAlmostEqual(stats["mad"], 0.05)
+
+    def test_measurer_keeps_samples(self):
+        measurer = MemoryMeasurer()
+        measurer.measure(naive_search, ("A" * 100, "A" * 5), n_runs=7)
+        self.assertEqual(len(measurer.samples), 7)
+
+    def test_sample_store_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = SampleStore(tmpdir)
+            key = ("kmp", "best", 1024, "abc", "CPython 3.11", "CPU")
+            path = store.save(key, time=[0.1, 0.2], memory=[100, 100])
+            self.assertTrue(os.path.basename(path).startswith("kmp_best_1024"))
+            loaded = SampleStore.load(path)
+            self.assertEqual(list(loaded["time"]), [0.1, 0.2])
+            self.assertEqual(list(loaded["memory"]), [100.0, 100.0])
+
+
+class TestCompare(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.samples = SampleStore(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_store(self, name, cells, order="sequential", python=None):
+        path = os.path.join(self.tmpdir.name, name)
+        store = ResultsStore(path)
+        python = python or name
+        for (algo, size), times in cells.items():
+            key = (algo, "best", size, "v", python, "cpu", order, name)
+            store.append({
+                "algorithm": algo, "case": "best", "size": size,
+                "engine_version": "v", "python_version": python,
+                "cpu_model": "cpu", "order": order,
+                "time": statistics.mean(times),
+                "samples_file": self.samples.save(
+                    key, time=times, memory=[1.0] * len(times)
+                )
+            })
+        return path
+
+    def test_mann_whitney_separated_samples(self):
+        _, p_value = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+        self.assertAlmostEqual(p_value, 0.0122, places=3)
+        _, p_value = mann_whitney_u([1, 2, 3], [1, 2, 3])
+        self.assertEqual(p_value, 1.0)
+
+    def test_detects_regression(self):
+        base = [1.0 + 0.01 * i for i in range(30)]
+        slow = [1.5 + 0.01 * i for i in range(30)]
+        same = [1.0 + 0.01 * i for i in range(30)]
+        baseline = self.write_store(
+            "base.jsonl", {("kmp", 1024): base, ("naive", 1024): base}
+        )
+        candidate = self.write_store(
+            "new.jsonl", {("kmp", 1024): slow, ("naive", 1024): same}
+        )
+        with patch("builtins.print"):
+            code = compare.main([baseline, candidate, "-t", "0.1"])
+        self.assertEqual(code, 1)
+
+        rows = compare.compare_cells(
+            compare.index_cells(ResultsStore(baseline).records),
+            compare.index_cells(ResultsStore(candidate).records)
+        )
+        self.assertEqual(rows[0]["algorithm"], "kmp")
+        self.assertTrue(rows[0]["significant"])
+        self.assertFalse(rows[1]["significant"])
+
+    def test_speedup_passes(self):
+        base = [1.5 + 0.01 * i for i in range(30)]
+        fast = [1.0 + 0.01 * i for i in range(30)]
+        baseline = self.write_store("base.jsonl", {("kmp", 1024): base})
+        candidate = self.write_store("new.jsonl", {("kmp", 1024): fast})
+        with patch("builtins.print"):
+            self.assertEqual(compare.main([baseline, candidate]), 0)
+
+    def test_one_environment_per_store(self):
+        base = [1.0 + 0.01 * i for i in range(30)]
+        slow = [1.5 + 0.01 * i for i in range(30)]
+        for python, times in (("CPython 3.11", base), ("PyPy 3.10", slow)):
+            baseline = self.write_store(
+                "base.jsonl", {("kmp", 1024): base}, python=python
+            )
+            # Запись PyPy дописана последней и медленнее базы
+            candidate = self.write_store(
+                "new.jsonl", {("kmp", 1024): times}, python=python
+            )
+        output = io.StringIO()
+        with patch("sys.stdout", output), patch("sys.stderr", output):
+            self.assertEqual(compare.main([baseline, candidate]), 2)
+        self.assertIn("PyPy 3.10", output.getvalue())
+
+        records, env = compare.select_environment(
+            ResultsStore(candidate).records, "CPython 3.11"
+        )
+        self.assertEqual(env, ("CPython 3.11", "cpu"))
+        self.assertEqual(len(records), 1)
+        output = io.StringIO()
+        with patch("sys.stdout", output):
+            self.assertEqual(compare.main(
+                [baseline, candidate, "--python-version", "CPython 3.11"]
+            ), 0)
+            self.assertEqual(compare.main(
+                [baseline, candidate, "--python-version", "PyPy 3.10"]
+            ), 1)
+            self.assertEqual(compare.main(
+                [baseline, candidate, "--cpu-model", "cpu"]
+            ), 2)
+        self.assertIn("CPython 3.11 / cpu", output.getvalue())
+
+    def test_orders_not_mixed(self):
+        base = [1.0 + 0.01 * i for i in range(30)]
+        slow = [1.5 + 0.01 * i for i in range(30)]
+        baseline = self.write_store("base.jsonl", {("kmp", 1024): base})
+        candidate = self.write_store(
+            "new.jsonl", {("kmp", 1024): slow}, order="interleaved"
+        )
+        records = ResultsStore(candidate).records
+        self.assertEqual(compare.index_cells(records), {})
+        self.assertEqual(
+            len(compare.index_cells(records, "interleaved")), 1
+        )
+        with patch("builtins.print"):
+            self.assertEqual(compare.main([baseline, candidate]), 0)
+
+
+class TestInstrumentedAlgorithms(unittest.TestCase):
+    def setUp(self):
+        self.originals = {
+            "naive": naive_search,
+            "kmp": kmp_search,
+            "boyer_moore": boyer_moore_search,
+            "rabin_karp": rabin_karp_search,
+            "apostolico_crochemore": apostolico_crochemore_search,
+            "aho_corasick": aho_corasick_search,
+            "intro": intro_search,
+            "kmp_dfa": kmp_dfa_search
+        }
+
+    def test_same_results_as_originals(self):
+        generator = TestDataGenerator()
+        inputs = [("abcde", "cde"), ("abcdefgh", "xyz"), ("", ""),
+                  ("abc", ""), ("", "abc"), ("ababababab", "abab"),
+                  ("abracadabra", "cada")]
+        for name, counted in INSTRUMENTED.items():
+            cases = inputs + [
+                generator.generate_case(name, case, 1024)
+                for case in ("best", "worst", "random")
+            ]
+            for text, pattern in cases:
+                with self.subTest(algorithm=name, pattern=pattern[:10]):
+                    index, _ = counted(text, pattern)
+                    self.assertEqual(
+                        index, self.originals[name](text, pattern)
+                    )
+
+    def test_kmp_comparisons_linear(self):
+        text, pattern = TestDataGenerator().generate_case(
+            "kmp", "worst", 4096
+        )
+        _, counters = INSTRUMENTED["kmp"](text, pattern)
+        self.assertLessEqual(counters["comparisons"], 2 * len(text))
+
+    def test_rabin_karp_counts_spurious_hits(self):
+        # 'a' и 'f' дают одинаковый хеш по модулю q=5 (97 и 102)
+        _, counters = INSTRUMENTED["rabin_karp"]("fffa", "a", 256, 5)
+        self.assertEqual(counters["hash_hits"], 4)
+        self.assertEqual(counters["spurious_hits"], 3)
+
+    def test_boyer_moore_average_shift(self):
+        _, counters = INSTRUMENTED["boyer_moore"]("X" * 100, "ABCD")
+        self.assertEqual(counters["avg_shift"], 4)
+
+    def test_aho_corasick_failure_links(self):
+        _, counters = INSTRUMENTED["aho_corasick"]("ABABABC", "ABC")
+        self.assertGreater(counters["failure_links"], 0)
+
+
+class TestProfiler(unittest.TestCase):
+    def test_parse_cell_spec(self):
+        self.assertEqual(
+            parse_cell_spec("kmp:worst:1024"), ("kmp", "worst", 1024)
+        )
+        self.assertEqual(parse_cell_spec("kmp"), ("kmp", None, None))
+        self.assertEqual(
+            parse_cell_spec("naive:*:2048"), ("naive", None, 2048)
+        )
+        with self.assertRaises(ValueError):
+            parse_cell_spec("kmp:best:1024:extra")
+
+    def test_matches(self):
+        specs = [parse_cell_spec("kmp:worst"), parse_cell_spec("*:best:64")]
+        self.assertTrue(matches(specs, "kmp", "worst", 1024))
+        self.assertTrue(matches(specs, "naive", "best", 64))
+        self.assertFalse(matches(specs, "kmp", "best", 1024))
+        self.assertFalse(matches([], "kmp", "best", 1024))
+
+    def test_sample_stacks_collapsed_format(self):
+        stacks = sample_stacks(
+            kmp_search, ("AB" * 5000 + "C", "ABC"), min_duration=0.2
+        )
+        self.assertGreater(sum(stacks.values()), 0)
+        self.assertTrue(all(
+            stack.startswith("kmp_search") for stack in stacks
+        ))
+
+    def test_profile_cell_writes_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = profile_cell(
+                naive_search, ("A" * 1000, "A" * 5 + "B"),
+                os.path.join(tmpdir, "naive_worst_1000"), min_duration=0.1
+            )
+            self.assertTrue(os.path.exists(paths["profile_pstats"]))
+            with open(paths["profile_folded"], encoding="utf-8") as f:
+                line = f.readline()
+            stack, count = line.rsplit(" ", 1)
+            self.assertIn("naive_search", stack)
+            self.assertGreater(int(count), 0)
+
+
+class TestAlgorithmPhases(unittest.TestCase):
+    def test_phases_compose_to_search(self):
+        generator = TestDataGenerator()
+        searches = {
+            "naive": naive_search,
+            "kmp": kmp_search,
+            "boyer_moore": boyer_moore_search,
+            "rabin_karp": rabin_karp_search,
+            "apostolico_crochemore": apostolico_crochemore_search,
+            "aho_corasick": aho_corasick_search,
+            "intro": intro_search,
+            "kmp_dfa": kmp_dfa_search
+        }
+        for name, (preprocess, scan) in PHASES.items():
+            cases = [("abracadabra", "cada"), ("abc", ""), ("", "abc")] + [
+                generator.generate_case(name, case, 1024)
+                for case in ("best", "worst", "random")
+            ]
+            for text, pattern in cases:
+                with self.subTest(algorithm=name, pattern=pattern[:10]):
+                    self.assertEqual(
+                        scan(text, pattern, preprocess(pattern)),
+                        searches[name](text, pattern)
+                    )
+
+    def test_tables_reusable_across_texts(self):
+        preprocess, scan = PHASES["boyer_moore"]
+        tables = preprocess("needle")
+        self.assertEqual(scan("haystack with needle", "needle", tables), 14)
+        self.assertEqual(scan("needle first", "needle", tables), 0)
+
+    def test_time_measure_phases(self):
+        preprocess, scan = PHASES["kmp"]
+        phases = TimeMeasurer().measure_phases(
+            preprocess, scan, "AB" * 500, "ABABC", n_runs=6
+        )
+        self.assertEqual(set(phases), {"preprocess", "scan"})
+        self.assertGreater(phases["scan"][0], 0)
+
+    def test_memory_measure_phases(self):
+        preprocess, scan = PHASES["aho_corasick"]
+        phases = MemoryMeasurer().measure_phases(
+            preprocess, scan, "A" * 1000, "A" * 200, n_runs=6
+        )
+        # Бор из 200 узлов занимает заметно больше памяти, чем проход
+        self.assertGreater(phases["preprocess"][0], phases["scan"][0])
+
+
+class TestBoundedSearch(unittest.TestCase):
+    def setUp(self):
+        self.searches = {
+            "naive": naive_search,
+            "kmp": kmp_search,
+            "boyer_moore": boyer_moore_search,
+            "rabin_karp": rabin_karp_search,
+            "apostolico_crochemore": apostolico_crochemore_search,
+            "aho_corasick": aho_corasick_search,
+            "intro": intro_search,
+            "kmp_dfa": kmp_dfa_search
+        }
+        self.text = "abcabcXabcabc"
+        self.bounds = [
+            (0, None), (1, None), (4, 10), (7, 13), (-6, None),
+            (0, -3), (3, 6), (8, 8), (10, 4), (0, 100), (50, None)
+        ]
+
+    def test_search_matches_str_find(self):
+        for name, search in self.searches.items():
+            for pattern in ("abc", "cab", "X", "bcX", "zz"):
+                for start, end in self.bounds:
+                    with self.subTest(
+                        algorithm=name, pattern=pattern, start=start, end=end
+                    ):
+                        self.assertEqual(
+                            search(self.text, pattern, start=start, end=end),
+                            self.text.find(pattern, start, end)
+                        )
+
+    def test_rsearch_matches_str_rfind(self):
+        for name, rsearch in REVERSE_SEARCH.items():
+            for pattern in ("abc", "cab", "X", "bcX", "zz"):
+                for start, end in self.bounds:
+                    with self.subTest(
+                        algorithm=name, pattern=pattern, start=start, end=end
+                    ):
+                        self.assertEqual(
+                            rsearch(self.text, pattern, start=start, end=end),
+                            self.text.rfind(pattern, start, end)
+                        )
+
+    def test_rsearch_on_generated_cases(self):
+        generator = TestDataGenerator()
+        for name, rsearch in REVERSE_SEARCH.items():
+            for case in ("best", "worst", "random"):
+                text, pattern = generator.generate_case(name, case, 2048)
+                with self.subTest(algorithm=name, case=case):
+                    self.assertEqual(
+                        rsearch(text, pattern), text.rfind(pattern)
+                    )
+
+    def test_empty_pattern_returns_bound(self):
+        self.assertEqual(kmp_search("abcdef", "", start=2), 2)
+        self.assertEqual(REVERSE_SEARCH["kmp"]("abcdef", "", end=4), 4)
+        self.assertEqual(REVERSE_SEARCH["aho_corasick"]("abc", ""), -1)
+
+    def test_start_past_end_of_text(self):
+        text = "abcabc"
+        reverse = REVERSE_SEARCH.items()
+        for name, search in [*self.searches.items(), *reverse]:
+            for pattern in ("", "c"):
+                for start, end in ((7, None), (100, 200), (7, 3)):
+                    with self.subTest(
+                        algorithm=name, pattern=pattern, start=start, end=end
+                    ):
+                        self.assertEqual(
+                            search(text, pattern, start=start, end=end), -1
+                        )
+        self.assertEqual(kmp_search(text, "", start=6), 6)
+
+
+class TestFoldedSearch(unittest.TestCase):
+    def setUp(self):
+        self.searches = [
+            naive_search, kmp_search, boyer_moore_search, rabin_karp_search,
+            apostolico_crochemore_search, aho_corasick_search
+        ]
+        self.text = "The NEEDLE in a haystack, the needle, The Needle."
+
+    def test_case_insensitive_search(self):
+        for search in self.searches:
+            for pattern in ("needle", "THE", "Needle.", "hay", "pin"):
+                with self.subTest(algorithm=search.__name__, pattern=pattern):
+                    self.assertEqual(
+                        search(self.text, pattern, table=ASCII_CASE_FOLD),
+                        self.text.lower().find(pattern.lower())
+                    )
+
+    def test_case_insensitive_rsearch(self):
+        for name, rsearch in REVERSE_SEARCH.items():
+            for pattern in ("needle", "THE", "hay", "pin"):
+                with self.subTest(algorithm=name, pattern=pattern):
+                    self.assertEqual(
+                        rsearch(self.text, pattern, start=1, end=-2,
+                                table=ASCII_CASE_FOLD),
+                        self.text.lower().rfind(pattern.lower(), 1, -2)
+                    )
+
+    def test_matches_across_block_boundaries(self):
+        # Вхождения на стыках блоков находятся благодаря перекрытию
+        text = "xx" * 50 + "AbCd" + "xx" * 50
+        for name, (preprocess, scan) in PHASES.items():
+            for block in (1, 3, 7, 101):
+                with self.subTest(algorithm=name, block=block):
+                    self.assertEqual(
+                        fold_search(preprocess, scan, text, "aBcD",
+                                    ASCII_CASE_FOLD, block=block),
+                        100
+                    )
+
+    def test_rsearch_across_block_boundaries(self):
+        text = "abcd" + "x" * 30 + "ABCD" + "x" * 30
+        preprocess, _ = PHASES["kmp"]
+        for block in (1, 4, 9, 1000):
+            with self.subTest(block=block):
+                self.assertEqual(
+                    fold_rsearch(preprocess, kmp_rscan, text, "abcd",
+                                 ASCII_CASE_FOLD, block=block),
+                    34
+                )
+
+    def test_pattern_longer_than_block(self):
+        m = FOLD_BLOCK + 10
+        pattern = "Ab" * (m // 2)
+        text = "x" * (3 * FOLD_BLOCK) + pattern.upper() + "x" * FOLD_BLOCK
+        preprocess, _ = PHASES["kmp"]
+        for fold, scan in ((fold_search, PHASES["kmp"][1]),
+                           (fold_rsearch, kmp_rscan)):
+            scanned = []
+
+            def counting(text, *args, **kwargs):
+                scanned.append(len(text))
+                return scan(text, *args, **kwargs)
+
+            with self.subTest(fold.__name__):
+                self.assertEqual(
+                    fold(preprocess, counting, text, pattern,
+                         ASCII_CASE_FOLD),
+                    3 * FOLD_BLOCK
+                )
+                # Перекрытие m - 1 не сворачивается заново в каждом блоке
+                self.assertLessEqual(sum(scanned), 1.25 * len(text))
+
+    def test_alphabet_mapping(self):
+        # РНК -> ДНК: U сопоставляется T
+        table = str.maketrans("U", "T")
+        self.assertEqual(kmp_search("GGAUGCA", "ATG", table=table), 2)
+        self.assertEqual(boyer_moore_search("GGAUGCA", "AUG", table=table), 2)
+
+    def test_length_changing_table_rejected(self):
+        for table in (str.maketrans("", "", "a"), {ord("ß"): "ss"}):
+            with self.subTest(table=table):
+                with self.assertRaises(ValueError):
+                    kmp_search("abc", "b", table=table)
+
+
+class TestIntroSearch(unittest.TestCase):
+    def test_matches_str_find_on_generated_cases(self):
+        generator = TestDataGenerator()
+        for algo in ("naive", "kmp", "boyer_moore", "rabin_karp",
+                     "aho_corasick", "intro"):
+            for case in ("best", "worst", "random"):
+                text, pattern = generator.generate_case(algo, case, 4096)
+                with self.subTest(data=algo, case=case):
+                    self.assertEqual(
+                        intro_search(text, pattern), text.find(pattern)
+                    )
+                    self.assertEqual(
+                        REVERSE_SEARCH["intro"](text, pattern),
+                        text.rfind(pattern)
+                    )
+
+    def test_falls_back_to_linear_on_adversary(self):
+        text, pattern = TestDataGenerator().generate_case(
+            "intro", "worst", 2048
+        )
+        n, m = len(text), len(pattern)
+        _, bm = INSTRUMENTED["boyer_moore"](text, pattern)
+        index, intro = INSTRUMENTED["intro"](text, pattern)
+        self.assertEqual(index, -1)
+        self.assertEqual(intro["fallbacks"], 1)
+        # Бюджет Бойера-Мура плюс линейный проход KMP
+        self.assertLessEqual(
+            intro["comparisons"], INTRO_BUDGET * (n + m) + 2 * n
+        )
+        self.assertGreater(bm["comparisons"], 100 * n)
+
+    def test_no_fallback_on_ordinary_text(self):
+        random.seed(1)
+        text = "".join(random.choices("ACGT", k=20000))
+        pattern = "ACGTTGCAACGGT"
+        _, bm = INSTRUMENTED["boyer_moore"](text, pattern)
+        _, intro = INSTRUMENTED["intro"](text, pattern)
+        self.assertEqual(intro["fallbacks"], 0)
+        self.assertEqual(intro["comparisons"], bm["comparisons"])
+
+    def test_growth_exponents(self):
+        exponents = growth_exponents(measure_bounds([1024, 2048], runs=1))
+        self.assertGreater(exponents[("worst", "boyer_moore")], 1.5)
+        self.assertLess(exponents[("worst", "intro")], 1.1)
+
+
+class TestKmpDfa(unittest.TestCase):
+    def test_matches_kmp_on_generated_cases(self):
+        generator = TestDataGenerator()
+        for case in ("best", "worst", "random"):
+            text, pattern = generator.generate_case("kmp_dfa", case, 4096)
+            for max_cells in (1 << 20, 0):
+                tables = kmp_dfa_preprocess(pattern, max_cells)
+                with self.subTest(case=case, max_cells=max_cells):
+                    self.assertEqual(
+                        kmp_dfa_scan(text, pattern, tables),
+                        kmp_search(text, pattern)
+                    )
+
+    def test_alphabet_compressed_table(self):
+        classes, table, _ = kmp_dfa_preprocess("ACGTACGA")
+        self.assertEqual(set(classes), set("ACGT"))
+        self.assertEqual(len(table), 4 * 9)
+        # Символ вне алфавита паттерна сбрасывает автомат
+        self.assertEqual(kmp_dfa_search("ACGTACGXACGTACGA", "ACGTACGA"), 8)
+
+    def test_one_transition_per_character(self):
+        text = "AAAAC" * 200
+        _, dfa = INSTRUMENTED["kmp_dfa"](text, "AAAAB")
+        _, kmp = INSTRUMENTED["kmp"](text, "AAAAB")
+        self.assertEqual(dfa["comparisons"], len(text))
+        self.assertGreater(kmp["comparisons"], len(text))
+
+    def test_falls_back_to_lps_over_cap(self):
+        pattern = "ABCD" * 50
+        classes, table, lps = kmp_dfa_preprocess(pattern, max_cells=100)
+        self.assertIsNone(classes)
+        self.assertIsNone(table)
+        self.assertEqual(len(lps), len(pattern))
+        _, counters = INSTRUMENTED["kmp_dfa"]("X" + pattern, pattern, 100)
+        self.assertEqual(counters["fallbacks"], 1)
+
+    def test_scan_over_mmap(self):
+        # Итерация по mmap даёт bytes длины 1, а не коды байтов
+        data = b"xxabcabdabd"
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.bin")
+            with open(path, "wb") as f:
+                f.write(data)
+            with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as buffer:
+                for pattern in (b"abd", b"bca", b"xxa"):
+                    with self.subTest(pattern=pattern):
+                        self.assertEqual(
+                            kmp_dfa_search(buffer, pattern),
+                            data.find(pattern)
+                        )
+                        self.assertEqual(
+                            kmp_dfa_search(buffer, pattern, start=6),
+                            data.find(pattern, 6)
+                        )
+
+
+class TestAllocationAudit(unittest.TestCase):
+    def test_window_comparison_does_not_copy(self):
+        # Сравнение окна на месте: выделения на позицию не зависят от m
+        pattern = "A" * 999 + "B"
+        audit = audit_allocations(naive_search, ("A" * 5000, pattern))
+        for row in audit["lines"]:
+            with self.subTest(source=row["source"]):
+                self.assertLess(row["bytes"] / row["count"], len(pattern))
+
+    def test_lines_sorted_by_bytes(self):
+        audit = audit_allocations(
+            rabin_karp_search, ("AB" * 500, "ABABC")
+        )
+        sizes = [row["bytes"] for row in audit["lines"]]
+        self.assertEqual(sizes, sorted(sizes, reverse=True))
+        self.assertTrue(all(
+            row["file"].endswith("algorithms.py") for row in audit["lines"]
+        ))
+
+    def test_format_report(self):
+        audit = audit_allocations(naive_search, ("AB" * 100, "ABABC"))
+        report = format_report("naive (worst), размер 200", audit, top=3)
+        self.assertTrue(report.startswith("== naive (worst)"))
+        self.assertIn("algorithms.py:", report)
+
+    def test_tracemalloc_state_restored(self):
+        import tracemalloc
+        audit_allocations(kmp_search, ("AB" * 100, "ABABC"))
+        self.assertFalse(tracemalloc.is_tracing())
+
+
+class TestMultiPattern(unittest.TestCase):
+    def setUp(self):
+        self.engines = [wu_manber_search, commentz_walter_search]
+
+    @staticmethod
+    def brute_force(text, patterns):
+        hits = []
+        for pattern_id, pattern in enumerate(patterns):
+            pos = text.find(pattern)
+            while pos != -1:
+                hits.append((pattern_id, pos))
+                pos = text.find(pattern, pos + 1)
+        return sorted(hits, key=lambda hit: (hit[1], hit[0]))
+
+    def test_all_hits_on_random_dictionaries(self):
+        rng = random.Random(3)
+        for _ in range(300):
+            alphabet = rng.choice(["ab", "abc", "acgt"])
+            patterns = [
+                "".join(rng.choices(alphabet, k=rng.randint(1, 7)))
+                for _ in range(rng.randint(1, 6))
+            ]
+            text = "".join(rng.choices(alphabet, k=rng.randint(0, 60)))
+            expected = self.brute_force(text, patterns)
+            for engine in self.engines:
+                with self.subTest(engine=engine.__name__, text=text,
+                                  patterns=patterns):
+                    self.assertEqual(engine(text, patterns), expected)
+
+    def test_overlapping_and_duplicate_patterns(self):
+        patterns = ["he", "she", "his", "hers", "she"]
+        expected = [(1, 1), (4, 1), (0, 2), (3, 2)]
+        for engine in self.engines:
+            with self.subTest(engine=engine.__name__):
+                self.assertEqual(engine("ushers", patterns), expected)
+
+    def test_empty_inputs(self):
+        for engine in self.engines:
+            with self.subTest(engine=engine.__name__):
+                self.assertEqual(engine("text", []), [])
+                self.assertEqual(engine("", ["abc"]), [])
+                with self.assertRaises(ValueError):
+                    engine("text", ["te", ""])
+
+    def test_wu_manber_skips_with_long_patterns(self):
+        shift, _, m, block = wu_manber_preprocess(["abcdefgh", "ijklmnop"])
+        self.assertEqual(m, 8)
+        # Блок вне словаря сдвигает окно на m - B + 1
+        self.assertEqual(shift.get("zz", m - block + 1), m - block + 1)
+        self.assertEqual(shift["gh"], 0)
+
+    def test_matches_per_pattern_boyer_moore(self):
+        text, patterns = make_dictionary(50, 4, 4096)
+        expected = per_pattern_boyer_moore(text, patterns)
+        self.assertEqual(expected, self.brute_force(text, patterns))
+        for engine in self.engines:
+            with self.subTest(engine=engine.__name__):
+                self.assertEqual(engine(text, patterns), expected)
+
+    def test_measure_cell(self):
+        row = measure_cell(20, 8, 2048)
+        for key in ("wu_manber", "commentz_walter", "boyer_moore_loop"):
+            self.assertGreater(row[key], 0)
+        self.assertFalse(row["boyer_moore_estimated"])
+
+
+class TestSearchService(unittest.TestCase):
+    def run_with_service(self, scenario):
+        async def main():
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "search.sock")
+                server = SearchServer(workers=2)
+                await server.start(path)
+                client = await SearchClient.connect(path)
+                try:
+                    return await scenario(client)
+                finally:
+                    await client.close()
+                    await server.close()
+        return asyncio.run(main())
+
+    def test_compile_and_search(self):
+        async def scenario(client):
+            handle = await client.compile("boyer_moore", "needle")
+            return [
+                await client.search("a needle here", handle=handle),
+                await client.search("no match", handle=handle),
+                await client.search(
+                    "needle, NEEDLE", handle=handle, reverse=True,
+                    ignore_case=True
+                ),
+                await client.search(
+                    "abcabc", algorithm="kmp_dfa", pattern="abc", start=1
+                )
+            ]
+        self.assertEqual(self.run_with_service(scenario), [2, -1, 8, 3])
+
+    def test_pipelined_and_batched_requests(self):
+        texts = [f"{'x' * i}ACGT" for i in range(40)]
+
+        async def scenario(client):
+            handle = await client.compile("kmp", "ACGT")
+            single = await asyncio.gather(*(
+                client.search(text, handle=handle) for text in texts
+            ))
+            batch = await client.search_batch(texts, handle=handle)
+            return single, batch, await client.stats()
+        single, batch, stats = self.run_with_service(scenario)
+        self.assertEqual(single, list(range(40)))
+        self.assertEqual(batch, list(range(40)))
+        self.assertEqual(stats["texts"], 80)
+        self.assertEqual(stats["patterns"], 1)
+
+    def test_errors_are_reported(self):
+        async def scenario(client):
+            errors = []
+            for fields in ({"algorithm": "nope", "pattern": "a"},
+                           {"handle": "missing"}):
+                try:
+                    await client.search("text", **fields)
+                except SearchError as e:
+                    errors.append(str(e))
+            # Соединение остаётся рабочим после ошибок
+            errors.append(await client.search("text", pattern="x"))
+            return errors
+        errors = self.run_with_service(scenario)
+        self.assertIn("nope", errors[0])
+        self.assertIn("missing", errors[1])
+        self.assertEqual(errors[2], 2)
+
+    def test_non_object_requests_get_error_replies(self):
+        async def main():
+            with tempfile.TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "search.sock")
+                server = SearchServer(workers=1)
+                await server.start(path)
+                reader, writer = await asyncio.open_unix_connection(path)
+                try:
+                    writer.write(b'123\n[]\n"x"\n{"op": "ping", "id": 7}\n')
+                    await writer.drain()
+                    return [
+                        json.loads(await reader.readline()) for _ in range(4)
+                    ]
+                finally:
+                    writer.close()
+                    await server.close()
+        replies = asyncio.run(asyncio.wait_for(main(), 30))
+        errors = [reply for reply in replies if "error" in reply]
+        self.assertEqual(len(errors), 3)
+        self.assertTrue(all(reply["id"] is None for reply in errors))
+        self.assertIn({"id": 7, "pong": True}, replies)
+
+    def test_load_generator_report(self):
+        async def scenario(client):
+            return await run_load([client], requests=40, concurrency=8,
+                                  batch=2, size=512)
+        report = self.run_with_service(scenario)
+        self.assertEqual(report["requests"], 40)
+        self.assertEqual(report["texts"], 80)
+        self.assertGreater(report["throughput"], 0)
+        self.assertLessEqual(report["p50_ms"], report["p99_ms"])
+
+
+class TestTreeGrep(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        os.makedirs(os.path.join(root, "logs", "old"))
+        self.files = {
+            os.path.join(root, "logs", "a.log"): b"xx needle yy needle",
+            os.path.join(root, "logs", "b.txt"): b"no match here",
+            os.path.join(root, "logs", "old", "c.log"):
+                b"-" * 5000 + "NEEDLE Ä".encode("utf-8") + b"needleneedle",
+            os.path.join(root, "logs", "empty.log"): b""
+        }
+        for path, data in self.files.items():
+            with open(path, "wb") as f:
+                f.write(data)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def expected(self, needle: bytes, lower: bool = False):
+        lines = []
+        for path in tree_grep.iter_files([self.tmp.name]):
+            data = self.files[path].lower() if lower else self.files[path]
+            pos = data.find(needle)
+            while pos != -1:
+                lines.append(f"{path}:{pos}")
+                pos = data.find(needle, pos + 1)
+        return lines
+
+    def run_grep(self, pattern, **options):
+        out = io.StringIO()
+        summary = tree_grep.grep(
+            [self.tmp.name], pattern, jobs=2, out=out, **options
+        )
+        return out.getvalue().splitlines(), summary
+
+    def test_ordered_results_across_blocks(self):
+        # Маленькие блоки: вхождения на стыках находятся ровно один раз
+        for algorithm in ("boyer_moore", "kmp_dfa", "aho_corasick"):
+            for block_size in (7, 64, 1 << 20):
+                with self.subTest(algorithm=algorithm, block=block_size):
+                    lines, summary = self.run_grep(
+                        "needle", algorithm=algorithm, block_size=block_size
+                    )
+                    self.assertEqual(lines, self.expected(b"needle"))
+                    self.assertEqual(summary["files"], 4)
+                    self.assertEqual(
+                        summary["bytes"],
+                        sum(len(data) for data in self.files.values())
+                    )
+
+    def test_utf8_pattern_byte_offsets(self):
+        lines, _ = self.run_grep("E Ä", use_mmap=False, block_size=100)
+        self.assertEqual(lines, self.expected("E Ä".encode("utf-8")))
+
+    def test_ignore_case_and_include(self):
+        lines, summary = self.run_grep(
+            "NeEdLe", ignore_case=True, include=["*.log"]
+        )
+        self.assertEqual(lines, self.expected(b"needle", lower=True))
+        self.assertEqual(summary["files"], 3)
+        self.assertGreater(summary["mb_per_s"], 0)
+
+
+class TestOutOfCore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "text.txt")
+        self.generator = TestDataGenerator()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read(self) -> str:
+        with open(self.path, encoding="ascii") as f:
+            return f.read()
+
+    def test_streamed_cases_match_generator(self):
+        for algo in ("naive", "kmp", "rabin_karp", "aho_corasick"):
+            for size in (1, 1000, 5003):
+                with self.subTest(algo=algo, size=size):
+                    text, pattern = self.generator.generate_case(
+                        algo, "worst", size
+                    )
+                    written = self.generator.write_case(
+                        algo, "worst", size, self.path, chunk_size=64
+                    )
+                    self.assertEqual((self.read(), written), (text, pattern))
+
+        self.generator.large_pattern_max = 50
+        for size in (10, 999, 4000):
+            pattern = self.generator.write_case(
+                "kmp", "random", size, self.path, chunk_size=97
+            )
+            text = self.read()
+            self.assertEqual(len(text), size)
+            self.assertLessEqual(len(pattern), 50)
+            self.assertTrue(pattern in text or pattern.endswith("X"))
+
+    def test_chunked_search_across_blocks(self):
+        rng = random.Random(7)
+        text = "".join(rng.choices("AB", k=3000))
+        with open(self.path, "w", encoding="ascii") as f:
+            f.write(text)
+        for algorithm in PHASES:
+            for pattern in ("ABBA", text[1500:1540], "A" * 30):
+                for block_size in (7, 64, 1 << 20):
+                    with self.subTest(algorithm, p=pattern, b=block_size):
+                        self.assertEqual(
+                            out_of_core.search_chunked(
+                                algorithm, self.path, pattern, block_size
+                            ),
+                            text.find(pattern)
+                        )
+
+    def test_engines_without_mmap_are_marked(self):
+        text = "xyz" * 1000 + "needle" + "xyz"
+        with open(self.path, "w", encoding="ascii") as f:
+            f.write(text)
+        self.assertEqual(
+            out_of_core.supported_modes("rabin_karp"), ["chunked"]
+        )
+        record = out_of_core.measure_cell(
+            "rabin_karp", "mmap", self.path, "needle", text.find("needle")
+        )
+        self.assertFalse(record["out_of_core"])
+        self.assertNotIn("time", record)
+        self.assertEqual(
+            out_of_core.supported_modes("naive"), ["mmap", "chunked"]
+        )
+
+        for mode in out_of_core.MODES:
+            record = out_of_core.measure_cell(
+                "boyer_moore", mode, self.path, "needle",
+                text.find("needle"), block_size=512, cold=True
+            )
+            self.assertTrue(record["out_of_core"])
+            self.assertEqual(record["index"], 3000)
+            self.assertEqual(record["scanned_bytes"], 3006)
+            self.assertGreater(record["peak_rss"], 0)
+            self.assertGreater(record["mb_per_s"], 0)
+
+
+class TestCostModel(unittest.TestCase):
+    def records(self, sizes, algorithm="kmp", case="worst"):
+        # Время вызова 1e-8 * n^1.5, запуск — 0.05 с накладных + 2 вызова
+        for size in sizes:
+            call = 1e-8 * size ** 1.5
+            yield {"algorithm": algorithm, "case": case, "size": size,
+                   "time": call, "n_runs": 10,
+                   "cell_seconds": 10 * (0.05 + 2 * call)}
+
+    def test_power_law_and_run_overhead(self):
+        model = CostModel(self.records([2**i for i in range(10, 17)]))
+        size = 2**20
+        call = 1e-8 * size ** 1.5
+        self.assertAlmostEqual(
+            model.call_time("kmp", "worst", size) / call, 1.0, places=6
+        )
+        self.assertAlmostEqual(
+            model.run_time("kmp", "worst", size) / (0.05 + 2 * call),
+            1.0, places=3
+        )
+        self.assertIsNone(model.call_time("kmp", "best", size))
+
+    def test_plan_downsamples_skips_and_extends_timeout(self):
+        model = CostModel(self.records([2**i for i in range(10, 17)]))
+        per_run = model.run_time("kmp", "worst", 2**20)
+
+        plan = plan_cell(model, ("kmp", "worst", 2**20), 50, timeout=5.0)
+        self.assertEqual((plan["action"], plan["n_runs"]), ("run", 50))
+        self.assertGreater(plan["timeout"], 5.0)
+        self.assertAlmostEqual(plan["predicted_seconds"], 50 * per_run)
+
+        plan = plan_cell(
+            model, ("kmp", "worst", 2**20), 50, cell_budget=20 * per_run
+        )
+        self.assertEqual(plan["action"], "downsample")
+        self.assertIn(plan["n_runs"], (19, 20))
+
+        plan = plan_cell(
+            model, ("kmp", "worst", 2**20), 50,
+            cell_budget=(MIN_RUNS - 1) * per_run
+        )
+        self.assertEqual((plan["action"], plan["n_runs"]), ("skip", 0))
+
+        plan = plan_cell(model, ("naive", "best", 2**20), 50, cell_budget=1)
+        self.assertEqual(plan["action"], "unknown")
+
+    def test_in_process_plan_skips_calls_over_timeout(self):
+        model = CostModel(self.records([2**i for i in range(10, 17)]))
+        # Оценка вызова: ~10.7 с при 2^20 и ~0.17 с при 2^16
+        plan = plan_cell(
+            model, ("kmp", "worst", 2**20), 50, timeout=5.0, in_process=True
+        )
+        self.assertEqual(
+            (plan["action"], plan["n_runs"], plan["reason"]),
+            ("skip", 0, "timeout")
+        )
+        self.assertEqual(plan["predicted_seconds"], 0.0)
+        plan = plan_cell(
+            model, ("kmp", "worst", 2**16), 50, timeout=5.0, in_process=True
+        )
+        self.assertEqual(plan["action"], "run")
+
+    def test_pilot_cells_and_prediction_error(self):
+        model = CostModel(self.records([1024, 2048]))
+        sizes = [2**i for i in range(10, 15)]
+        cells = [(algo, "worst", size)
+                 for algo in ("kmp", "naive") for size in sizes]
+        self.assertEqual(
+            pilot_cells(model, cells, sizes),
+            [("naive", "worst", size) for size in sizes[:3]]
+        )
+        self.assertAlmostEqual(prediction_error([
+            {"cell_seconds": 2.0, "predicted_seconds": 1.0},
+            {"cell_seconds": 1.0, "predicted_seconds": 1.0},
+            {"cell_seconds": 3.0, "predicted_seconds": 1.0},
+            {"cell_seconds": 3.0}
+        ]), 2.0)
+
+    def test_run_cell_uses_plan_and_reports_cost(self):
+        from benchmark.benchmark import run_cell
+        text, pattern = "AB" * 500, "ABA"
+        settings = {"cell_plans": {
+            ("kmp", "random", len(text)): {"n_runs": MIN_RUNS, "timeout": 9}
+        }, "warmup_max_runs": 5}
+        result = run_cell("kmp", "random", text, pattern, settings)
+        self.assertEqual(result["n_runs"], MIN_RUNS)
+        self.assertEqual(len(result["time_samples"]), MIN_RUNS)
+        self.assertGreater(result["cell_seconds"], 0)
+
+
+class TestInterpreters(unittest.TestCase):
+    def test_speedup_table_is_geometric_mean_over_sizes(self):
+        records = [
+            {"algorithm": "kmp", "case": "worst", "size": size,
+             "python_version": version, "time": value}
+            for size, version, value in (
+                (1024, "CPython 3.11", 1.0), (1024, "CPython 3.13", 0.5),
+                (2048, "CPython 3.11", 4.0), (2048, "CPython 3.13", 0.5),
+                (2048, "PyPy 3.10", 0.1)
+            )
+        ]
+        table = interpreters.speedup_table(records, "CPython 3.11")
+        row = table[("kmp", "worst")]
+        self.assertAlmostEqual(row["CPython 3.11"], 1.0)
+        self.assertAlmostEqual(row["CPython 3.13"], 4.0)  # √(2 * 8)
+        self.assertAlmostEqual(row["PyPy 3.10"], 40.0)
+        text = interpreters.format_table(
+            table, ["CPython 3.11", "CPython 3.13", "CPython 3.14"]
+        )
+        self.assertIn("4.00x", text)
+        self.assertIn("—", text)
+
+    def test_worker_under_current_interpreter(self):
+        found = interpreters.discover_interpreters(["no-such-python"])
+        current = interpreters.probe(sys.executable)
+        self.assertEqual(
+            [info["executable"] for info in found], [current["executable"]]
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            store = ResultsStore(os.path.join(tmp, "r.jsonl"))
+            cells = [("kmp", "random", 1024), ("naive", "worst", 2048)]
+            written = interpreters.run_interpreter(
+                current, cells, store, runs=3, cell_budget=1.0
+            )
+            self.assertEqual(written, 2)
+            self.assertEqual(
+                interpreters.missing_cells(store, current, cells), []
+            )
+            record = store.records[0]
+            self.assertEqual(
+                record["python_version"], current["python_version"]
+            )
+            self.assertEqual(record["n_runs"], 3)
+            self.assertGreater(record["time"], 0)
+
+
+class _EntryPoint:
+    def __init__(self, name, loaded):
+        self.name = name
+        self.value = f"plugin:{name}"
+        self._loaded = loaded
+
+    def load(self):
+        if isinstance(self._loaded, Exception):
+            raise self._loaded
+        return self._loaded
+
+
+class TestRegistry(unittest.TestCase):
+    def test_reference_engines_agree_with_builtins(self):
+        rng = random.Random(7)
+        for name, engine in engines(multi_pattern=False).items():
+            with self.subTest(name):
+                for _ in range(200):
+                    text = "".join(rng.choices("aAbB", k=rng.randint(0, 25)))
+                    pattern = "".join(rng.choices("ab", k=rng.randint(1, 3)))
+                    start = rng.randint(-5, 30)
+                    end = rng.choice([None, rng.randint(-5, 30)])
+                    # У rabin_karp перед границами идут d и q
+                    bounds = {"start": start, "end": end}
+                    if engine.str_input:
+                        folded = text.lower()
+                        self.assertEqual(
+                            engine.search(
+                                text, pattern, **bounds, table=ASCII_CASE_FOLD
+                            ),
+                            folded.find(pattern, start, end)
+                        )
+                        self.assertEqual(
+                            engine.rsearch(
+                                text, pattern, **bounds, table=ASCII_CASE_FOLD
+                            ),
+                            folded.rfind(pattern, start, end)
+                        )
+                    data, needle = engine.adapt(text, pattern)
+                    self.assertEqual(
+                        engine.search(data, needle, **bounds),
+                        text.find(pattern, start, end)
+                    )
+                    self.assertEqual(
+                        engine.rsearch(data, needle, **bounds),
+                        text.rfind(pattern, start, end)
+                    )
+
+    def test_bytes_find_on_mmap(self):
+        data = b"xxabcabdabd"
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.bin")
+            with open(path, "wb") as f:
+                f.write(data)
+            with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as buffer:
+                for pattern in (b"abd", b"ab", b"", b"zz"):
+                    for start, end in ((0, None), (3, None), (-4, None),
+                                       (2, 9), (0, -3), (12, None),
+                                       (11, None), (6, 2)):
+                        with self.subTest(
+                            pattern=pattern, start=start, end=end
+                        ):
+                            self.assertEqual(
+                                bytes_find_search(buffer, pattern, start, end),
+                                data.find(pattern, start, end)
+                            )
+                            self.assertEqual(
+                                bytes_find_rsearch(
+                                    buffer, pattern, start, end
+                                ),
+                                data.rfind(pattern, start, end)
+                            )
+
+    def test_bytes_input_engines_on_mmap(self):
+        data = b"xxabcabdabd" * 4 + b"needle"
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "data.bin")
+            with open(path, "wb") as f:
+                f.write(data)
+            with open(path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as buffer:
+                for name, engine in engines(
+                    bytes_input=True, multi_pattern=False
+                ).items():
+                    for pattern in (b"abd", b"needle", b"zz"):
+                        with self.subTest(name, pattern=pattern):
+                            self.assertEqual(
+                                engine.search(buffer, pattern, start=3),
+                                data.find(pattern, 3)
+                            )
+                            self.assertEqual(
+                                engine.rsearch(buffer, pattern, end=-2),
+                                data.rfind(pattern, 0, -2)
+                            )
+
+    def test_declared_capabilities(self):
+        text, pattern = b"xxabcabdabd", b"abd"
+        for name, engine in engines(multi_pattern=False).items():
+            with self.subTest(name):
+                preprocess, scan = engine.phases
+                if engine.bytes_input:
+                    self.assertEqual(
+                        scan(text, pattern, preprocess(pattern), 6), 8
+                    )
+                else:
+                    with self.assertRaises((TypeError, ValueError)):
+                        engine.search(text, pattern)
+        for name, engine in engines(multi_pattern=True).items():
+            with self.subTest(name):
+                self.assertTrue(engine.all_matches)
+                self.assertFalse(engine.streaming)
+                hits = [(0, 2), (1, 3), (0, 5)]
+                self.assertEqual(
+                    engine.search("xxabcabc", ["abc", "bca"]), hits
+                )
+                if engine.bytes_input:
+                    self.assertEqual(
+                        engine.search(b"xxabcabc", [b"abc", b"bca"]), hits
+                    )
+        self.assertEqual(
+            sorted(engines(reference=True)), ["bytes_find", "re", "str_find"]
+        )
+        with self.assertRaises(ValueError):
+            engines(fast=True)
+        with self.assertRaises(ValueError):
+            Engine("broken", len, streaming=True)
+
+    def test_entry_point_plugins(self):
+        plugin = Engine(
+            "plugin_find", str.find, phases=(len, len), streaming=True
+        )
+        points = [
+            _EntryPoint("plugin_find", plugin),
+            _EntryPoint("factory", lambda: [Engine("plugin_re", len)]),
+            _EntryPoint("broken", ImportError("нет модуля")),
+            _EntryPoint("not_engine", lambda: ["kmp"]),
+            _EntryPoint("duplicate", Engine("kmp", len))
+        ]
+
+        class Found(list):
+            def select(self, group):
+                return self if group == registry.ENTRY_POINT_GROUP else []
+
+        try:
+            with patch.object(registry.metadata, "entry_points",
+                              return_value=Found(points)), \
+                    self.assertWarns(UserWarning) as caught:
+                names = registry.load_entry_points()
+            self.assertEqual(names, ["plugin_find", "plugin_re"])
+            self.assertEqual(len(caught.warnings), 3)
+            self.assertIs(get_engine("plugin_find"), plugin)
+            self.assertIn("plugin_find", engines(streaming=True))
+            self.assertIsNot(get_engine("kmp").search, len)
+        finally:
+            registry.ENGINES.pop("plugin_find", None)
+            registry.ENGINES.pop("plugin_re", None)
+        with self.assertRaises(ValueError):
+            get_engine("plugin_find")
+
+    def test_benchmark_cli_and_baseline_gap(self):
+        from benchmark.benchmark import algorithms, parse_args, run_cell
+        self.assertEqual(
+            sorted(algorithms), sorted(PHASES)
+        )
+        with patch.object(sys, "argv", [
+            "benchmark", "-a", "apostolico_crochemore", "--baseline", "re"
+        ]):
+            args = parse_args()
+        self.assertEqual(args.algorithm, "apostolico_crochemore")
+        self.assertEqual(args.baseline, "re")
+
+        text, pattern = "AB" * 512 + "C", "ABC"
+        result = run_cell("kmp", "worst", text, pattern, {"n_runs": 6})
+        self.assertEqual(result["baseline"], "str_find")
+        self.assertAlmostEqual(
+            result["baseline_ratio"], result["time"] / result["baseline_time"]
+        )
+        self.assertEqual(
+            measure_baseline("bytes_find", text, pattern, runs=3)["baseline"],
+            "bytes_find"
+        )
+
+        records = [
+            {"algorithm": "kmp", "case": "worst", "size": 1024,
+             "baseline_ratio": 2.0},
+            {"algorithm": "kmp", "case": "worst", "size": 2048,
+             "baseline_ratio": 8.0},
+            {"algorithm": "kmp", "case": "best", "size": 1024}
+        ]
+        table = gap_table(records)
+        self.assertEqual(list(table), [("kmp", "worst")])
+        self.assertAlmostEqual(table[("kmp", "worst")], 4.0)
+        self.assertIn("4.0x", format_gap(table, "str_find"))
+
+
+class TestQGramIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.documents = index_bench.make_collection(2000, 30, seed=3)
+        # Малый алфавит: списки длинные и пересечения непусты
+        rng = random.Random(3)
+        cls.documents += [
+            "".join(rng.choices("ab", k=rng.randint(0, 12)))
+            for _ in range(500)
+        ]
+
+    def test_postings_round_trip_with_narrow_types(self):
+        for ids, code in (
+            ([0, 3, 255, 300], "B"), ([7, 70000], "I"), ([5], "B"),
+            ([1, 2**40], "Q")
+        ):
+            with self.subTest(ids=ids):
+                encoded_code, data = encode_postings(ids)
+                self.assertEqual(encoded_code, code)
+                self.assertEqual(decode_postings(code, data), ids)
+
+    def test_search_matches_full_scan(self):
+        index = QGramIndex.build(self.documents, q=3)
+        rng = random.Random(5)
+        patterns = ["", "a", "ab", "abab", "zzzz", "abba" * 3] + [
+            document[pos:pos + 6]
+            for document in rng.sample(self.documents[:2000], 20)
+            for pos in [rng.randint(0, max(len(document) - 6, 0))]
+        ]
+        for pattern in patterns:
+            with self.subTest(pattern=pattern):
+                expected = scan_all(self.documents, pattern)
+                found = index.search(self.documents, pattern, "kmp")
+                self.assertEqual(found, expected)
+                self.assertLessEqual(
+                    {doc_id for doc_id, _ in expected},
+                    set(index.candidates(pattern))
+                )
+        self.assertEqual(
+            len(index.candidates("ab")), len(self.documents)
+        )
+
+    def test_save_and_load_via_mmap(self):
+        index = QGramIndex.build(self.documents, q=2)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "index.qgram")
+            size = index.save(path)
+            self.assertGreater(size, index.nbytes)
+            with QGramIndex.load(path) as loaded:
+                self.assertEqual(loaded.q, 2)
+                self.assertEqual(loaded.n_documents, len(self.documents))
+                for gram in ("ab", "ba", "zz", "qq"):
+                    self.assertEqual(
+                        loaded.postings(gram), index.postings(gram)
+                    )
+                self.assertEqual(
+                    loaded.search(self.documents, "abab", "str_find"),
+                    scan_all(self.documents, "abab")
+                )
+            broken = os.path.join(tmp, "broken")
+            with open(broken, "wb") as f:
+                f.write(b"not an index")
+            with self.assertRaises(ValueError):
+                QGramIndex.load(broken)
+        with self.assertRaises(ValueError):
+            QGramIndex.build(self.documents, q=0)
+
+    def test_benchmark_cell(self):
+        row = index_bench.measure_cell(
+            500, 40, pattern_lengths=(4, 8), queries=4, budget=1.0
+        )
+        self.assertGreater(row["file_bytes"], row["postings_bytes"])
+        for length in (4, 8):
+            self.assertGreater(row[f"scan_{length}"], 0)
+            self.assertFalse(row[f"scan_{length}_estimated"])
+            self.assertGreaterEqual(row[f"query_{length}"], 0)
+
+
+class TestInterleavedMeasurement(unittest.TestCase):
+    def test_rounds_are_shuffled_and_counts_respected(self):
+        calls_order = []
+        calls = {
+            name: (calls_order.append, (name,)) for name in "abcd"
+        }
+        runs = {"a": 3, "b": 5, "c": 5, "d": 0}
+        samples = measure_interleaved(calls, runs, seed=1)
+        for name, count in runs.items():
+            self.assertEqual(len(samples[name]["time"]), count)
+            self.assertEqual(len(samples[name]["load"]), count)
+            self.assertEqual(len(samples[name]["cpu_mhz"]), count)
+        rounds = [calls_order[i:i + 3] for i in range(0, 9, 3)]
+        for round_ in rounds:
+            # Каждый раунд — по одному запуску каждого активного вызова
+            self.assertEqual(sorted(round_), ["a", "b", "c"])
+        self.assertGreater(len({tuple(round_) for round_ in rounds}), 1)
+        # a выбывает после трёх раундов
+        self.assertEqual(sorted(calls_order[9:]), ["b", "b", "c", "c"])
+
+    def test_stability_flags(self):
+        with patch("os.cpu_count", return_value=4):
+            busy = stability([0.5, 5.5], [2000.0, 2400.0, 2000.0])
+            quiet = stability([1.2, 2.5], [2000.0, 2010.0])
+            unknown = stability([None], [None])
+        self.assertTrue(busy["unstable"])
+        self.assertEqual(busy["unstable_reason"], "load,frequency")
+        self.assertAlmostEqual(busy["cpu_mhz_spread"], 0.2)
+        self.assertFalse(quiet["unstable"])
+        self.assertEqual(quiet["load_max"], 2.5)
+        self.assertEqual(
+            unknown, {"unstable": False, "unstable_reason": ""}
+        )
+
+    def test_group_and_cells(self):
+        from benchmark.benchmark import measure_group, run_cell
+        text, pattern = "AB" * 512, "ABB"
+        cells = [("kmp", "random", 1024), ("naive", "random", 1024)]
+        inputs = {cell: (text, pattern) for cell in cells}
+        timings = measure_group(cells, inputs, {"n_runs": 6})
+        for cell in cells:
+            timing = timings[cell]
+            self.assertEqual(len(timing["time"]), 6)
+            self.assertIn("unstable", timing)
+            self.assertGreater(timing["seconds"], 0)
+            result = run_cell(
+                *cell[:2], text, pattern, {"n_runs": 6}, timing
+            )
+            self.assertEqual(result["order"], "interleaved")
+            self.assertEqual(result["n_runs"], 6)
+            self.assertEqual(result["time_samples"], timing["time"])
+            self.assertEqual(len(result["load_samples"]), 6)
+            self.assertGreaterEqual(
+                result["cell_seconds"], timing["seconds"]
+            )
+
+    def test_interleaved_requires_fixed_sequential_run(self):
+        from benchmark.benchmark import parse_args
+        for argv in (["--order", "interleaved", "-j", "2"],
+                     ["--order", "interleaved", "--sampling", "sequential"]):
+            with self.subTest(argv=argv), \
+                    patch.object(sys, "argv", ["benchmark", *argv]), \
+                    patch("sys.stderr", io.StringIO()), \
+                    self.assertRaises(SystemExit):
+                parse_args()
+
+
+class TestRankEncoding(unittest.TestCase):
+    def test_round_trip_and_buffer_types(self):
+        cases = (
+            ("ab\xff", "B"), ("абвгд", "B"), ("a\U0001F600\x00", "B"),
+            ("".join(map(chr, range(0x4E00, 0x4E00 + 300))), "H"),
+            ("".join(map(chr, range(0x10000, 0x10000 + 70000))), "I")
+        )
+        for symbols, code in cases:
+            with self.subTest(code=code, first=symbols[0]):
+                alphabet = RankAlphabet(symbols)
+                self.assertEqual(alphabet.typecode, code)
+                text = symbols[::-1] + symbols[:3]
+                buffer = alphabet.encode(text)
+                self.assertEqual(len(buffer), len(text))
+                width = {"B": 1, "H": 2, "I": 4}[code]
+                self.assertEqual(buffer_nbytes(buffer), len(text) * width)
+                self.assertEqual(
+                    buffer[-1], alphabet.ranks[symbols[2]]
+                )
+                self.assertEqual(alphabet.decode(buffer), text)
+                with self.assertRaises(ValueError):
+                    alphabet.encode(text + "?")
+
+    def test_find_matches_str_find(self):
+        rng = random.Random(7)
+        for symbols in ("ab", "аб\U0001F600"):
+            for _ in range(100):
+                text = "".join(rng.choices(symbols, k=rng.randint(0, 40)))
+                pattern = "".join(
+                    rng.choices(symbols, k=rng.randint(1, 4))
+                )
+                start = rng.randint(-5, 45)
+                end = rng.choice([None, rng.randint(-5, 45)])
+                ranked = RankedText(text)
+                for name in ("boyer_moore", "kmp_dfa", "kmp", "intro"):
+                    with self.subTest(name, text=text, pattern=pattern):
+                        self.assertEqual(
+                            ranked.find(pattern, name, start, end),
+                            text.find(pattern, start, end)
+                        )
+        ranked = RankedText("абвабв")
+        self.assertEqual(ranked.find("вг"), -1)
+        for name in ("rabin_karp", "commentz_walter", "wu_manber"):
+            with self.subTest(name):
+                with self.assertRaisesRegex(ValueError, "буфером номеров"):
+                    ranked.find("аб", name)
+
+    def test_dfa_falls_back_to_lps_for_large_alphabet(self):
+        symbols = "".join(map(chr, range(0x4E00, 0x4E00 + 3000)))
+        text = symbols * 3
+        pattern = symbols[-2:] + symbols[:100]
+        ranked = RankedText(text)
+        self.assertEqual(ranked.alphabet.typecode, "H")
+        self.assertEqual(
+            ranked.find(pattern, "kmp_dfa"), text.find(pattern)
+        )
+
+    def test_benchmark_cell(self):
+        row = rank_bench.measure_cell("kmp_dfa", "worst", 2048, "astral", 1)
+        self.assertEqual(row["buffer_bytes"], 2048)
+        self.assertGreater(row["str_bytes"], 4 * 2048)
+        self.assertGreater(row["ranked_time"], 0)
+
+
 if __name__ == '__main__':
     unittest.main()
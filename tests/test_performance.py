@@ -0,0 +1,205 @@
+"""
+Тесты производительности: показатель роста и бюджеты.
+
+Каждый алгоритм запускается на удваивающихся размерах текста в
+инструментированной версии (src/instrumented.py), и по числу
+элементарных операций оценивается показатель b в ops ≈ a * n^b
+(power_fit_curve). Счётчики детерминированы, поэтому проверка не
+зависит от фоновой нагрузки; для алгоритмов с линейным худшим случаем
+число операций дополнительно ограничено бюджетом OPS_BUDGET * (n + m).
+Время исходного алгоритма на наибольшем размере выражается в единицах
+калибровочного цикла (проход Python по строке с индексированием),
+поэтому бюджет на символ текста не зависит от скорости машины.
+"""
+import time
+import random
+import unittest
+
+import numpy as np
+
+from analysis.power_fit import power_fit_curve
+from src.algorithms import (
+    naive_search, kmp_search, kmp_dfa_search, boyer_moore_search,
+    rabin_karp_search, rabin_karp_preprocess, apostolico_crochemore_search,
+    aho_corasick_search, intro_search
+)
+from src.data_generator import TestDataGenerator
+from src.instrumented import INSTRUMENTED
+
+SEARCHES = {
+    "naive": naive_search,
+    "kmp": kmp_search,
+    "kmp_dfa": kmp_dfa_search,
+    "boyer_moore": boyer_moore_search,
+    "rabin_karp": rabin_karp_search,
+    "apostolico_crochemore": apostolico_crochemore_search,
+    "aho_corasick": aho_corasick_search,
+    "intro": intro_search
+}
+
+# Алгоритмы с линейным по n + m худшим случаем
+LINEAR = ("kmp", "kmp_dfa", "aho_corasick", "intro")
+
+SIZES = [2**i for i in range(13, 17)]
+RUNS = 5
+# Предел показателя роста числа операций (квадратичный даёт ~2)
+LINEAR_EXPONENT = 1.3
+# Операции, из которых складывается работа алгоритма
+OPERATIONS = ("comparisons", "shifts", "preprocess_steps", "failure_links")
+# Бюджет операций на символ текста и паттерна для линейных алгоритмов
+# (измерено не больше 3.6)
+OPS_BUDGET = 5.0
+# Бюджет времени на символ текста в единицах калибровочного цикла
+# (с запасом в несколько раз над измеренным)
+BUDGET = 25.0
+# naive и apostolico_crochemore на худшем случае генератора сравнивают
+# порядка m = 1000 символов на позицию: инструментированный проход на
+# SIZES занял бы десятки секунд, поэтому размеры меньше (но заметно
+# больше m) и меньше запусков
+SLOW = ("naive", "apostolico_crochemore")
+SLOW_SIZES = [2**i for i in range(12, 15)]
+SLOW_RUNS = 2
+SLOW_BUDGET = {"apostolico_crochemore": 5000.0}
+
+
+def best_time(func, *args, runs: int = RUNS) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def calibration_unit(n: int = 100000) -> float:
+    """Время одного шага калибровочного цикла, с."""
+    text = "AB" * (n // 2)
+
+    def loop():
+        count = 0
+        for i in range(n):
+            if text[i] == "A":
+                count += 1
+        return count
+
+    return best_time(loop) / n
+
+
+def operations(name: str, text: str, pattern: str) -> int:
+    """Число элементарных операций инструментированной версии."""
+    _, counters = INSTRUMENTED[name](text, pattern)
+    return sum(counters.get(key, 0) for key in OPERATIONS)
+
+
+def growth(ops: list, sizes: list) -> float:
+    """Показатель роста числа операций по размеру текста."""
+    (_, b), _ = power_fit_curve(
+        np.array(sizes, dtype=float), np.array(ops, dtype=float)
+    )
+    return b
+
+
+def colliding_pattern(m: int) -> str:
+    """Паттерн длины m с тем же хешем Рабина-Карпа, что у 'A' * m.
+
+    Отличие от 'A' * m — в первых символах, поэтому на тексте из 'A'
+    каждое окно даёт ложное срабатывание хеша, а проверка окна
+    завершается на первом сравнении.
+    """
+    target, _ = rabin_karp_preprocess("A" * m)
+    for first in range(ord("B"), ord("Z") + 1):
+        for second in range(ord("A"), ord("Z") + 1):
+            pattern = chr(first) + chr(second) + "A" * (m - 2)
+            if rabin_karp_preprocess(pattern)[0] == target:
+                return pattern
+    raise AssertionError("Паттерн с коллизией не найден")
+
+
+class TestGrowthExponents(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.unit = calibration_unit()
+        cls.generator = TestDataGenerator()
+
+    def check(
+        self, name, make_input, sizes=SIZES, budget=BUDGET, runs=RUNS
+    ):
+        inputs = [make_input(size) for size in sizes]
+        ops = [operations(name, *args) for args in inputs]
+        b = growth(ops, sizes)
+        self.assertLess(b, LINEAR_EXPONENT, f"{name}: ops ~ n^{b:.2f}")
+        if name in LINEAR:
+            for (text, pattern), count in zip(inputs, ops):
+                self.assertLessEqual(
+                    count, OPS_BUDGET * (len(text) + len(pattern)),
+                    f"{name}: {count} операций при n = {len(text)}, "
+                    f"m = {len(pattern)}"
+                )
+        last = best_time(SEARCHES[name], *inputs[-1], runs=runs)
+        per_char = last / sizes[-1] / self.unit
+        self.assertLess(
+            per_char, budget,
+            f"{name}: {per_char:.1f} калибровочных шагов на символ"
+        )
+
+    def test_generated_worst_cases(self):
+        for name in SEARCHES:
+            with self.subTest(name):
+                make_input = (
+                    lambda n: self.generator.generate_case(name, "worst", n)
+                )
+                if name in SLOW:
+                    self.check(
+                        name, make_input, SLOW_SIZES,
+                        SLOW_BUDGET.get(name, BUDGET), SLOW_RUNS
+                    )
+                else:
+                    self.check(name, make_input)
+
+    def test_random_text(self):
+        def make_input(n):
+            rng = random.Random(n)
+            text = "".join(rng.choices("ABC", k=n))
+            # Символа D в тексте нет: проход до конца
+            return text, "".join(rng.choices("ABC", k=15)) + "D"
+
+        for name in SEARCHES:
+            with self.subTest(name):
+                self.check(name, make_input)
+
+    def test_linear_engines_with_long_periodic_patterns(self):
+        # m растёт вместе с n: проход порядка n * m дал бы n^2
+        patterns = {
+            "suffix": lambda m: "A" * (m - 1) + "B",
+            "prefix": lambda m: "B" + "A" * (m - 1)
+        }
+        for name in LINEAR:
+            for kind, make_pattern in patterns.items():
+                with self.subTest(name, pattern=kind):
+                    self.check(
+                        name, lambda n: ("A" * n, make_pattern(n // 8))
+                    )
+
+    def test_rabin_karp_collision_heavy_input(self):
+        # m растёт вместе с n и хеш совпадает в каждом окне: проверка
+        # окна, не останавливающаяся на первом несовпадении, дала бы
+        # порядка n * m операций
+        def make_input(n):
+            return "A" * n, colliding_pattern(n // 8)
+
+        for n in SIZES:
+            text, pattern = make_input(n)
+            index, counters = INSTRUMENTED["rabin_karp"](text, pattern)
+            self.assertEqual(index, -1)
+            self.assertEqual(
+                counters["spurious_hits"], len(text) - len(pattern) + 1
+            )
+            self.assertLessEqual(
+                operations("rabin_karp", text, pattern),
+                OPS_BUDGET * (len(text) + len(pattern))
+            )
+        self.check("rabin_karp", make_input)
+
+
+if __name__ == "__main__":
+    unittest.main()
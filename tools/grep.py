@@ -0,0 +1,264 @@
+"""
+Модуль grep.py: Параллельный поиск паттерна по дереву каталогов.
+
+Файлы читаются блоками (mmap или обычное чтение) в пуле потоков,
+а блоки просматриваются выбранным алгоритмом в пуле процессов, так что
+чтение следующих блоков идёт одновременно с поиском в предыдущих.
+Соседние блоки перекрываются на m - 1 байт, и каждое вхождение
+сообщается тем блоком, в котором оно начинается. Результаты выводятся
+в порядке файлов и смещений по мере готовности: «путь:смещение».
+Сводка (файлов/с, МБ/с) печатается в stderr.
+
+Байты декодируются как latin-1 (байт — символ), поэтому смещения
+совпадают с байтовыми, а паттерн сравнивается побайтно в UTF-8.
+
+Пример:
+    python -m tools.grep -a boyer_moore -j 4 "ERROR 500" /var/log/app
+"""
+import os
+import sys
+import mmap
+import time
+import fnmatch
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from src.algorithms import ASCII_CASE_FOLD, PHASES
+
+# Блок: (путь, смещение блока, собственная длина, длина чтения)
+Block = Tuple[str, int, int, int]
+
+DEFAULT_BLOCK_SIZE = 8 << 20
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Ищет паттерн во всех файлах дерева каталогов."
+    )
+    parser.add_argument("pattern", help="Искомая строка")
+    parser.add_argument(
+        "paths", nargs="+", help="Файлы и каталоги для поиска"
+    )
+    parser.add_argument(
+        "-a", "--algorithm",
+        choices=sorted(PHASES),
+        default="boyer_moore",
+        help="Алгоритм поиска (по умолчанию: boyer_moore)"
+    )
+    parser.add_argument(
+        "-i", "--ignore-case",
+        action="store_true",
+        help="Без учёта регистра ASCII"
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        default=None,
+        help="Шаблон имени файла (fnmatch), можно несколько"
+    )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Процессов поиска (по умолчанию: число CPU)"
+    )
+    parser.add_argument(
+        "--io-threads",
+        type=int,
+        default=4,
+        help="Потоков чтения (по умолчанию: 4)"
+    )
+    parser.add_argument(
+        "--block-size",
+        type=int,
+        default=DEFAULT_BLOCK_SIZE,
+        help="Размер блока чтения в байтах (по умолчанию: 8 МБ)"
+    )
+    parser.add_argument(
+        "--no-mmap",
+        action="store_true",
+        help="Читать файлы обычным чтением вместо mmap"
+    )
+    args = parser.parse_args(argv)
+    if not args.pattern:
+        parser.error("Паттерн не должен быть пустым")
+    return args
+
+
+def iter_files(
+    paths: Iterable[str], include: Optional[List[str]] = None
+) -> Iterator[str]:
+    """Файлы из paths и их подкаталогов в порядке имён."""
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if include and not any(
+                        fnmatch.fnmatch(name, mask) for mask in include
+                    ):
+                        continue
+                    yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def iter_blocks(
+    files: Iterable[str], block_size: int, overlap: int
+) -> Iterator[Block]:
+    for path in files:
+        try:
+            size = os.path.getsize(path)
+        except OSError as e:
+            print(f"grep: {path}: {e}", file=sys.stderr)
+            continue
+        # Пустой файл — один пустой блок, чтобы он попал в сводку
+        for base in range(0, max(size, 1), block_size):
+            own = min(block_size, size - base)
+            yield path, base, own, min(own + overlap, size - base)
+
+
+def read_block(block: Block, use_mmap: bool = True) -> bytes:
+    path, base, _, length = block
+    if length == 0:
+        return b""
+    with open(path, "rb") as f:
+        if use_mmap:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[base:base + length]
+        f.seek(base)
+        return f.read(length)
+
+
+@lru_cache(maxsize=16)
+def _compiled(algorithm: str, pattern: str):
+    preprocess, _ = PHASES[algorithm]
+    return preprocess(pattern)
+
+
+def scan_block(
+    algorithm: str,
+    pattern: str,
+    data: bytes,
+    own: int,
+    ignore_case: bool = False
+) -> List[int]:
+    """Смещения всех вхождений, начинающихся в первых own байтах data."""
+    text = data.decode("latin-1")
+    if ignore_case:
+        # Блок ограничен по размеру, поэтому свёртка копирует не больше него
+        text = text.translate(ASCII_CASE_FOLD)
+        pattern = pattern.translate(ASCII_CASE_FOLD)
+    _, scan = PHASES[algorithm]
+    tables = _compiled(algorithm, pattern)
+    offsets = []
+    pos = scan(text, pattern, tables, start=0)
+    while pos != -1 and pos < own:
+        offsets.append(pos)
+        pos = scan(text, pattern, tables, start=pos + 1)
+    return offsets
+
+
+def grep(
+    paths: List[str],
+    pattern: str,
+    algorithm: str = "boyer_moore",
+    ignore_case: bool = False,
+    include: Optional[List[str]] = None,
+    jobs: Optional[int] = None,
+    io_threads: int = 4,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    use_mmap: bool = True,
+    out: TextIO = sys.stdout
+) -> dict:
+    """Пишет «путь:смещение» для каждого вхождения в out и возвращает
+    сводку: файлы, байты, вхождения, время, файлов/с, МБ/с."""
+    needle = pattern.encode("utf-8").decode("latin-1")
+    overlap = len(needle) - 1
+    jobs = jobs or os.cpu_count() or 1
+    # Окно блоков в работе: чтение опережает поиск, память ограничена
+    window = 4 * jobs + io_threads
+    summary = {"files": 0, "bytes": 0, "matches": 0}
+    seen_files = set()
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(io_threads) as readers, \
+            ProcessPoolExecutor(jobs) as scanners:
+        pending = deque()
+
+        def submit_ready_scans():
+            for entry in pending:
+                if entry[2] is None and entry[1].done():
+                    submit_scan(entry)
+
+        def submit_scan(entry):
+            block, read = entry[0], entry[1]
+            try:
+                data = read.result()
+            except OSError as e:
+                print(f"grep: {block[0]}: {e}", file=sys.stderr)
+                data = b""
+            summary["bytes"] += min(len(data), block[2])
+            entry[2] = scanners.submit(
+                scan_block, algorithm, needle, data, block[2], ignore_case
+            )
+
+        def emit_head():
+            block, _, scan = pending.popleft()
+            for offset in scan.result():
+                out.write(f"{block[0]}:{block[1] + offset}\n")
+                summary["matches"] += 1
+
+        def drain(limit):
+            while pending:
+                submit_ready_scans()
+                head = pending[0]
+                if len(pending) <= limit and not (
+                    head[2] is not None and head[2].done()
+                ):
+                    return
+                if head[2] is None:
+                    submit_scan(head)
+                emit_head()
+
+        for block in iter_blocks(
+            iter_files(paths, include), block_size, overlap
+        ):
+            if block[0] not in seen_files:
+                seen_files.add(block[0])
+                summary["files"] += 1
+            pending.append(
+                [block, readers.submit(read_block, block, use_mmap), None]
+            )
+            drain(window)
+        drain(0)
+
+    elapsed = time.perf_counter() - started
+    summary["elapsed"] = elapsed
+    summary["files_per_s"] = summary["files"] / elapsed if elapsed else 0.0
+    summary["mb_per_s"] = (
+        summary["bytes"] / elapsed / 1e6 if elapsed else 0.0
+    )
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    summary = grep(
+        args.paths, args.pattern, args.algorithm, args.ignore_case,
+        args.include, args.jobs, args.io_threads, args.block_size,
+        not args.no_mmap
+    )
+    print(f"Файлов: {summary['files']}, "
+          f"{summary['bytes'] / 1e6:.1f} МБ, "
+          f"вхождений: {summary['matches']}, "
+          f"время: {summary['elapsed']:.2f} с, "
+          f"{summary['files_per_s']:.0f} файлов/с, "
+          f"{summary['mb_per_s']:.1f} МБ/с", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()